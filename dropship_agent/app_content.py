@@ -0,0 +1,31 @@
+# Static sidebar content for the Streamlit app, built once per process instead of on every rerun
+
+QUICK_ACTIONS = (
+    {"label": "🔥 Find Hot Products", "prompt": "Find me the most trending dropshipping products with highest profit margins"},
+    {"label": "📊 Analyze Market", "prompt": "Do a deep market analysis for wireless earbuds including competition and opportunities"},
+    {"label": "🏭 Find Suppliers", "prompt": "Find the best suppliers for LED strip lights and calculate profits for $25 selling price"},
+    {"label": "📢 Marketing Strategy", "prompt": "Create a complete marketing strategy for phone accessories with $1000 budget"},
+    {"label": "✍️ Product Copy", "prompt": "Write high-converting product description for wireless charging pad targeting tech enthusiasts"},
+    {"label": "📅 Seasonal Trends", "prompt": "What are the best seasonal dropshipping opportunities right now?"},
+)
+
+AI_FEATURES = (
+    "🔍 Smart Product Research",
+    "📊 Market Intelligence",
+    "🏭 Supplier Optimization",
+    "📢 Marketing Automation",
+    "✍️ Copy Generation",
+    "📅 Trend Forecasting",
+)
+
+# Pre-rendered feature cards, joined once
+FEATURE_CARDS_HTML = "".join(
+    f'<div class="feature-card" style="padding: 0.8rem; margin-bottom: 0.5rem;">{feature}</div>' for feature in AI_FEATURES
+)
+
+# The status panel's shortcut buttons: (label, prompt)
+SHORTCUTS = (
+    ("💰 Calculate Profits", "Help me calculate profits for my dropshipping products"),
+    ("📈 Find Products", "Find trending dropshipping products with high profit potential"),
+    ("🎯 Market Analysis", "Analyze the market for dropshipping opportunities"),
+)
@@ -0,0 +1,146 @@
+"""Headless batch runner: research prompts through the Master Dropshipping AI, concurrently.
+
+Run from dropship_agent/:
+    python batch.py prompts.txt --out results.jsonl --concurrency 8
+
+The prompts file has one prompt per line, or is a .jsonl file of {"id", "prompt"}
+objects. Results are appended to --out as each prompt finishes; running the same
+command again skips prompts that already succeeded, so an interrupted batch resumes.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+
+from agents import Runner
+
+import environment  # noqa: F401  (loads .env before master_agent reads GEMINI_BASE_URL)
+from master_agent import get_shared_agent
+from output import response_text
+from runtime import get_runtime
+from speculation import get_speculator
+from telemetry import TurnTelemetry, current_turn, percentile
+
+
+def load_prompts(path):
+    """[(id, prompt)] from a text file (ids are line numbers) or a JSONL file"""
+    prompts = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            if path.endswith(".jsonl"):
+                item = json.loads(line)
+                prompts.append((str(item.get("id", line_number)), item["prompt"]))
+            else:
+                prompts.append((str(line_number), line))
+    return prompts
+
+
+def completed_ids(path):
+    """Ids already answered successfully in an existing results file"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line cut short by an interruption, that prompt runs again
+                continue
+            if record.get("status") == "ok":
+                done.add(record["id"])
+    return done
+
+
+async def run_prompt(shared, prompt_id, prompt):
+    telemetry = TurnTelemetry()
+    current_turn.set(telemetry)
+    speculation = get_speculator().start(shared.agent, prompt)
+    try:
+        run_result = await Runner.run(shared.agent, prompt, run_config=shared.config, hooks=telemetry)
+    except Exception as e:
+        turn = telemetry.finish()
+        return {"id": prompt_id, "prompt": prompt, "status": "error", "error": str(e), "latency": turn["wall"]}
+    finally:
+        speculation.close()
+    turn = telemetry.finish(run_result)
+    return {
+        "id": prompt_id,
+        "prompt": prompt,
+        "status": "ok",
+        "response": response_text(run_result),
+        "latency": turn["wall"],
+        "tool_calls": turn["tool_calls"],
+        "input_tokens": turn["input_tokens"],
+        "output_tokens": turn["output_tokens"],
+    }
+
+
+async def run_batch(shared, prompts, out_path, concurrency):
+    """Run prompts with at most `concurrency` in flight, appending each result as it lands"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(prompt_id, prompt):
+        async with semaphore:
+            return await run_prompt(shared, prompt_id, prompt)
+
+    results = []
+    with open(out_path, "a", encoding="utf-8") as out:
+        for finished in asyncio.as_completed([bounded(prompt_id, prompt) for prompt_id, prompt in prompts]):
+            record = await finished
+            record["finished"] = datetime.now().isoformat()
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            results.append(record)
+            print(f"[{len(results)}/{len(prompts)}] {record['id']} {record['status']} {record['latency']:.2f}s")
+    return results
+
+
+def summarize(results, wall):
+    ok = [r["latency"] for r in results if r["status"] == "ok"]
+    errors = len(results) - len(ok)
+    print(f"\n{len(results)} prompts in {wall:.2f}s ({len(results) / wall if wall else 0.0:.2f} prompts/s), "
+          f"{len(ok)} ok, {errors} failed")
+    if ok:
+        print(f"latency p50 {percentile(ok, 50):.2f}s | p95 {percentile(ok, 95):.2f}s | p99 {percentile(ok, 99):.2f}s")
+    speculation = get_speculator().stats()
+    if speculation["predicted"]:
+        print(f"speculative tool calls: {speculation['hits']}/{speculation['predicted']} used "
+              f"({speculation['hit_rate']:.0%}), {speculation['saved']:.2f}s of tool time saved")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("prompts", help="text file (one prompt per line) or .jsonl with id/prompt")
+    parser.add_argument("--out", default="batch_results.jsonl", help="results JSONL, appended to")
+    parser.add_argument("--concurrency", type=int, default=8, help="prompts in flight at once")
+    args = parser.parse_args()
+
+    prompts = load_prompts(args.prompts)
+    done = completed_ids(args.out)
+    pending = [(prompt_id, prompt) for prompt_id, prompt in prompts if prompt_id not in done]
+    if done:
+        print(f"Resuming: {len(prompts) - len(pending)} of {len(prompts)} prompts already done")
+    if not pending:
+        return
+
+    shared = get_shared_agent()
+    runtime = get_runtime()
+    started = time.perf_counter()
+    future = runtime.submit(run_batch(shared, pending, args.out, max(args.concurrency, 1)))
+    try:
+        results = future.result()
+    except KeyboardInterrupt:
+        future.cancel()
+        print("\nInterrupted, finished results are saved; run again to resume")
+        return
+    summarize(results, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Turn time for a step with several tool calls: sync tools on the event loop vs per-tool bulkheads.
+
+Run from dropship_agent/:  python -m benchmarks.bench_bulkhead --turns 10 --tool-delay 0.05
+
+Each tool sleeps --tool-delay seconds, standing in for a slow lookup. The stub
+model answers 'launch' prompts with three tool calls in one step. A last run
+makes one tool hang past its timeout to show the other calls are not held up.
+"""
+import argparse
+import statistics
+import time
+
+from agents import Agent, AsyncOpenAI, OpenAIChatCompletionsModel, Runner, function_tool
+from agents.run import RunConfig
+
+from bulkhead import ToolBulkheads
+from runtime import get_runtime
+from stub_server import StubModelServer
+from telemetry import TurnTelemetry, current_turn
+
+
+def slow_tools(delay, hang=0.0):
+    @function_tool
+    def get_trending_products(category: str = "all", price_range: str = "0-50") -> str:
+        """Trending products"""
+        time.sleep(delay)
+        return "products"
+
+    @function_tool
+    def analyze_market_competition(product_name: str, niche: str) -> str:
+        """Market competition"""
+        time.sleep(delay + hang)
+        return "competition"
+
+    @function_tool
+    def find_suppliers_and_calculate_profits(product_name: str, target_selling_price: float) -> str:
+        """Suppliers and profits"""
+        time.sleep(delay)
+        return "suppliers"
+
+    return [get_trending_products, analyze_market_competition, find_suppliers_and_calculate_profits]
+
+
+def run_turns(base_url, tools, turns):
+    client = AsyncOpenAI(api_key="stub", base_url=base_url)
+    model = OpenAIChatCompletionsModel(model="gemini-2.0-flash", openai_client=client)
+    config = RunConfig(model=model, model_provider=client, tracing_disabled=True)
+    agent = Agent(name="Master Dropshipping AI", instructions="Answer briefly.", tools=tools)
+
+    async def turn(telemetry):
+        current_turn.set(telemetry)
+        return await Runner.run(agent, "plan my launch", run_config=config, hooks=telemetry)
+
+    records = []
+    for _ in range(turns):
+        telemetry = TurnTelemetry()
+        records.append(telemetry.finish(get_runtime().run(turn(telemetry))))
+    get_runtime().run(client.close())
+    return records
+
+
+def report(label, records):
+    print(f"{label:<22} turn p50 {statistics.median(r['wall'] for r in records) * 1000:7.1f} ms | "
+          f"tool time {statistics.mean(r['tool'] for r in records) * 1000:6.1f} ms | "
+          f"queue wait {statistics.mean(r['tool_queue_wait'] for r in records) * 1000:5.2f} ms | "
+          f"timeouts {sum(r['tool_timeouts'] for r in records)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--tool-delay", type=float, default=0.05, help="seconds each tool call blocks")
+    args = parser.parse_args()
+
+    with StubModelServer() as server:
+        report("on the event loop", run_turns(server.base_url, slow_tools(args.tool_delay), args.turns))
+
+        bulkheads = ToolBulkheads()
+        tools = [bulkheads.wrap(tool) for tool in slow_tools(args.tool_delay)]
+        report("bulkheads", run_turns(server.base_url, tools, args.turns))
+        bulkheads.shutdown()
+
+        # One tool hangs 20x the delay with a timeout of 4x: the turn waits the timeout, not the hang
+        bulkheads = ToolBulkheads()
+        tools = [bulkheads.wrap(tool, timeout=args.tool_delay * 4)
+                 for tool in slow_tools(args.tool_delay, hang=args.tool_delay * 20)]
+        report("bulkheads, one hung", run_turns(server.base_url, tools, args.turns))
+        for name, stats in bulkheads.stats().items():
+            print(f"  {name:<38} runs {stats['calls']:3d} | timeouts {stats['timeouts']:3d} | "
+                  f"run avg {stats['avg_run'] * 1000:6.1f} ms")
+        bulkheads.shutdown()
+    get_runtime().stop()
+
+
+if __name__ == "__main__":
+    main()
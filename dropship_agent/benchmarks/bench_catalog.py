@@ -0,0 +1,70 @@
+"""Load time and query latency of the indexed product catalog at scale.
+
+Run from dropship_agent/:  python -m benchmarks.bench_catalog --skus 50000
+"""
+import argparse
+import csv
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from catalog import ProductCatalog, load_rows
+
+CATEGORIES = ["electronics", "fashion", "home", "beauty", "fitness", "pets", "kitchen", "outdoor"]
+DEMANDS = ["Low", "Medium", "High", "Very High"]
+COMPETITIONS = ["Low", "Medium", "High", "Extreme"]
+
+
+def write_synthetic_catalog(path, skus, seed=7):
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "category", "cost", "sell", "demand", "competition"])
+        for i in range(skus):
+            cost = round(rng.uniform(2, 80), 2)
+            writer.writerow([
+                f"SKU {i}", rng.choice(CATEGORIES), f"${cost}", f"${round(cost * rng.uniform(1.5, 4), 2)}",
+                rng.choice(DEMANDS), rng.choice(COMPETITIONS),
+            ])
+
+
+def time_queries(label, catalog, queries, repeat):
+    timings = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            catalog.query(**query)
+            timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    print(f"{label:<28} p50 {statistics.median(timings):8.1f} us | p99 {timings[int(len(timings) * 0.99) - 1]:8.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skus", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "products.csv")
+        write_synthetic_catalog(path, args.skus)
+        start = time.perf_counter()
+        catalog = ProductCatalog(load_rows(path))
+        print(f"loaded {len(catalog)} SKUs in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rng = random.Random(11)
+    narrow = [{"category": rng.choice(CATEGORIES), "min_price": p, "max_price": p + 5}
+              for p in (rng.uniform(5, 200) for _ in range(50))]
+    wide = [{"category": rng.choice(CATEGORIES + ["all"]), "min_price": 0, "max_price": 150} for _ in range(50)]
+    filtered = [{"category": "all", "min_price": 0, "max_price": 100, "demand": "Very High",
+                 "competition": "Low", "sort_by": "margin"} for _ in range(10)]
+
+    time_queries("narrow price range", catalog, narrow, args.repeat)
+    time_queries("wide price range", catalog, wide, args.repeat)
+    time_queries("demand+competition filter", catalog, filtered, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Per-rerun chat history render cost: full re-format vs windowed + memoized.
+
+Run from dropship_agent/:  python -m benchmarks.bench_chat_view
+"""
+import time
+from datetime import datetime
+
+from chat_view import HISTORY_PAGE_SIZE, ai_bubble, history_window, user_bubble
+
+
+def make_history(size):
+    reply = "🔥 Trending products with margins, suppliers and next steps. " * 20
+    return [
+        {"type": "user" if i % 2 == 0 else "ai", "message": f"question {i}" if i % 2 == 0 else reply,
+         "timestamp": datetime.now()}
+        for i in range(size)
+    ]
+
+
+def full_render(history):
+    """What every rerun used to do: format every message again"""
+    return [user_bubble(c["message"]) if c["type"] == "user" else ai_bubble(c["message"]) for c in history]
+
+
+def main():
+    reruns = 50
+    print(f"{'messages':>9} | {'full re-render':>15} {'bytes':>10} | {'windowed':>10} {'bytes':>8}")
+    for size in (10, 100, 1000, 10000):
+        history = make_history(size)
+        memo = {}
+        history_window(history, HISTORY_PAGE_SIZE, memo)
+
+        start = time.perf_counter()
+        for _ in range(reruns):
+            blocks = full_render(history)
+        full_us = (time.perf_counter() - start) / reruns * 1e6
+
+        start = time.perf_counter()
+        for _ in range(reruns):
+            _, html = history_window(history, HISTORY_PAGE_SIZE, memo)
+        window_us = (time.perf_counter() - start) / reruns * 1e6
+
+        full_bytes = sum(len(b.encode()) for b in blocks)
+        print(f"{size:>9} | {full_us:>12.1f} us {full_bytes:>10} | {window_us:>7.1f} us {len(html.encode()):>8}")
+
+
+if __name__ == "__main__":
+    main()
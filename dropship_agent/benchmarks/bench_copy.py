@@ -0,0 +1,105 @@
+"""Product copy rendering: the old += builder vs str.format_map vs the single f-string.
+
+Run from dropship_agent/:  python -m benchmarks.bench_copy --renders 100000
+
+Every renderer produces the same text; the numbers are microseconds per product.
+The copywriter pipeline renders once per catalog row, so this is its CPU floor.
+"""
+import argparse
+import time
+
+from copy_templates import render_product_copy
+
+PRODUCT = ("Wireless Earbuds Pro", "Noise cancelling, 30h battery", "commuters", 35.0)
+
+FORMAT_TEMPLATE = """✍️ HIGH-CONVERTING PRODUCT COPY
+
+📝 PRODUCT TITLE:
+🔥 {title} - Transform Your {target_audience} Experience!
+
+🎯 MAIN DESCRIPTION:
+✨ Discover the game-changing {product_name} that's taking {target_audience} by storm!
+
+🔥 KEY FEATURES:
+{key_features}
+
+💫 WHY CHOOSE US?
+✅ Premium Quality Materials
+✅ Fast Worldwide Shipping (7-15 days)
+✅ 30-Day Money Back Guarantee
+✅ 24/7 Customer Support
+✅ Trusted by 10,000+ Happy Customers
+
+💰 SPECIAL OFFER: Just ${price} (Limited Time!)
+🚚 FREE SHIPPING on orders over $25
+
+⭐ CUSTOMER REVIEWS:
+"Amazing quality! Exactly as described" - Sarah M. ⭐⭐⭐⭐⭐
+"Fast shipping and great customer service" - Mike R. ⭐⭐⭐⭐⭐
+"Perfect for my needs, highly recommend!" - Lisa K. ⭐⭐⭐⭐⭐
+
+🔥 AD COPY VARIATIONS:
+1. "This {product_name} is going VIRAL! Get yours before it's too late!"
+2. "Why pay more? Get premium {product_name} for just ${price}!"
+3. "10,000+ customers can't be wrong! Try {product_name} risk-free!"
+"""
+
+
+def concat_copy(product_name, key_features, target_audience, price):
+    """generate_product_copy before it used the single f-string"""
+    result = "✍️ HIGH-CONVERTING PRODUCT COPY\n\n"
+    result += f"📝 PRODUCT TITLE:\n🔥 {product_name.upper()} - Transform Your {target_audience} Experience!\n\n"
+    result += "🎯 MAIN DESCRIPTION:\n"
+    result += f"✨ Discover the game-changing {product_name} that's taking {target_audience} by storm!\n\n"
+    result += f"🔥 KEY FEATURES:\n{key_features}\n\n"
+    result += "💫 WHY CHOOSE US?\n"
+    result += "✅ Premium Quality Materials\n"
+    result += "✅ Fast Worldwide Shipping (7-15 days)\n"
+    result += "✅ 30-Day Money Back Guarantee\n"
+    result += "✅ 24/7 Customer Support\n"
+    result += "✅ Trusted by 10,000+ Happy Customers\n\n"
+    result += f"💰 SPECIAL OFFER: Just ${price} (Limited Time!)\n"
+    result += "🚚 FREE SHIPPING on orders over $25\n\n"
+    result += "⭐ CUSTOMER REVIEWS:\n"
+    result += "\"Amazing quality! Exactly as described\" - Sarah M. ⭐⭐⭐⭐⭐\n"
+    result += "\"Fast shipping and great customer service\" - Mike R. ⭐⭐⭐⭐⭐\n"
+    result += "\"Perfect for my needs, highly recommend!\" - Lisa K. ⭐⭐⭐⭐⭐\n\n"
+    result += "🔥 AD COPY VARIATIONS:\n"
+    result += f"1. \"This {product_name} is going VIRAL! Get yours before it's too late!\"\n"
+    result += f"2. \"Why pay more? Get premium {product_name} for just ${price}!\"\n"
+    result += f"3. \"10,000+ customers can't be wrong! Try {product_name} risk-free!\"\n"
+    return result
+
+
+def format_copy(product_name, key_features, target_audience, price):
+    return FORMAT_TEMPLATE.format_map({
+        "title": product_name.upper(), "product_name": product_name, "key_features": key_features,
+        "target_audience": target_audience, "price": price,
+    })
+
+
+def measure(render, renders):
+    start = time.perf_counter()
+    for _ in range(renders):
+        render(*PRODUCT)
+    return (time.perf_counter() - start) / renders * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=100000)
+    args = parser.parse_args()
+
+    expected = render_product_copy(*PRODUCT)
+    renderers = [("concat", concat_copy), ("format", format_copy), ("fstring", render_product_copy)]
+    for label, render in renderers:
+        assert render(*PRODUCT) == expected, f"{label} renders different copy"
+    baseline = None
+    for label, render in renderers:
+        micros = measure(render, args.renders)
+        baseline = baseline or micros
+        print(f"{label:<9} {micros:6.3f} us/product ({baseline / micros:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Market-data lookups at scale: cold (SQLite index probes) vs warm (in-process LRU).
+
+Run from dropship_agent/:  python -m benchmarks.bench_market_data --products 250000 --lookups 2000
+
+Builds a throwaway database of synthetic snapshots: one market profile per
+product plus --competitors competitor prices each, so --products 250000 is
+1.25M rows. Cold lookups clear the LRU first; warm ones repeat the same keys.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from market_data import MarketDataStore, create_database, load_records
+from telemetry import percentile
+
+NICHES = ["electronics", "fashion", "home", "beauty", "pets", "fitness", "kitchen", "outdoor"]
+AUDIENCES = ["", "students", "parents", "gamers"]
+
+
+def key(i):
+    return f"product {i}", NICHES[i % len(NICHES)], AUDIENCES[i % len(AUDIENCES)]
+
+
+def market_rows(products):
+    for i in range(products):
+        yield (*key(i), "2025-09-01", 100_000 + i, 5 + i % 20, 20 + i % 60, "Medium", 5 + i % 5,
+               "TikTok|Instagram", "18-35 years", "Peak: Nov-Dec")
+
+
+def price_rows(products, competitors):
+    for i in range(products):
+        for c in range(competitors):
+            yield (*key(i), "2025-09-01", f"competitor {c}", 10 + (i + c) % 50, competitors - c)
+
+
+def timed_lookups(store, keys):
+    timings = []
+    for k in keys:
+        start = time.perf_counter()
+        store.analysis(*k)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    print(f"{label:<8} p50 {statistics.median(timings):7.4f} ms | p95 {percentile(timings, 95):7.4f} ms "
+          f"| max {timings[-1]:7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=250_000)
+    parser.add_argument("--competitors", type=int, default=4)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "market.db")
+        create_database(path, seed_files=())
+        start = time.perf_counter()
+        loaded = load_records(path, "markets", market_rows(args.products))
+        loaded += load_records(path, "competitor_prices", price_rows(args.products, args.competitors))
+        seconds = time.perf_counter() - start
+        print(f"loaded {loaded} rows in {seconds:.1f}s ({loaded / seconds:.0f} rows/s), "
+              f"{os.path.getsize(path) / 2**20:.0f} MB")
+
+        store = MarketDataStore(path)
+        rng = random.Random(7)
+        keys = [key(rng.randrange(args.products)) for _ in range(args.lookups)]
+        # Unknown products fall back through every key down to the niche default
+        misses = [(f"unknown {i}", NICHES[i % len(NICHES)], "general") for i in range(args.lookups)]
+        store.analysis(*keys[0])  # opens this thread's connection
+        store.clear()
+        report("cold", timed_lookups(store, keys))
+        report("warm", timed_lookups(store, keys))
+        store.clear()
+        report("fallback", timed_lookups(store, misses))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Tokens and latency per turn for the original vs the compacted instructions.
+
+Run from dropship_agent/:  python -m benchmarks.bench_prompt --rounds 3
+
+Runs against the stub model server, which charges prefill time per prompt
+token, so the saving from a shorter system prompt shows up in every model
+call of a turn, tool-call round trips included.
+"""
+import argparse
+import statistics
+
+from master_agent import SharedAgent, agent_instructions, run_agent_sync
+from memory import estimate_tokens
+from runtime import get_runtime
+from stub_server import StubModelServer
+from telemetry import TurnTelemetry
+from tool_cache import get_tool_cache
+
+PROMPTS = ["hello", "find trending products", "calculate profit for earbuds", "what's in season?"]
+
+
+def run_variant(instructions_variant, rounds, latency, prefill):
+    instructions = agent_instructions(instructions_variant)
+    turns = []
+    with StubModelServer(latency=latency, prefill_tokens_per_second=prefill) as server:
+        shared = SharedAgent(api_key="stub", base_url=server.base_url, instructions=instructions)
+        for _ in range(rounds):
+            for prompt in PROMPTS:
+                # Keep tool results out of the picture, every turn runs its tools
+                get_tool_cache().clear()
+                telemetry = TurnTelemetry()
+                result = run_agent_sync(shared.agent, prompt, shared.config, telemetry=telemetry)
+                turns.append(telemetry.finish(result))
+        get_runtime().run(shared.client.close())
+    return estimate_tokens(instructions), turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3, help="passes over the prompt set")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub base latency per request (s)")
+    parser.add_argument("--prefill", type=float, default=8000, help="stub prefill speed (tokens/s)")
+    args = parser.parse_args()
+
+    print(f"{'variant':<10} {'instr':>6} {'in tok/turn':>12} {'requests':>9} {'turn p50':>10}")
+    for variant in ("original", "compact"):
+        instruction_tokens, turns = run_variant(variant, args.rounds, args.latency, args.prefill)
+        print(f"{variant:<10} {instruction_tokens:6d} "
+              f"{statistics.mean(t['input_tokens'] for t in turns):12.0f} "
+              f"{statistics.mean(t['requests'] for t in turns):9.1f} "
+              f"{statistics.median(t['wall'] for t in turns) * 1000:8.1f}ms")
+    get_runtime().stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Per-rerun cost of the app script's setup: everything defined in the script vs loaded once per process.
+
+Run from dropship_agent/:  python -m benchmarks.bench_rerun --reruns 30
+
+"script" is the old layout, where every rerun loaded .env and re-ran the six
+@function_tool decorators (rebuilding their JSON schemas) and the agent
+factory. "module" is the current one: the script only imports them. "app" times
+a full rerun of main.py for scale.
+"""
+import argparse
+import os
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from telemetry import percentile
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+_TIMED = """
+import time
+started = time.perf_counter()
+{body}
+import streamlit as st
+st.session_state.setdefault("setup_ms", []).append((time.perf_counter() - started) * 1000)
+"""
+
+# Reloading tools re-executes its module body, as the old script did on each rerun
+SCRIPT_SETUP = _TIMED.format(body="""
+import importlib
+import streamlit as st
+from dotenv import load_dotenv
+load_dotenv()
+st.set_page_config(page_title="Master Dropshipping AI 🚀", page_icon="💰", layout="wide")
+import tools
+importlib.reload(tools)
+from agents import AsyncOpenAI
+from master_agent import build_master_agent
+agent, config = build_master_agent(AsyncOpenAI(api_key="bench", base_url="http://127.0.0.1:9/v1/"))
+quick_actions = [{"label": f"action {i}", "prompt": f"prompt {i}"} for i in range(6)]
+""")
+
+MODULE_SETUP = _TIMED.format(body="""
+import streamlit as st
+import environment
+import master_agent
+from app_content import QUICK_ACTIONS
+st.set_page_config(page_title="Master Dropshipping AI 🚀", page_icon="💰", layout="wide")
+shared_agent = master_agent.get_shared_agent(prewarm=False)
+""")
+
+
+def measure_setup(script, reruns):
+    at = AppTest.from_string(script, default_timeout=60)
+    for _ in range(reruns):
+        at.run()
+    return at.session_state["setup_ms"]
+
+
+def measure_app(reruns):
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    # The first run pays the imports either way
+    later = timings[1:]
+    print(f"{label:<7} first {timings[0]:8.2f} ms | later reruns p50 {statistics.median(later):7.3f} ms "
+          f"| p95 {percentile(later, 95):7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=30)
+    args = parser.parse_args()
+
+    # Nothing listens there: the app's pre-warm fails fast instead of reaching out
+    os.environ.setdefault("GEMINI_API_KEY", "bench")
+    os.environ.setdefault("GEMINI_BASE_URL", "http://127.0.0.1:9/v1/")
+    report("script", measure_setup(SCRIPT_SETUP, args.reruns))
+    report("module", measure_setup(MODULE_SETUP, args.reruns))
+    report("app", measure_app(args.reruns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Per-turn overhead of a fresh event loop per turn vs the persistent runtime loop.
+
+Run from dropship_agent/:  python -m benchmarks.bench_runtime --turns 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import concurrent.futures
+
+from agents import Agent, Runner, AsyncOpenAI, OpenAIChatCompletionsModel
+from agents.run import RunConfig
+
+from runtime import AgentRuntime
+from stub_server import StubModelServer
+
+
+def build_agent(base_url):
+    client = AsyncOpenAI(api_key="stub", base_url=base_url)
+    model = OpenAIChatCompletionsModel(model="gemini-2.0-flash", openai_client=client)
+    config = RunConfig(model=model, model_provider=client, tracing_disabled=True)
+    agent = Agent(name="Master Dropshipping AI", instructions="Answer briefly.")
+    return agent, config, client
+
+
+def run_fresh_loop(agent, user_input, config, client):
+    """The previous run_agent_sync: new executor and event loop on every turn"""
+    def run_in_thread():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(Runner.run(agent, user_input, run_config=config))
+        finally:
+            # Connections die with the loop; close them here instead of at GC time
+            loop.run_until_complete(client.close())
+            loop.close()
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        return executor.submit(run_in_thread).result()
+
+
+def measure(label, turns, server, run_turn):
+    server.connections = 0
+    timings = []
+    for i in range(turns):
+        start = time.perf_counter()
+        run_turn(f"turn {i}")
+        timings.append((time.perf_counter() - start) * 1000)
+    print(f"{label:<16} mean {statistics.mean(timings):7.2f} ms | "
+          f"p50 {statistics.median(timings):7.2f} ms | "
+          f"max {max(timings):7.2f} ms | connections {server.connections}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.0, help="stub model latency in seconds")
+    args = parser.parse_args()
+
+    with StubModelServer(latency=args.latency) as server:
+        # The old path could not keep a client across loops, so each turn paid for a new one
+        def before(prompt):
+            agent, config, client = build_agent(server.base_url)
+            return run_fresh_loop(agent, prompt, config, client)
+
+        runtime = AgentRuntime()
+        agent, config, _ = build_agent(server.base_url)
+
+        def after(prompt):
+            return runtime.run(Runner.run(agent, prompt, run_config=config))
+
+        before_ms = measure("fresh loop", args.turns, server, before)
+        after_ms = measure("persistent loop", args.turns, server, after)
+        runtime.stop()
+
+    saved = statistics.mean(before_ms) - statistics.mean(after_ms)
+    print(f"per-turn overhead saved: {saved:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Turn time with and without speculative tool pre-execution, against the stub model server.
+
+Run from dropship_agent/:  python -m benchmarks.bench_speculation --turns 5 --tool-delay 0.2 --latency 0.35
+
+The dropship tools are slowed by --tool-delay seconds each, standing in for
+remote lookups, and the stub answers each model call after --latency seconds.
+The prompts mix ones the keyword rules predict exactly, one whose arguments
+the model fills differently (a miss, discarded) and small talk (no prediction).
+"""
+import argparse
+import dataclasses
+import statistics
+import time
+
+from agents import Agent, AsyncOpenAI, OpenAIChatCompletionsModel, Runner
+from agents.run import RunConfig
+
+import tools as dropship_tools
+from bulkhead import ToolBulkheads
+from runtime import get_runtime
+from speculation import ToolSpeculator
+from stub_server import StubModelServer
+from telemetry import TurnTelemetry, current_turn
+
+PROMPTS = [
+    "Show me trending products",
+    "Find suppliers for Wireless Earbuds at $49.99",
+    "Analyze the market competition for Wireless Earbuds in electronics",
+    "Any seasonal opportunities?",
+    # The stub prices the earbuds at $49.99 whatever the prompt says, so this prediction misses
+    "Find suppliers for Wireless Earbuds at $59.99",
+    "hello there",
+]
+
+TOOLS = [
+    dropship_tools.get_trending_products,
+    dropship_tools.analyze_market_competition,
+    dropship_tools.find_suppliers_and_calculate_profits,
+    dropship_tools.create_marketing_strategy,
+    dropship_tools.generate_product_copy,
+    dropship_tools.seasonal_opportunity_finder,
+]
+
+
+def slowed(tool, delay):
+    invoke = tool.on_invoke_tool
+
+    async def on_invoke_tool(ctx, args_json):
+        # Runs on a bulkhead thread, so blocking here is what a slow lookup would do
+        time.sleep(delay)
+        return await invoke(ctx, args_json)
+
+    return dataclasses.replace(tool, on_invoke_tool=on_invoke_tool)
+
+
+def run_turns(base_url, tools, speculator, turns):
+    """{prompt: [turn records]}"""
+    client = AsyncOpenAI(api_key="stub", base_url=base_url)
+    model = OpenAIChatCompletionsModel(model="gemini-2.0-flash", openai_client=client)
+    config = RunConfig(model=model, model_provider=client, tracing_disabled=True)
+    agent = Agent(name="Master Dropshipping AI", instructions="Answer briefly.", tools=tools)
+
+    async def turn(prompt, telemetry):
+        current_turn.set(telemetry)
+        speculation = speculator.start(agent, prompt) if speculator else None
+        try:
+            return await Runner.run(agent, prompt, run_config=config, hooks=telemetry)
+        finally:
+            if speculation:
+                speculation.close()
+
+    records = {prompt: [] for prompt in PROMPTS}
+    for _ in range(turns):
+        for prompt in PROMPTS:
+            telemetry = TurnTelemetry()
+            result = get_runtime().run(turn(prompt, telemetry))
+            records[prompt].append(telemetry.finish(result))
+    get_runtime().run(client.close())
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=5, help="turns per prompt")
+    parser.add_argument("--tool-delay", type=float, default=0.2, help="seconds each tool call blocks")
+    parser.add_argument("--latency", type=float, default=0.35, help="seconds per model call")
+    args = parser.parse_args()
+
+    results = {}
+    with StubModelServer(latency=args.latency, jitter=0.0) as server:
+        for label, speculate in (("plain", False), ("speculative", True)):
+            bulkheads = ToolBulkheads()
+            speculator = ToolSpeculator() if speculate else None
+            slow = [slowed(tool, args.tool_delay) for tool in TOOLS]
+            tools = [bulkheads.wrap(tool) for tool in slow]
+            if speculator:
+                tools = [speculator.wrap(guarded, tool) for guarded, tool in zip(tools, slow)]
+            results[label] = run_turns(server.base_url, tools, speculator, args.turns)
+            bulkheads.shutdown()
+    speculator.shutdown()
+    get_runtime().stop()
+
+    print(f"{'prompt':<68} {'plain':>9} {'speculative':>12} {'hits':>5}")
+    for prompt in PROMPTS:
+        plain = statistics.median(r["wall"] for r in results["plain"][prompt]) * 1000
+        fast = statistics.median(r["wall"] for r in results["speculative"][prompt]) * 1000
+        hits = sum(r["speculative_hits"] for r in results["speculative"][prompt])
+        print(f"{prompt:<68} {plain:7.0f}ms {fast:10.0f}ms {hits:5d}")
+    stats = speculator.stats()
+    print(f"\n{stats['hits']} of {stats['predicted']} predicted calls used ({stats['hit_rate']:.0%}), "
+          f"{stats['discarded']} discarded, {stats['failed']} failed, {stats['skipped']} skipped; "
+          f"{stats['saved']:.2f}s of tool time saved "
+          f"over {stats['turns']} turns")
+
+
+if __name__ == "__main__":
+    main()
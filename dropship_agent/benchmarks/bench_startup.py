@@ -0,0 +1,68 @@
+"""Startup and first-turn latency of the shared agent, with and without pre-warming.
+
+Run from dropship_agent/:  python -m benchmarks.bench_startup --trials 5 --connect-latency 0.15
+
+The stub charges --connect-latency on every new connection, standing in for the
+DNS + TCP + TLS setup a remote model endpoint costs on a cold client.
+"""
+import argparse
+import statistics
+import time
+
+started = time.perf_counter()
+import master_agent  # noqa: E402
+IMPORT_SECONDS = time.perf_counter() - started
+
+from agents import Runner  # noqa: E402
+
+from runtime import get_runtime  # noqa: E402
+from stub_server import StubModelServer  # noqa: E402
+
+
+def first_turns(server, prewarm):
+    """(startup, prewarm, first turn, second turn) seconds for one freshly built shared agent"""
+    runtime = get_runtime()
+    start = time.perf_counter()
+    shared = master_agent.SharedAgent(api_key="stub", base_url=server.base_url)
+    startup = time.perf_counter() - start
+
+    warm = 0.0
+    if prewarm:
+        # The app starts this at page load; the user's first message arrives after it finishes
+        shared.prewarm().result()
+        warm = shared.prewarm_seconds
+
+    turns = []
+    for prompt in ("hello", "hello again"):
+        start = time.perf_counter()
+        runtime.run(Runner.run(shared.agent, prompt, run_config=shared.config))
+        turns.append(time.perf_counter() - start)
+    runtime.run(shared.client.close())
+    return startup, warm, turns[0], turns[1]
+
+
+def report(label, rows):
+    startup, warm, first, second = (statistics.mean(column) * 1000 for column in zip(*rows))
+    print(f"{label:<12} startup {startup:7.2f} ms | prewarm {warm:7.2f} ms | "
+          f"first turn {first:7.2f} ms | second turn {second:7.2f} ms")
+    return first
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--connect-latency", type=float, default=0.15, help="seconds per new connection")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub model latency in seconds")
+    args = parser.parse_args()
+
+    with StubModelServer(latency=args.latency, connect_latency=args.connect_latency) as server:
+        print(f"module import (tools, catalog, agents SDK): {IMPORT_SECONDS * 1000:.2f} ms")
+        cold = report("cold", [first_turns(server, prewarm=False) for _ in range(args.trials)])
+        warm = report("pre-warmed", [first_turns(server, prewarm=True) for _ in range(args.trials)])
+    get_runtime().stop()
+
+    print(f"first-turn latency saved by pre-warming: {cold - warm:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
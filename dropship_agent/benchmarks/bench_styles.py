@@ -0,0 +1,71 @@
+"""Per-rerun style payload and render time: three inline <style> blocks vs the compiled stylesheet.
+
+Run from dropship_agent/:  python -m benchmarks.bench_styles --reruns 30
+"""
+import argparse
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from styles import compile_css, read_sources
+
+# The old layout: every source re-sent as its own <style> markdown block on every rerun
+LEGACY_SCRIPT = """
+import streamlit as st
+from styles import read_sources
+
+if "style_bytes" not in st.session_state:
+    st.session_state.style_bytes = []
+sent = 0
+for css in read_sources():
+    body = f"<style>\\n{css}</style>"
+    st.markdown(body, unsafe_allow_html=True)
+    sent += len(body.encode())
+st.session_state.style_bytes.append(sent)
+"""
+
+COMPILED_SCRIPT = """
+import streamlit as st
+from styles import inject_styles
+
+if "style_bytes" not in st.session_state:
+    st.session_state.style_bytes = []
+st.session_state.style_bytes.append(inject_styles())
+"""
+
+
+def measure(script, reruns):
+    at = AppTest.from_string(script, default_timeout=30)
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    sent = at.session_state["style_bytes"]
+    return sent, timings
+
+
+def report(label, sent, timings):
+    print(f"{label:<9} first rerun {sent[0]:6d} B | later reruns {statistics.mean(sent[1:]):8.1f} B | "
+          f"rerun p50 {statistics.median(timings[1:]):6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=30)
+    args = parser.parse_args()
+
+    sources = read_sources()
+    raw = sum(len(css.encode()) for css in sources)
+    print(f"sources {raw} B -> compiled {len(compile_css(sources).encode())} B (merged, minified)")
+
+    legacy_sent, legacy_ms = measure(LEGACY_SCRIPT, args.reruns)
+    compiled_sent, compiled_ms = measure(COMPILED_SCRIPT, args.reruns)
+    report("inline", legacy_sent, legacy_ms)
+    report("compiled", compiled_sent, compiled_ms)
+    print(f"style bytes over {args.reruns} reruns: {sum(legacy_sent)} B -> {sum(compiled_sent)} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Benchmark suite: every dropship tool, reply extraction and full agent turns.
+
+Run from dropship_agent/:
+    python -m benchmarks.suite run --out baseline.json
+    python -m benchmarks.suite run --out candidate.json
+    python -m benchmarks.suite compare baseline.json candidate.json --threshold 0.15
+
+Full turns run against the local stub model server, so results don't depend on
+network or quota. compare exits 1 when any case's median got slower than the
+threshold allows.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from agents import Agent
+from agents.run_context import RunContextWrapper
+
+import tools
+from master_agent import SharedAgent, run_agent_sync
+from output import fallback_response, reply_text, response_text
+from runtime import get_runtime
+from streaming import stream_agent_turn
+from stub_server import StubModelServer
+from tool_cache import get_tool_cache
+from telemetry import percentile
+
+from benchmarks.bench_extraction import CORPUS_PATH, make_result, model_documents
+
+# Argument size multipliers for the per-tool cases
+SIZES = {"small": 1, "medium": 10, "large": 100}
+
+# Minimum seconds per sample; fast cases are looped until a sample takes this long
+MIN_SAMPLE_SECONDS = 0.005
+
+
+def tool_cases(size):
+    """[(tool, arguments)] with text arguments scaled by `size`"""
+    n = SIZES[size]
+    product = " ".join(["Wireless Earbuds"] * n)
+    features = ", ".join(f"feature {i}" for i in range(3 * n))
+    return [
+        (tools.get_trending_products, {"category": "all" if n > 1 else "electronics", "price_range": f"0-{50 * n}"}),
+        (tools.analyze_market_competition, {"product_name": product, "niche": "electronics " * n,
+                                            "target_audience": "students " * n}),
+        (tools.find_suppliers_and_calculate_profits, {"product_name": product, "target_selling_price": 49.99,
+                                                      "monthly_volume": 100 * n}),
+        (tools.create_marketing_strategy, {"product_name": product, "budget": 500.0 * n,
+                                           "target_audience": "students " * n, "niche": "electronics"}),
+        (tools.generate_product_copy, {"product_name": product, "key_features": features,
+                                       "target_audience": "commuters " * n, "price": 49.99}),
+        (tools.seasonal_opportunity_finder, {"current_month": ["December", "June", "sep"][list(SIZES).index(size)],
+                                             "days_ahead": 45 * n}),
+    ]
+
+
+def summarize(samples):
+    """Per-call milliseconds from a list of per-call second samples"""
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "median_ms": statistics.median(ms),
+        "mean_ms": statistics.mean(ms),
+        "min_ms": ms[0],
+        "p95_ms": percentile(ms, 95),
+        "stdev_ms": statistics.stdev(ms) if len(ms) > 1 else 0.0,
+        "samples": len(ms),
+    }
+
+
+def measure(fn, repeat, setup=None):
+    """Per-call seconds for `repeat` samples of fn(), each looped to at least MIN_SAMPLE_SECONDS"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= MIN_SAMPLE_SECONDS or number >= 1 << 16:
+            break
+        number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+async def measure_async(make_coro, repeat):
+    """measure() for coroutines, timed on the loop they run on"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            await make_coro()
+        if time.perf_counter() - start >= MIN_SAMPLE_SECONDS or number >= 1 << 16:
+            break
+        number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await make_coro()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def bench_tools(repeat):
+    """Each tool through its real function_tool entry point (JSON args, validation, call)"""
+    runtime = get_runtime()
+    context = RunContextWrapper(context=None)
+    results = {}
+    for size in SIZES:
+        for tool, arguments in tool_cases(size):
+            args_json = json.dumps(arguments)
+            samples = runtime.run(measure_async(lambda: tool.on_invoke_tool(context, args_json), repeat))
+            results[f"tool.{tool.name}.{size}"] = summarize(samples)
+    return results
+
+
+def bench_extraction(repeat):
+    """The reply path of a turn: text output, a JSON reply, fallback, and the streaming bubble's decode"""
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+    agent = Agent(name="Master Dropshipping AI", instructions="")
+    text = [(make_result(agent, c["prompt"], c["response"]), c["prompt"]) for c in corpus]
+    documents = [(make_result(agent, c["prompt"], model_documents(c["response"])[0]), c["prompt"]) for c in corpus]
+    empty = [(make_result(agent, c["prompt"], "  "), c["prompt"]) for c in corpus]
+    # What the streaming bubble decodes: every growing prefix of a JSON reply
+    streams = []
+    for c in corpus:
+        document = model_documents(c["response"])[0]
+        streams.append([document[:end] for end in range(8, len(document) + 1, 8)])
+
+    def extract(cases):
+        for result, prompt in cases:
+            response_text(result) or fallback_response(prompt)
+
+    def decode_streams():
+        for prefixes in streams:
+            for prefix in prefixes:
+                reply_text(prefix)
+
+    return {
+        "extraction.text": summarize(measure(lambda: extract(text), repeat)),
+        "extraction.json": summarize(measure(lambda: extract(documents), repeat)),
+        "extraction.fallback": summarize(measure(lambda: extract(empty), repeat)),
+        "extraction.stream": summarize(measure(decode_streams, repeat)),
+    }
+
+
+def bench_turns(repeat):
+    """Full agent turns through run_agent_sync and the streamed path, against the stub server"""
+    results = {}
+    tool_cache = get_tool_cache()
+    with StubModelServer(profile="instant") as server:
+        shared = SharedAgent(api_key="stub", base_url=server.base_url)
+        shared.prewarm().result()
+
+        def streamed(prompt):
+            for _ in stream_agent_turn(shared.agent, prompt, shared.config):
+                pass
+
+        cases = {
+            "turn.plain": lambda: run_agent_sync(shared.agent, "hello there", shared.config),
+            "turn.tool": lambda: run_agent_sync(shared.agent, "find trending products", shared.config),
+            "turn.streamed_tool": lambda: streamed("find trending products"),
+        }
+        for name, fn in cases.items():
+            # Tool results would otherwise come from the cache after the first sample
+            results[name] = summarize(measure(fn, repeat, setup=tool_cache.clear))
+        get_runtime().run(shared.client.close())
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    groups = {"tools": bench_tools, "extraction": bench_extraction, "turns": bench_turns}
+    results = {}
+    for name, bench in groups.items():
+        if args.only and name not in args.only:
+            continue
+        started = time.perf_counter()
+        results.update(bench(args.repeat))
+        print(f"{name:<11} done in {time.perf_counter() - started:.1f}s")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    for name, stats in results.items():
+        print(f"{name:<52} {stats['median_ms']:10.4f} ms  (p95 {stats['p95_ms']:.4f})")
+    print(f"saved {len(results)} results to {args.out}")
+
+
+def compare(args):
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)["results"]
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    for name in sorted(base.keys() | new.keys()):
+        if name not in new:
+            print(f"{name:<52} removed")
+            continue
+        if name not in base:
+            print(f"{name:<52} new       {new[name]['median_ms']:10.4f} ms")
+            continue
+        before, after = base[name]["median_ms"], new[name]["median_ms"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > args.threshold and after - before > args.min_delta_ms:
+            flag = "REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "faster"
+        print(f"{name:<52} {before:10.4f} -> {after:10.4f} ms  {change:+7.1%}  {flag}")
+
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+    if regressions:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite and save results as JSON")
+    run_parser.add_argument("--out", default="benchmark_results.json")
+    run_parser.add_argument("--repeat", type=int, default=15, help="samples per case")
+    run_parser.add_argument("--only", nargs="+", choices=["tools", "extraction", "turns"])
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="flag cases that got slower between two runs")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.15, help="allowed median slowdown (0.15 = 15%%)")
+    compare_parser.add_argument("--min-delta-ms", type=float, default=0.001,
+                                help="ignore slowdowns smaller than this, in ms")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import asyncio
+import contextvars
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from telemetry import current_turn
+from tool_cache import ToolFailure
+
+# Calls of one tool that may run at once, and seconds a call may take (queue wait included)
+DEFAULT_LIMIT = 4
+DEFAULT_TIMEOUT = 10.0
+
+# Each pool thread keeps one event loop to drive FunctionTool coroutines on
+_thread_state = threading.local()
+
+
+def _invoke_in_thread(invoke, ctx, args_json, submitted, timing):
+    started = time.perf_counter()
+    timing["queue_wait"] = started - submitted
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None:
+        loop = _thread_state.loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(invoke(ctx, args_json))
+    finally:
+        timing["run"] = time.perf_counter() - started
+
+
+class Bulkhead:
+    """A tool's own bounded thread pool, call timeout and timing counters"""
+
+    def __init__(self, name, limit=DEFAULT_LIMIT, timeout=DEFAULT_TIMEOUT):
+        self.name = name
+        self.limit = limit
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix=f"tool-{name}")
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "timeouts": 0, "in_flight": 0,
+                       "queue_wait": 0.0, "max_queue_wait": 0.0, "run": 0.0, "max_run": 0.0}
+
+    def _finished(self, future, timing):
+        # Runs when the thread is done, which can be after the caller gave up on it
+        with self._lock:
+            self._stats["in_flight"] -= 1
+            if future.cancelled():
+                return
+            self._stats["calls"] += 1
+            self._stats["queue_wait"] += timing["queue_wait"]
+            self._stats["run"] += timing["run"]
+            self._stats["max_queue_wait"] = max(self._stats["max_queue_wait"], timing["queue_wait"])
+            self._stats["max_run"] = max(self._stats["max_run"], timing["run"])
+
+    def free_slots(self):
+        """Threads not busy with a call; a timed-out call holds its thread until it returns"""
+        with self._lock:
+            return max(self.limit - self._stats["in_flight"], 0)
+
+    def wrap(self, tool, timeout=None):
+        """Return a copy of a FunctionTool whose calls run on this bulkhead's threads.
+
+        Synchronous tool bodies block whatever thread runs them; off the event
+        loop, the SDK's gather over one step's tool calls really runs them side
+        by side. A call that outlives the timeout (the bulkhead's, unless given)
+        is answered with a ToolFailure message so the turn goes on; its thread
+        keeps the slot until it returns.
+        """
+        invoke = tool.on_invoke_tool
+        timeout = self.timeout if timeout is None else timeout
+
+        async def on_invoke_tool(ctx, args_json):
+            timing = {}
+            with self._lock:
+                self._stats["in_flight"] += 1
+            # Copy the context so current_turn and tracing spans follow the call onto the thread
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, _invoke_in_thread, invoke, ctx, args_json,
+                                           time.perf_counter(), timing)
+            future.add_done_callback(lambda f: self._finished(f, timing))
+            try:
+                result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except asyncio.TimeoutError:
+                with self._lock:
+                    self._stats["timeouts"] += 1
+                turn = current_turn.get()
+                if turn is not None:
+                    turn.tool_timeouts += 1
+                return ToolFailure(f"{tool.name} timed out after {timeout:g}s, continue without it.")
+            turn = current_turn.get()
+            if turn is not None:
+                turn.tool_queue_wait += timing["queue_wait"]
+            return result
+
+        return dataclasses.replace(tool, on_invoke_tool=on_invoke_tool)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        calls = stats["calls"]
+        return {
+            "limit": self.limit,
+            "timeout": self.timeout,
+            "calls": calls,
+            "timeouts": stats["timeouts"],
+            "in_flight": stats["in_flight"],
+            "avg_queue_wait": stats["queue_wait"] / calls if calls else 0.0,
+            "max_queue_wait": stats["max_queue_wait"],
+            "avg_run": stats["run"] / calls if calls else 0.0,
+            "max_run": stats["max_run"],
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ToolBulkheads:
+    """One bulkhead per tool name, shared by every agent that uses the wrapped tools"""
+
+    def __init__(self):
+        self._bulkheads = {}
+        self._lock = threading.Lock()
+
+    def get(self, name, limit=DEFAULT_LIMIT, timeout=DEFAULT_TIMEOUT):
+        """The tool's bulkhead; limit and timeout only apply when it is first created"""
+        with self._lock:
+            if name not in self._bulkheads:
+                self._bulkheads[name] = Bulkhead(name, limit, timeout)
+            return self._bulkheads[name]
+
+    def wrap(self, tool, limit=DEFAULT_LIMIT, timeout=DEFAULT_TIMEOUT):
+        return self.get(tool.name, limit, timeout).wrap(tool)
+
+    def stats(self):
+        """Per-tool limit, timeout, calls, timeouts and queue wait / run seconds"""
+        with self._lock:
+            bulkheads = list(self._bulkheads.values())
+        return {bulkhead.name: bulkhead.stats() for bulkhead in bulkheads}
+
+    def shutdown(self):
+        with self._lock:
+            for bulkhead in self._bulkheads.values():
+                bulkhead.shutdown()
+            self._bulkheads.clear()
+
+
+_bulkheads = None
+_bulkheads_lock = threading.Lock()
+
+
+def get_bulkheads() -> ToolBulkheads:
+    """Process-wide tool bulkheads shared by every session"""
+    global _bulkheads
+    with _bulkheads_lock:
+        if _bulkheads is None:
+            _bulkheads = ToolBulkheads()
+        return _bulkheads
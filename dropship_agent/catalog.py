@@ -0,0 +1,158 @@
+import bisect
+import csv
+import heapq
+import os
+import re
+import threading
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet catalogs are optional
+    pq = None
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CATALOG_PATH = os.environ.get("DROPSHIP_CATALOG_PATH", os.path.join(DATA_DIR, "products.csv"))
+
+DEMAND_LEVELS = {"low": 1, "medium": 2, "high": 3, "very high": 4}
+COMPETITION_FACTORS = {"low": 1.0, "medium": 0.8, "high": 0.6, "very high": 0.5, "extreme": 0.4}
+
+# Below this many in-range products a heap over the range beats walking the ranked list
+_HEAP_SCAN_LIMIT = 2048
+
+
+def parse_money(value):
+    """'$12', '1,299.99' or 12 -> float"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(str(value).replace("$", "").replace(",", "").strip())
+
+
+def parse_price_range(price_range):
+    """'0-50', '$20-$40', '50+', 'under 30' -> (low, high)"""
+    numbers = [float(n) for n in re.findall(r"\d+(?:\.\d+)?", str(price_range or "").replace(",", ""))]
+    text = str(price_range or "").lower()
+    if len(numbers) >= 2:
+        return min(numbers[:2]), max(numbers[:2])
+    if len(numbers) == 1:
+        if "+" in text or "over" in text or "above" in text:
+            return numbers[0], float("inf")
+        return 0.0, numbers[0]
+    return 0.0, float("inf")
+
+
+class ProductCatalog:
+    """Column-oriented product catalog with secondary indexes.
+
+    Rows are stored as parallel lists. Each category (and "all") keeps its rows
+    sorted by sell price for range filtering, plus ranked row lists for top-k
+    by margin or by combined score.
+    """
+
+    def __init__(self, rows):
+        self.names, self.categories, self.costs, self.prices = [], [], [], []
+        self.margins, self.demands, self.competitions, self.scores = [], [], [], []
+        for row in rows:
+            cost, sell = parse_money(row["cost"]), parse_money(row["sell"])
+            margin = (sell - cost) / sell * 100 if sell else 0.0
+            demand = str(row["demand"]).strip()
+            competition = str(row["competition"]).strip()
+            self.names.append(str(row["name"]).strip())
+            self.categories.append(str(row["category"]).strip().lower())
+            self.costs.append(cost)
+            self.prices.append(sell)
+            self.margins.append(margin)
+            self.demands.append(demand)
+            self.competitions.append(competition)
+            self.scores.append(
+                margin / 100
+                * DEMAND_LEVELS.get(demand.lower(), 2) / 4
+                * COMPETITION_FACTORS.get(competition.lower(), 0.8)
+            )
+
+        self.by_category = {}
+        self.by_demand = {}
+        self.by_competition = {}
+        for i in range(len(self.names)):
+            self.by_category.setdefault(self.categories[i], []).append(i)
+            self.by_demand.setdefault(self.demands[i].lower(), set()).add(i)
+            self.by_competition.setdefault(self.competitions[i].lower(), set()).add(i)
+
+        self._price_index = {}
+        self._ranked = {}
+        for category, ids in [("all", range(len(self.names)))] + list(self.by_category.items()):
+            ids_by_price = sorted(ids, key=self.prices.__getitem__)
+            self._price_index[category] = ([self.prices[i] for i in ids_by_price], ids_by_price)
+            self._ranked[category] = {
+                "score": sorted(ids, key=self.scores.__getitem__, reverse=True),
+                "margin": sorted(ids, key=self.margins.__getitem__, reverse=True),
+            }
+
+    def __len__(self):
+        return len(self.names)
+
+    def row(self, i):
+        return {
+            "name": self.names[i],
+            "category": self.categories[i],
+            "cost": self.costs[i],
+            "sell": self.prices[i],
+            "margin": self.margins[i],
+            "demand": self.demands[i],
+            "competition": self.competitions[i],
+            "score": self.scores[i],
+        }
+
+    def query(self, category="all", min_price=0.0, max_price=float("inf"),
+              demand=None, competition=None, sort_by="score", k=8):
+        """Top-k products by "score" or "margin" within a category and sell-price range"""
+        category = (category or "all").lower()
+        if category not in self._price_index:
+            category = "all"
+        prices, ids_by_price = self._price_index[category]
+        lo = bisect.bisect_left(prices, min_price)
+        hi = bisect.bisect_right(prices, max_price)
+
+        filters = []
+        if demand:
+            filters.append(self.by_demand.get(demand.lower(), set()))
+        if competition:
+            filters.append(self.by_competition.get(competition.lower(), set()))
+
+        keys = self.scores if sort_by == "score" else self.margins
+        if hi - lo <= _HEAP_SCAN_LIMIT:
+            candidates = ids_by_price[lo:hi]
+            if filters:
+                candidates = [i for i in candidates if all(i in f for f in filters)]
+            top = heapq.nlargest(k, candidates, key=keys.__getitem__)
+        else:
+            # Wide range: walk the precomputed ranking until k rows pass the filters
+            top = []
+            for i in self._ranked[category][sort_by]:
+                if min_price <= self.prices[i] <= max_price and all(i in f for f in filters):
+                    top.append(i)
+                    if len(top) == k:
+                        break
+        return [self.row(i) for i in top]
+
+
+def load_rows(path):
+    """Read catalog rows from a CSV or Parquet file"""
+    if path.endswith(".parquet"):
+        if pq is None:
+            raise ImportError("Reading a Parquet catalog requires pyarrow (pip install pyarrow)")
+        return pq.read_table(path).to_pylist()
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> ProductCatalog:
+    """Process-wide catalog, loaded from CATALOG_PATH on first use"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = ProductCatalog(load_rows(CATALOG_PATH))
+        return _catalog
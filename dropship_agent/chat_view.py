@@ -0,0 +1,50 @@
+HISTORY_PAGE_SIZE = 20
+
+
+def user_bubble(message):
+    return f'<div class="user-message"><strong>👤 You:</strong><br>{message}</div>'
+
+
+def ai_bubble(message, footer=""):
+    return f'<div class="ai-response"><strong>🤖 Master AI:</strong><br>{message}{footer}</div>'
+
+
+def format_latency(latency):
+    """Small latency footer for an AI response bubble"""
+    if not latency:
+        return ""
+    if latency.get('cached'):
+        return '<div style="font-size: 12px; opacity: 0.7; margin-top: 8px;">🗄️ served from cache</div>'
+    parts = []
+    if latency.get('ttft') is not None:
+        parts.append(f"⚡ first token {latency['ttft']:.2f}s")
+    parts.append(f"⏱️ total {latency['total']:.2f}s")
+    if latency.get('tokens'):
+        parts.append(f"📨 {latency['tokens']} tokens sent")
+    return f'<div style="font-size: 12px; opacity: 0.7; margin-top: 8px;">{" · ".join(parts)}</div>'
+
+
+def message_html(chat):
+    """Rendered bubble for a chat message, formatted once and memoized on the message"""
+    html = chat.get('html')
+    if html is None:
+        if chat['type'] == 'user':
+            html = user_bubble(chat['message'])
+        else:
+            html = ai_bubble(chat['message'], format_latency(chat.get('latency')))
+        chat['html'] = html
+    return html
+
+
+def history_window(history, window, memo):
+    """(hidden_count, html) for the last `window` messages.
+
+    memo is a per-session dict; the joined HTML is reused until the window or
+    the history length changes, so a rerun costs the same at 10 or 10,000 messages.
+    """
+    start = max(0, len(history) - window)
+    key = (id(history), start, len(history))
+    if memo.get('key') != key:
+        memo['key'] = key
+        memo['html'] = "\n\n".join(message_html(chat) for chat in history[start:])
+    return start, memo['html']
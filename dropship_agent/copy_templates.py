@@ -0,0 +1,30 @@
+def render_product_copy(product_name, key_features, target_audience, price):
+    """The generate_product_copy text for one product.
+
+    One f-string, so rendering is a single BUILD_STRING instead of parsing a
+    template (str.format) or growing a string piece by piece (+=).
+    """
+    return (
+        "✍️ HIGH-CONVERTING PRODUCT COPY\n\n"
+        "📝 PRODUCT TITLE:\n"
+        f"🔥 {product_name.upper()} - Transform Your {target_audience} Experience!\n\n"
+        "🎯 MAIN DESCRIPTION:\n"
+        f"✨ Discover the game-changing {product_name} that's taking {target_audience} by storm!\n\n"
+        f"🔥 KEY FEATURES:\n{key_features}\n\n"
+        "💫 WHY CHOOSE US?\n"
+        "✅ Premium Quality Materials\n"
+        "✅ Fast Worldwide Shipping (7-15 days)\n"
+        "✅ 30-Day Money Back Guarantee\n"
+        "✅ 24/7 Customer Support\n"
+        "✅ Trusted by 10,000+ Happy Customers\n\n"
+        f"💰 SPECIAL OFFER: Just ${price} (Limited Time!)\n"
+        "🚚 FREE SHIPPING on orders over $25\n\n"
+        "⭐ CUSTOMER REVIEWS:\n"
+        "\"Amazing quality! Exactly as described\" - Sarah M. ⭐⭐⭐⭐⭐\n"
+        "\"Fast shipping and great customer service\" - Mike R. ⭐⭐⭐⭐⭐\n"
+        "\"Perfect for my needs, highly recommend!\" - Lisa K. ⭐⭐⭐⭐⭐\n\n"
+        "🔥 AD COPY VARIATIONS:\n"
+        f"1. \"This {product_name} is going VIRAL! Get yours before it's too late!\"\n"
+        f"2. \"Why pay more? Get premium {product_name} for just ${price}!\"\n"
+        f"3. \"10,000+ customers can't be wrong! Try {product_name} risk-free!\"\n"
+    )
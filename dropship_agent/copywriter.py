@@ -0,0 +1,283 @@
+"""Bulk product copy: stream a product CSV through the copy template, optionally polished by the model.
+
+Run from dropship_agent/:
+    python copywriter.py data/products.csv --out copy.jsonl
+    python copywriter.py products.csv --out copy.csv --polish --batch-size 16 --concurrency 8
+
+Rows are read, rendered and written one micro-batch at a time, so memory stays
+flat however large the catalog is. After every written batch a checkpoint next
+to --out records how far the run got; running the same command again resumes
+there. With --polish, each row's description is rewritten by the model, with
+up to --concurrency requests in flight across micro-batches; a row whose
+request fails keeps the template copy.
+"""
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+import time
+
+from pydantic import BaseModel, Field
+
+from catalog import parse_money
+from copy_templates import render_product_copy
+
+# Input column for each copy field, first match wins
+COLUMN_ALIASES = {
+    "product_name": ("product_name", "name", "title"),
+    "key_features": ("key_features", "features"),
+    "target_audience": ("target_audience", "audience"),
+    "price": ("price", "sell", "sell_price"),
+}
+
+OUTPUT_FIELDS = ("row", "product_name", "target_audience", "price", "copy", "polished", "description")
+
+POLISH_INSTRUCTIONS = """You polish dropshipping product descriptions.
+Rewrite the given description as one persuasive paragraph of at most 80 words for the given audience.
+Keep every fact and the price exactly, invent nothing, no emoji."""
+
+# Seconds between progress lines
+PROGRESS_EVERY = 5.0
+
+INTERRUPTED = "\nInterrupted, written rows are checkpointed; run the same command again to resume"
+
+
+class PolishedCopy(BaseModel):
+    """Typed output of the copy polisher"""
+
+    description: str = Field(description="The rewritten product description")
+
+
+def row_fields(row, default_audience):
+    """generate_product_copy arguments from an input row, whatever its column names"""
+    def pick(field):
+        for column in COLUMN_ALIASES[field]:
+            value = row.get(column)
+            if value not in (None, ""):
+                return str(value).strip()
+        return None
+
+    name = pick("product_name") or "Product"
+    features = pick("key_features") or ", ".join(
+        value for value in (row.get("category"), row.get("demand") and f"{row['demand']} demand") if value
+    )
+    price = pick("price")
+    return {
+        "product_name": name,
+        "key_features": features,
+        "target_audience": pick("target_audience") or default_audience,
+        "price": parse_money(price) if price else 0.0,
+    }
+
+
+def render_row(index, row, default_audience):
+    fields = row_fields(row, default_audience)
+    return {
+        "row": index,
+        "product_name": fields["product_name"],
+        "target_audience": fields["target_audience"],
+        "price": fields["price"],
+        "copy": render_product_copy(**fields),
+        "polished": False,
+        "description": None,
+    }
+
+
+def read_rows(path, skip=0):
+    """(row number, row dict) for each CSV row after the first `skip`, read lazily"""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from itertools.islice(enumerate(csv.DictReader(f)), skip, None)
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def checkpoint_path(out_path):
+    return f"{out_path}.checkpoint"
+
+
+def load_checkpoint(out_path, input_path):
+    """Saved progress for this input and output, or None to start over"""
+    try:
+        with open(checkpoint_path(out_path), encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get("input") == os.path.abspath(input_path) else None
+
+
+def save_checkpoint(out_path, state):
+    tmp_path = f"{checkpoint_path(out_path)}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, checkpoint_path(out_path))
+
+
+class CopyOutput:
+    """Appends records to a .csv or .jsonl file; tell() is the offset a checkpoint can resume from"""
+
+    def __init__(self, path, offset=0):
+        self.path = path
+        self.csv = path.endswith(".csv")
+        self._file = open(path, "a+" if offset else "w", newline="" if self.csv else None, encoding="utf-8")
+        if offset:
+            # Drop anything written after the checkpoint, it is produced again
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        self._writer = csv.DictWriter(self._file, OUTPUT_FIELDS) if self.csv else None
+        if self.csv and not offset:
+            self._writer.writeheader()
+
+    def write(self, records):
+        if self.csv:
+            self._writer.writerows(records)
+        else:
+            self._file.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+    def tell(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+def build_polisher(config):
+    """(agent, run config) that polishes copy on the shared agent's model and client"""
+    from agents import Agent
+
+    return Agent(name="Copy Polisher", instructions=POLISH_INSTRUCTIONS, output_type=PolishedCopy), config
+
+
+async def polish_batch(agent, config, records, semaphore):
+    """Rewrite each record's description concurrently; returns the number of failed requests"""
+    from agents import Runner
+
+    async def polish(record):
+        prompt = (f"Product: {record['product_name']}\nAudience: {record['target_audience']}\n"
+                  f"Price: ${record['price']}\n\nDescription:\n{record['copy']}")
+        async with semaphore:
+            try:
+                result = await Runner.run(agent, prompt, run_config=config)
+            except Exception:
+                return False
+        output = result.final_output
+        text = output.description if isinstance(output, PolishedCopy) else str(output or "")
+        if not text.strip():
+            return False
+        record["description"] = text.strip()
+        record["polished"] = True
+        return True
+
+    outcomes = await asyncio.gather(*(polish(record) for record in records))
+    return outcomes.count(False)
+
+
+async def run_pipeline(input_path, out_path, batch_size, default_audience, polisher=None, concurrency=8):
+    """Render (and polish) every row not yet checkpointed; returns the run's counters"""
+    state = load_checkpoint(out_path, input_path)
+    if state and state.get("complete"):
+        return dict(state, rows_this_run=0, seconds=0.0)
+    state = state or {"input": os.path.abspath(input_path), "rows": 0, "offset": 0, "polished": 0, "failed": 0}
+    output = CopyOutput(out_path, state["offset"])
+    semaphore = asyncio.Semaphore(concurrency)
+    # Enough micro-batches in flight to keep `concurrency` requests busy, written back in input order
+    window = max(concurrency // batch_size, 1) + 1 if polisher else 1
+    in_flight = collections.deque()
+    started = last_report = time.perf_counter()
+    rows_this_run = 0
+
+    async def finish(batch):
+        nonlocal rows_this_run, last_report
+        records, polishing = batch
+        failed = await polishing if polishing is not None else 0
+        output.write(records)
+        rows_this_run += len(records)
+        state["rows"] += len(records)
+        state["polished"] += sum(record["polished"] for record in records)
+        state["failed"] += failed
+        state["offset"] = output.tell()
+        save_checkpoint(out_path, state)
+        # Lets a Ctrl-C (task cancellation) land between batches, even when nothing else awaits
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        if now - last_report >= PROGRESS_EVERY:
+            last_report = now
+            print(f"{state['rows']} rows written ({rows_this_run / (now - started):.0f} rows/s)")
+
+    try:
+        for batch in batched(read_rows(input_path, state["rows"]), batch_size):
+            records = [render_row(index, row, default_audience) for index, row in batch]
+            polishing = asyncio.ensure_future(polish_batch(*polisher, records, semaphore)) if polisher else None
+            in_flight.append((records, polishing))
+            if len(in_flight) >= window:
+                await finish(in_flight.popleft())
+        while in_flight:
+            await finish(in_flight.popleft())
+        state["complete"] = True
+        save_checkpoint(out_path, state)
+    finally:
+        for _, polishing in in_flight:
+            if polishing is not None:
+                polishing.cancel()
+        output.close()
+    return dict(state, rows_this_run=rows_this_run, seconds=time.perf_counter() - started)
+
+
+def summarize(report):
+    seconds = report["seconds"]
+    rate = report["rows_this_run"] / seconds if seconds else 0.0
+    print(f"\n{report['rows_this_run']} rows in {seconds:.2f}s ({rate:.0f} rows/s), "
+          f"{report['rows']} rows in the output")
+    if report["polished"] or report["failed"]:
+        print(f"{report['polished']} polished by the model, {report['failed']} kept the template copy")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("products", help="product CSV (name/product_name, price/sell, optional features/audience)")
+    parser.add_argument("--out", default="product_copy.jsonl", help=".jsonl or .csv output")
+    parser.add_argument("--batch-size", type=int, default=64, help="rows per micro-batch (and checkpoint)")
+    parser.add_argument("--audience", default="online shoppers", help="audience for rows without one")
+    parser.add_argument("--polish", action="store_true", help="rewrite each description with the model")
+    parser.add_argument("--concurrency", type=int, default=8, help="model requests in flight when polishing")
+    args = parser.parse_args()
+
+    batch_size = max(args.batch_size, 1)
+    if not args.polish:
+        try:
+            report = asyncio.run(run_pipeline(args.products, args.out, batch_size, args.audience))
+        except KeyboardInterrupt:
+            print(INTERRUPTED)
+            return
+        summarize(report)
+        return
+
+    import environment  # noqa: F401  (loads .env before master_agent reads GEMINI_BASE_URL)
+    from master_agent import get_shared_agent
+    from runtime import CancelToken, get_runtime
+
+    polisher = build_polisher(get_shared_agent(prewarm=False).config)
+    token = CancelToken()
+    future = get_runtime().submit(run_pipeline(args.products, args.out, batch_size, args.audience,
+                                               polisher, max(args.concurrency, 1)), token)
+    try:
+        report = future.result()
+    except KeyboardInterrupt:
+        # Cancel on the loop and wait for the output to be closed at the last checkpoint
+        token.cancel("interrupted")
+        concurrent.futures.wait([future], timeout=10)
+        print(INTERRUPTED)
+        return
+    summarize(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+from dotenv import load_dotenv
+
+# Imported by the app before any module that reads settings: .env is loaded once per
+# process, instead of on every Streamlit rerun, and before GEMINI_BASE_URL & co are read
+load_dotenv()
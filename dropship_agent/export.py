@@ -0,0 +1,59 @@
+import gzip
+import itertools
+import json
+import tempfile
+import threading
+
+
+def iter_ndjson(history, start=0, stop=None):
+    """One JSON line per chat message in history[start:stop]"""
+    for chat in itertools.islice(history, start, stop):
+        yield json.dumps({
+            'type': chat['type'],
+            'message': chat['message'],
+            'timestamp': chat['timestamp'].isoformat()
+        }, ensure_ascii=False) + "\n"
+
+
+def write_export(history, start=0, stop=None, compress=False):
+    """Stream history into a temporary NDJSON (optionally gzip) file, rewound for reading"""
+    spool = tempfile.TemporaryFile()
+    out = gzip.GzipFile(fileobj=spool, mode="wb") if compress else spool
+    for line in iter_ndjson(history, start, stop):
+        out.write(line.encode("utf-8"))
+    if compress:
+        out.close()
+    spool.seek(0)
+    return spool
+
+
+class ExportCursor:
+    """Remembers how far a session's history has been exported"""
+
+    def __init__(self):
+        self.position = 0
+        self._lock = threading.Lock()
+
+    def advance(self, end, since_last):
+        """Start index for an export ending at `end`, moving the cursor to `end`"""
+        with self._lock:
+            start = min(self.position, end) if since_last else 0
+            self.position = end
+            return start
+
+    def reset(self):
+        with self._lock:
+            self.position = 0
+
+
+def deferred_export(history, cursor, since_last=False, compress=False):
+    """Zero-argument callable for st.download_button that builds the export on click.
+
+    Streamlit runs it on a separate thread, so it only closes over the history
+    list and cursor objects and never touches st.session_state.
+    """
+    def build():
+        end = len(history)
+        return write_export(history, cursor.advance(end, since_last), end, compress)
+
+    return build
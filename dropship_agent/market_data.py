@@ -0,0 +1,316 @@
+"""Local market-data store: competitor and pricing snapshots in SQLite, behind analyze_market_competition.
+
+Load snapshots from dropship_agent/:
+    python market_data.py market_snapshots.csv competitor_prices.csv --db data/market.db
+
+A file with a "competitor" column holds competitor prices (product, niche,
+audience, captured, competitor, price, share). Any other file holds market
+profiles (product, niche, audience, captured, market_size, growth, saturation,
+competition_level, opportunity, platforms, demographics, seasonality). An empty
+product or audience makes a niche-wide row. Rows with the same key and
+capture date replace the ones already loaded. Each load bumps the data version,
+which running apps check before answering from their caches.
+"""
+import argparse
+import csv
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from catalog import DATA_DIR
+
+MARKET_DB_PATH = os.environ.get("DROPSHIP_MARKET_DB", os.path.join(DATA_DIR, "market.db"))
+# Loaded when the database does not exist yet
+SEED_FILES = (os.path.join(DATA_DIR, "market_snapshots.csv"), os.path.join(DATA_DIR, "competitor_prices.csv"))
+
+KEY_COLUMNS = ("product", "niche", "audience", "captured")
+TABLE_COLUMNS = {
+    "markets": KEY_COLUMNS + ("market_size", "growth", "saturation", "competition_level", "opportunity",
+                              "platforms", "demographics", "seasonality"),
+    "competitor_prices": KEY_COLUMNS + ("competitor", "price", "share"),
+}
+NUMERIC_COLUMNS = {"market_size", "growth", "saturation", "opportunity", "price", "share"}
+
+# The primary keys are the lookup indexes: (product, niche, audience) prefix, latest capture last
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS markets (
+    product TEXT NOT NULL, niche TEXT NOT NULL, audience TEXT NOT NULL, captured TEXT NOT NULL,
+    market_size REAL, growth REAL, saturation REAL, competition_level TEXT, opportunity REAL,
+    platforms TEXT, demographics TEXT, seasonality TEXT,
+    PRIMARY KEY (product, niche, audience, captured)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS competitor_prices (
+    product TEXT NOT NULL, niche TEXT NOT NULL, audience TEXT NOT NULL, captured TEXT NOT NULL,
+    competitor TEXT NOT NULL, price REAL NOT NULL, share REAL,
+    PRIMARY KEY (product, niche, audience, captured, competitor)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS loads (
+    version INTEGER PRIMARY KEY, loaded_at TEXT NOT NULL, table_name TEXT NOT NULL, rows INTEGER NOT NULL
+);
+"""
+
+_MARKET_SQL = """
+SELECT captured, market_size, growth, saturation, competition_level, opportunity, platforms, demographics, seasonality
+FROM markets WHERE {where} ORDER BY captured DESC LIMIT 1
+"""
+_PRICES_SQL = """
+SELECT competitor, price FROM competitor_prices
+WHERE {where} AND captured = (SELECT MAX(captured) FROM competitor_prices WHERE {where})
+ORDER BY share DESC, price
+"""
+_KEY_FIELDS = ("product", "niche", "audience")
+# Every load adds a row, so the highest version changes whenever the data does
+_VERSION_SQL = "SELECT COALESCE(MAX(version), 0) FROM loads"
+
+
+def _key_sql(template, key):
+    """SQL for a lookup key; None in the key matches any value (still a primary-key prefix)"""
+    fields = [field for field, value in zip(_KEY_FIELDS, key) if value is not None]
+    where = " AND ".join(f"{field} = ?{i}" for i, field in enumerate(fields, 1))
+    return template.format(where=where)
+
+
+# What the tool reports when nothing in the store matches
+DEFAULT_ANALYSIS = {
+    "market_size": "$2.5M monthly",
+    "competition_level": "Medium-High",
+    "top_players": ["TrendyTech", "StyleDrop", "HomeEssentials"],
+    "avg_price": "$32.99",
+    "price_range": "$18-$65",
+    "market_growth": "+15% YoY",
+    "saturation": "45%",
+    "opportunity_score": "7.8/10",
+    "best_platforms": ["Facebook Ads", "TikTok", "Google Shopping"],
+    "target_demographics": "18-35 years, Tech-savvy consumers",
+    "seasonal_trends": "Peak: Nov-Jan, Low: Jun-Aug",
+    "snapshot": None,
+}
+
+
+def normalize_key(value):
+    return " ".join(str(value or "").lower().split())
+
+
+def candidate_keys(product, niche, audience):
+    """Store keys for a lookup, most specific first: the product (in this niche, then in any),
+    then the niche, then the catch-all row. None matches any value."""
+    product, niche, audience = normalize_key(product), normalize_key(niche), normalize_key(audience)
+    keys = [(product, niche, audience), (product, niche, ""), (product, None, None),
+            ("", niche, audience), ("", niche, ""), ("", "", "")]
+    return list(dict.fromkeys(keys))
+
+
+def format_market_size(value):
+    if value >= 1_000_000:
+        return f"${value / 1_000_000:.1f}M monthly"
+    return f"${value / 1_000:.0f}K monthly"
+
+
+def create_database(path, seed_files=SEED_FILES):
+    """Create the schema at path and load the seed snapshots; a half-built database is never left at path"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(SCHEMA)
+    conn.close()
+    for seed in seed_files:
+        if os.path.exists(seed):
+            load_snapshots(tmp_path, seed)
+    os.replace(tmp_path, path)
+
+
+def _records(reader, table):
+    columns = TABLE_COLUMNS[table]
+    for row in reader:
+        values = []
+        for column in columns:
+            value = (row.get(column) or "").strip()
+            if column in ("product", "niche", "audience"):
+                value = normalize_key(value)
+            elif column in NUMERIC_COLUMNS:
+                value = float(value.replace("$", "").replace(",", "")) if value else None
+            values.append(value)
+        yield values
+
+
+def load_records(path, table, records, batch_size=50_000):
+    """Insert rows (sequences in TABLE_COLUMNS[table] order) in one transaction; returns the count"""
+    columns = TABLE_COLUMNS[table]
+    sql = f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    loaded = 0
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SCHEMA)
+        # A failed load rolls back as a whole, so the journal is all the durability it needs
+        conn.execute("PRAGMA synchronous = OFF")
+        with conn:
+            iterator = iter(records)
+            while True:
+                batch = [row for _, row in zip(range(batch_size), iterator)]
+                if not batch:
+                    break
+                conn.executemany(sql, batch)
+                loaded += len(batch)
+            conn.execute("INSERT INTO loads (loaded_at, table_name, rows) VALUES (?, ?, ?)",
+                         (datetime.now().isoformat(timespec="seconds"), table, loaded))
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+    return loaded
+
+
+def load_snapshots(path, csv_path, batch_size=50_000):
+    """Bulk-load a market or competitor snapshot CSV, streamed; returns (table, rows loaded)"""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        table = "competitor_prices" if "competitor" in (reader.fieldnames or ()) else "markets"
+        missing = set(TABLE_COLUMNS[table][:4]) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{csv_path} is missing columns: {', '.join(sorted(missing))}")
+        return table, load_records(path, table, _records(reader, table), batch_size)
+
+
+class MarketDataStore:
+    """Read side of the market database, with an LRU of finished analyses.
+
+    Each thread gets its own read-only connection (tools run on bulkhead
+    threads). A lookup probes the primary-key indexes from the most to the
+    least specific key, so its cost does not grow with the table size.
+    """
+
+    def __init__(self, path=MARKET_DB_PATH, max_entries=4096):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if not os.path.exists(path):
+            create_database(path)
+        else:
+            # Databases from before the loads table get it here, while a writable connection is at hand
+            conn = sqlite3.connect(path)
+            conn.executescript(SCHEMA)
+            conn.close()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            uri = pathlib.Path(self.path).resolve().as_uri() + "?mode=ro"
+            conn = self._local.conn = sqlite3.connect(uri, uri=True)
+        return conn
+
+    def data_version(self):
+        """Number of the latest load; cached analyses from before it are stale"""
+        return self._connection().execute(_VERSION_SQL).fetchone()[0]
+
+    def analysis(self, product_name, niche, target_audience="general"):
+        """analyze_market_competition figures for a product: DEFAULT_ANALYSIS overlaid with the closest snapshots"""
+        keys = candidate_keys(product_name, niche, target_audience)
+        version = self.data_version()
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            if keys[0] in self._entries:
+                self._entries.move_to_end(keys[0])
+                self.hits += 1
+                return self._entries[keys[0]]
+
+        start = time.perf_counter()
+        analysis = self._lookup(keys)
+        with self._lock:
+            self.misses += 1
+            self.miss_seconds += time.perf_counter() - start
+            # Another thread has seen a newer load meanwhile, and this analysis may predate it
+            if version == self._version:
+                self._entries[keys[0]] = analysis
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return analysis
+
+    def _lookup(self, keys):
+        conn = self._connection()
+        analysis = dict(DEFAULT_ANALYSIS)
+        for key in keys:
+            params = [value for value in key if value is not None]
+            row = conn.execute(_key_sql(_MARKET_SQL, key), params).fetchone()
+            if row is None:
+                continue
+            captured, size, growth, saturation, level, opportunity, platforms, demographics, seasonality = row
+            updates = {
+                "snapshot": captured,
+                "market_size": format_market_size(size) if size is not None else None,
+                "market_growth": f"{growth:+g}% YoY" if growth is not None else None,
+                "saturation": f"{saturation:g}%" if saturation is not None else None,
+                "competition_level": level or None,
+                "opportunity_score": f"{opportunity:.1f}/10" if opportunity is not None else None,
+                "best_platforms": platforms.split("|") if platforms else None,
+                "target_demographics": demographics or None,
+                "seasonal_trends": seasonality or None,
+            }
+            analysis.update((field, value) for field, value in updates.items() if value is not None)
+            break
+        for key in keys:
+            params = [value for value in key if value is not None]
+            prices = conn.execute(_key_sql(_PRICES_SQL, key), params).fetchall()
+            if not prices:
+                continue
+            values = [price for _, price in prices]
+            analysis["top_players"] = [competitor for competitor, _ in prices[:3]]
+            analysis["avg_price"] = f"${sum(values) / len(values):.2f}"
+            analysis["price_range"] = f"${min(values):.0f}-${max(values):.0f}"
+            break
+        return analysis
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "avg_miss_ms": self.miss_seconds / self.misses * 1000 if self.misses else 0.0,
+            }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_market_data() -> MarketDataStore:
+    """Process-wide market store on MARKET_DB_PATH, created from the seed snapshots if missing"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MarketDataStore()
+        return _store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("snapshots", nargs="+", help="market or competitor snapshot CSVs")
+    parser.add_argument("--db", default=MARKET_DB_PATH)
+    parser.add_argument("--batch-size", type=int, default=50_000, help="rows per executemany")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        create_database(args.db, seed_files=())
+    for csv_path in args.snapshots:
+        start = time.perf_counter()
+        table, loaded = load_snapshots(args.db, csv_path, args.batch_size)
+        seconds = time.perf_counter() - start
+        print(f"{csv_path}: {loaded} rows into {table} in {seconds:.2f}s ({loaded / seconds:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import os
+import threading
+import time
+from datetime import date
+
+from agents import Agent, AsyncOpenAI, OpenAIChatCompletionsModel, Runner
+from agents.run import RunConfig
+
+from bulkhead import get_bulkheads
+from market_data import get_market_data
+from prompt_compaction import compact_instructions
+from runtime import get_runtime
+from speculation import get_speculator
+from telemetry import current_turn
+from tool_cache import get_tool_cache
+from tools import (
+    analyze_market_competition,
+    create_marketing_strategy,
+    find_suppliers_and_calculate_profits,
+    generate_product_copy,
+    get_trending_products,
+    seasonal_opportunity_finder,
+)
+
+MODEL_NAME = "gemini-2.0-flash"
+# GEMINI_BASE_URL points the client elsewhere, e.g. at stub_server.py for offline load tests
+BASE_URL = os.environ.get("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta/openai/")
+
+# Part of the response cache key, so any edit starts it cold
+INSTRUCTIONS = """
+            You are the ULTIMATE Master Dropshipping AI Agent - the most advanced dropshipping expert in the world!
+
+            🎯 YOUR MISSION: Help users dominate the dropshipping market with data-driven insights and actionable strategies.
+
+            🧠 YOUR EXPERTISE:
+            - Advanced product research and trend analysis
+            - Comprehensive market competition analysis  
+            - Supplier sourcing with profit optimization
+            - High-converting marketing strategies
+            - Professional copywriting and product descriptions
+            - Seasonal opportunity identification
+            - ROI optimization and profit maximization
+
+            💪 YOUR PERSONALITY:
+            - Expert-level knowledge with practical insights
+            - Data-driven recommendations with specific numbers
+            - Motivational and results-focused approach
+            - Professional yet friendly communication style
+            - Always provide actionable next steps
+
+            📊 YOUR RESPONSE STYLE:
+            - Use emojis for visual appeal and engagement
+            - Provide specific metrics, percentages, and dollar amounts
+            - Give step-by-step actionable guidance
+            - Include real-world examples and case studies
+            - Always end with clear next action steps
+
+            🔥 YOUR CORE FUNCTIONS:
+            1. Product Research & Analysis
+            2. Market Competition Intelligence  
+            3. Supplier Sourcing & Profit Calculation
+            4. Marketing Strategy Development
+            5. High-Converting Copy Creation
+            6. Seasonal Trend Forecasting
+
+            🚀 ALWAYS AIM TO:
+            - Maximize user's profit potential
+            - Reduce risks and optimize success rates
+            - Provide cutting-edge dropshipping strategies
+            - Help users stay ahead of market trends
+            - Deliver actionable, implementable advice
+            and gave reponse in just haikus 
+
+            Remember: You're not just giving advice - you're helping build successful dropshipping empires! 💰
+            """
+
+
+# "original", or "compact" for the prompt_compaction version of INSTRUCTIONS
+INSTRUCTIONS_VARIANT = os.environ.get("DROPSHIP_INSTRUCTIONS", "original")
+
+# Start the tool calls a prompt will likely need while the first model call is in flight;
+# DROPSHIP_SPECULATE=0 turns it off
+SPECULATE = os.environ.get("DROPSHIP_SPECULATE", "1") != "0"
+
+
+# (calls at once, timeout seconds) per tool; each tool runs on its own threads so a
+# slow one only queues its own calls
+TOOL_BULKHEADS = {
+    "get_trending_products": (4, 5.0),
+    "analyze_market_competition": (4, 5.0),
+    "find_suppliers_and_calculate_profits": (4, 5.0),
+    "create_marketing_strategy": (2, 5.0),
+    "generate_product_copy": (2, 5.0),
+    "seasonal_opportunity_finder": (2, 5.0),
+}
+
+
+# Seconds a chat turn may take before it is cancelled, model calls and tools included
+TURN_DEADLINE_SECONDS = float(os.environ.get("DROPSHIP_TURN_DEADLINE", "90"))
+
+
+def data_stamp():
+    """What an answer depends on besides the prompt and the agent: today's date and the loaded market data"""
+    return [date.today().isoformat(), get_market_data().data_version()]
+
+
+def agent_instructions(variant=INSTRUCTIONS_VARIANT):
+    if variant == "compact":
+        return compact_instructions(INSTRUCTIONS)
+    return INSTRUCTIONS
+
+
+def build_master_agent(client, instructions=None):
+    """Master Dropshipping AI agent and run config on top of an AsyncOpenAI client"""
+    instructions = instructions if instructions is not None else agent_instructions()
+    model = OpenAIChatCompletionsModel(
+        model=MODEL_NAME,
+        openai_client=client
+    )
+
+    config = RunConfig(
+        model=model,
+        model_provider=client,
+        tracing_disabled=True
+    )
+
+    # Tool results are pure functions of their arguments (and of the day or the loaded market data
+    # for the tools that vary_on them), memoize them across sessions.
+    # Misses run on the tool's bulkhead, off the event loop, so one step's calls overlap.
+    # A call predicted by the speculator takes the speculative result instead of running again.
+    tool_cache = get_tool_cache()
+    bulkheads = get_bulkheads()
+    speculator = get_speculator()
+
+    def isolated(tool):
+        limit, timeout = TOOL_BULKHEADS[tool.name]
+        guarded = bulkheads.wrap(tool, limit, timeout)
+        return speculator.wrap(guarded, tool, timeout) if SPECULATE else guarded
+
+    tools = [
+        tool_cache.wrap(isolated(get_trending_products)),
+        tool_cache.wrap(isolated(analyze_market_competition), vary_on=lambda: get_market_data().data_version()),
+        tool_cache.wrap(isolated(find_suppliers_and_calculate_profits)),
+        tool_cache.wrap(isolated(create_marketing_strategy)),
+        tool_cache.wrap(isolated(generate_product_copy)),
+        # The default month and the look-ahead window come from the clock, so today's date is part of the key
+        tool_cache.wrap(isolated(seasonal_opportunity_finder), vary_on=lambda: date.today().isoformat())
+    ]
+
+    agent = Agent(
+        name="Master Dropshipping AI",
+        instructions=instructions,
+        tools=tools,
+        # No output_type: a json_schema response_format next to tools is not reliably accepted by
+        # Gemini's OpenAI-compatible endpoint, so replies stay text and output.response_text reads them
+    )
+    return agent, config
+
+
+class SharedAgent:
+    """The agent, its run config and its client, built once and shared by every session.
+
+    Agent and RunConfig are never mutated by a run, so concurrent sessions can
+    use them as-is; per-session state is only the conversation. The client's
+    connection pool lives on the process-wide runtime loop, so pre-warming it
+    once pays the DNS/TCP/TLS setup before the first user turn does.
+    """
+
+    def __init__(self, api_key=None, base_url=BASE_URL, instructions=None):
+        started = time.perf_counter()
+        self.client = AsyncOpenAI(
+            api_key=api_key if api_key is not None else os.environ.get("GEMINI_API_KEY"),
+            base_url=base_url,
+        )
+        self.agent, self.config = build_master_agent(self.client, instructions)
+        self.build_seconds = time.perf_counter() - started
+        self.prewarm_seconds = None
+        self.prewarm_error = None
+        self._prewarm = None
+        self._lock = threading.Lock()
+
+    def prewarm(self):
+        """Open a pooled connection to the model endpoint in the background.
+
+        Returns the future of the warm-up request; calling it again reuses it.
+        Failures are recorded, not raised, the first real turn just pays the setup.
+        """
+        with self._lock:
+            if self._prewarm is None:
+                self._prewarm = get_runtime().submit(self._warm_up())
+            return self._prewarm
+
+    async def _warm_up(self):
+        started = time.perf_counter()
+        try:
+            # Cheapest authenticated request on the same pool the model calls use
+            await self.client.models.list()
+        except Exception as e:
+            self.prewarm_error = str(e)
+        finally:
+            self.prewarm_seconds = time.perf_counter() - started
+
+    @property
+    def warm(self):
+        return self._prewarm is not None and self._prewarm.done() and self.prewarm_error is None
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_agent(prewarm=True) -> SharedAgent:
+    """Process-wide shared agent, built (and pre-warmed) by the first caller"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SharedAgent()
+            if prewarm:
+                _shared.prewarm()
+        return _shared
+
+
+def run_agent_sync(agent, user_input, config, telemetry=None, token=None):
+    """Run agent synchronously on the persistent runtime loop; a CancelToken can stop it (TurnCancelled)"""
+    async def run():
+        current_turn.set(telemetry)
+        speculation = get_speculator().start(agent, user_input)
+        try:
+            return await Runner.run(agent, user_input, run_config=config, hooks=telemetry)
+        finally:
+            speculation.close()
+
+    return get_runtime().run(run(), token=token)
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import math
+import threading
+
+# Default number of tokens of conversation (summary + recent turns + the new message) sent per turn
+DEFAULT_BUDGET_TOKENS = 2000
+
+# Share of the budget the rolling summary may use before its oldest lines are dropped
+SUMMARY_SHARE = 0.25
+
+# Characters kept from each side of a turn when it is rolled into the summary
+SUMMARY_USER_CHARS = 160
+SUMMARY_ANSWER_CHARS = 240
+
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token for English)"""
+    return math.ceil(len(text) / 4) if text else 0
+
+
+def item_tokens(item):
+    """Estimated tokens of one Runner input item, including a small per-message overhead"""
+    if item.get("type") == "function_call":
+        text = item.get("name", "") + item.get("arguments", "")
+    elif item.get("type") == "function_call_output":
+        text = str(item.get("output", ""))
+    else:
+        text = str(item.get("content", ""))
+    return estimate_tokens(text) + 4
+
+
+def _clip(text, limit):
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+class ConversationMemory:
+    """Token-budgeted conversation context for one chat session.
+
+    Recent turns are sent verbatim. When the context outgrows the budget, tool
+    calls and their bulky outputs are dropped first, oldest turn first, then the
+    oldest turns are rolled into a running summary: one clipped line per turn,
+    appended as turns leave the window, so the summary is updated incrementally
+    instead of being rebuilt. The summary itself is capped at SUMMARY_SHARE of
+    the budget by forgetting its oldest lines.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET_TOKENS):
+        self.budget = budget
+        self.turns = []
+        self.summary_lines = []
+        self.forgotten_turns = 0
+        self._lock = threading.Lock()
+
+    def add_turn(self, user_input, answer, run_result=None):
+        """Remember a finished turn; tool calls and outputs come from the run, if there was one"""
+        items = [{"role": "user", "content": user_input}]
+        if run_result is not None:
+            for item in run_result.new_items:
+                if item.type in ("tool_call_item", "tool_call_output_item"):
+                    items.append(item.to_input_item())
+        # The reply the user saw, not the typed JSON the model produced
+        items.append({"role": "assistant", "content": answer})
+        with self._lock:
+            self.turns.append({"user": user_input, "answer": answer, "items": items})
+
+    def clear(self):
+        with self._lock:
+            self.turns = []
+            self.summary_lines = []
+            self.forgotten_turns = 0
+
+    def _summary_item(self):
+        if not self.summary_lines:
+            return None
+        header = "Summary of the earlier conversation"
+        if self.forgotten_turns:
+            header += f" ({self.forgotten_turns} older turns omitted)"
+        return {"role": "system", "content": header + ":\n" + "\n".join(self.summary_lines)}
+
+    def _roll_oldest(self):
+        turn = self.turns.pop(0)
+        self.summary_lines.append(
+            f"- User: {_clip(turn['user'], SUMMARY_USER_CHARS)} | Assistant: {_clip(turn['answer'], SUMMARY_ANSWER_CHARS)}"
+        )
+        summary_budget = int(self.budget * SUMMARY_SHARE)
+        while len(self.summary_lines) > 1 and sum(estimate_tokens(line) for line in self.summary_lines) > summary_budget:
+            self.summary_lines.pop(0)
+            self.forgotten_turns += 1
+
+    def _drop_tool_items(self):
+        """Strip tool calls and outputs from the oldest turn that still has them"""
+        for turn in self.turns:
+            if len(turn["items"]) > 2:
+                turn["items"] = [turn["items"][0], turn["items"][-1]]
+                return True
+        return False
+
+    def build_input(self, user_input):
+        """(input items, estimated tokens) for Runner.run, kept within the budget.
+
+        Only an oversized new message alone can exceed it; it is always sent whole.
+        """
+        message = {"role": "user", "content": user_input}
+        with self._lock:
+            while True:
+                summary = self._summary_item()
+                items = ([summary] if summary else []) + [item for turn in self.turns for item in turn["items"]]
+                tokens = sum(item_tokens(item) for item in items) + item_tokens(message)
+                if tokens <= self.budget:
+                    break
+                if self._drop_tool_items():
+                    continue
+                if self.turns:
+                    self._roll_oldest()
+                    continue
+                if self.summary_lines:
+                    self.summary_lines.pop(0)
+                    self.forgotten_turns += 1
+                    continue
+                break
+        return items + [message], tokens
+
+    def context_key(self):
+        """Digest of the remembered context, '' for a fresh conversation"""
+        with self._lock:
+            if not self.turns and not self.summary_lines:
+                return ""
+            payload = json.dumps([self.summary_lines, [turn["items"] for turn in self.turns]],
+                                 ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
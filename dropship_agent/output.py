@@ -0,0 +1,39 @@
+import json
+
+
+def response_text(run_result):
+    """Reply text from a finished run, or None if the run produced nothing usable"""
+    output = run_result.final_output
+    if not isinstance(output, str):
+        return None
+    text = reply_text(output).strip()
+    return text or None
+
+
+def reply_text(text):
+    """The reply in a model's text output: the answer of a JSON {"answer": ...} reply, else the text unchanged"""
+    if not text.lstrip().startswith("{"):
+        return text
+    try:
+        document = json.loads(text)
+    except ValueError:
+        # Prose that opens with a brace, or a JSON reply still streaming in
+        return text
+    if isinstance(document, dict) and isinstance(document.get("answer"), str):
+        return document["answer"]
+    return text
+
+
+def fallback_response(user_input):
+    """Contextual reply used when the agent produced no usable text"""
+    # Generate contextual response based on user input
+    user_lower = user_input.lower()
+    if any(greeting in user_lower for greeting in ['assalam', 'salam', 'hello', 'hi']):
+        return "Walaikum Assalam! I'm your Master Dropshipping AI assistant. How can I help you build your dropshipping business today?"
+    elif any(word in user_lower for word in ['product', 'find', 'search']):
+        return "I'd be happy to help you find profitable dropshipping products! What category or price range are you interested in?"
+    elif any(word in user_lower for word in ['profit', 'calculate', 'money']):
+        return "Let me help you calculate profits for your dropshipping business. What's your product cost and selling price?"
+    else:
+        return "I'm here to help you with your dropshipping business! Ask me about product research, profit calculations, market analysis, or any other dropshipping questions."
+
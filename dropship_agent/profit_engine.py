@@ -0,0 +1,129 @@
+"""Vectorized supplier profit engine.
+
+Screen a whole catalog from dropship_agent/:
+    python profit_engine.py --volume 100 --out best_suppliers.csv
+"""
+import argparse
+import csv
+
+import numpy as np
+
+SUPPLIERS = [
+    {
+        "name": "AliExpress Gold Supplier",
+        "cost_ratio": 0.35,
+        "shipping_cost": 2.50,
+        "processing_time": "2-3 days",
+        "shipping_time": "8-15 days",
+        "rating": "4.9/5",
+        "min_order": "1 piece",
+        "reliability": "Excellent"
+    },
+    {
+        "name": "DHgate Verified Pro",
+        "cost_ratio": 0.32,
+        "shipping_cost": 3.20,
+        "processing_time": "1-2 days",
+        "shipping_time": "10-18 days",
+        "rating": "4.7/5",
+        "min_order": "5 pieces",
+        "reliability": "Very Good"
+    },
+    {
+        "name": "Global Sources Premium",
+        "cost_ratio": 0.38,
+        "shipping_cost": 1.80,
+        "processing_time": "1 day",
+        "shipping_time": "5-12 days",
+        "rating": "4.8/5",
+        "min_order": "10 pieces",
+        "reliability": "Excellent"
+    }
+]
+
+# Shopify fee is 2.9% + $0.30 per order, payment processing another 2.5%
+PLATFORM_FEE_RATE = 0.029
+PLATFORM_FEE_FIXED = 0.30
+PAYMENT_FEE_RATE = 0.025
+
+
+def calculate_profits(products, target_prices, monthly_volumes=100, suppliers=SUPPLIERS):
+    """Profit table for every (product, supplier) pair.
+
+    products, target_prices and monthly_volumes are equal-length sequences
+    (a scalar volume applies to every product). Returns a dict of 1-D NumPy
+    columns with len(products) * len(suppliers) rows, product-major.
+    """
+    prices = np.asarray(target_prices, dtype=float).reshape(-1, 1)
+    volumes = np.broadcast_to(np.asarray(monthly_volumes, dtype=float), prices.shape[:1]).reshape(-1, 1)
+    ratios = np.array([s["cost_ratio"] for s in suppliers], dtype=float)
+    shipping = np.array([s["shipping_cost"] for s in suppliers], dtype=float)
+
+    unit_cost = np.round(prices * ratios, 2)
+    total_cost = unit_cost + shipping
+    fees = np.broadcast_to(prices * (PLATFORM_FEE_RATE + PAYMENT_FEE_RATE) + PLATFORM_FEE_FIXED, unit_cost.shape)
+    net_profit = prices - total_cost - fees
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin = np.where(prices > 0, net_profit / prices * 100, 0.0)
+    monthly_profit = net_profit * volumes
+
+    n_products, n_suppliers = unit_cost.shape
+    return {
+        "product": np.repeat(np.asarray(products, dtype=object), n_suppliers),
+        "supplier": np.tile(np.arange(n_suppliers), n_products),
+        "target_price": np.repeat(prices.ravel(), n_suppliers),
+        "monthly_volume": np.repeat(volumes.ravel(), n_suppliers),
+        "unit_cost": unit_cost.ravel(),
+        "shipping_cost": np.broadcast_to(shipping, unit_cost.shape).ravel(),
+        "total_cost": total_cost.ravel(),
+        "fees": fees.ravel(),
+        "net_profit": net_profit.ravel(),
+        "margin": margin.ravel(),
+        "monthly_profit": monthly_profit.ravel(),
+    }
+
+
+def best_suppliers(table):
+    """One row per product: the supplier with the highest monthly profit"""
+    n_suppliers = int(table["supplier"].max()) + 1 if len(table["supplier"]) else 1
+    monthly = table["monthly_profit"].reshape(-1, n_suppliers)
+    best = monthly.argmax(axis=1)
+    rows = np.arange(monthly.shape[0]) * n_suppliers + best
+    return {column: values[rows] for column, values in table.items()}
+
+
+def table_rows(table):
+    """Iterate a column table as row dicts"""
+    columns = list(table)
+    for values in zip(*(table[c] for c in columns)):
+        yield dict(zip(columns, values))
+
+
+def screen_catalog(catalog, monthly_volume=100, suppliers=SUPPLIERS):
+    """Best supplier for every product in a ProductCatalog at its listed sell price"""
+    table = calculate_profits(catalog.names, catalog.prices, monthly_volume, suppliers)
+    return best_suppliers(table)
+
+
+def main():
+    from catalog import get_catalog
+
+    parser = argparse.ArgumentParser(description="Best supplier per catalog product")
+    parser.add_argument("--volume", type=int, default=100, help="monthly units per product")
+    parser.add_argument("--out", default="best_suppliers.csv")
+    args = parser.parse_args()
+
+    summary = screen_catalog(get_catalog(), args.volume)
+    with open(args.out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["product", "supplier", "target_price", "net_profit", "margin", "monthly_profit"])
+        for row in table_rows(summary):
+            writer.writerow([
+                row["product"], SUPPLIERS[row["supplier"]]["name"], f"{row['target_price']:.2f}",
+                f"{row['net_profit']:.2f}", f"{row['margin']:.1f}", f"{row['monthly_profit']:.2f}",
+            ])
+    print(f"Wrote {len(summary['product'])} products to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
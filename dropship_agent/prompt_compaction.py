@@ -0,0 +1,90 @@
+"""Compact agent instructions into a minimal equivalent prompt.
+
+Run from dropship_agent/:  python prompt_compaction.py
+prints the compacted Master Dropshipping AI instructions with token and coverage figures.
+"""
+import argparse
+import re
+import textwrap
+
+from memory import estimate_tokens
+
+# Emoji, pictographs, dingbats, variation selectors and joiners
+_DECORATION = re.compile("[\U0001F000-\U0001FAFF☀-➿⬀-⯿️‍]")
+_BULLET = re.compile(r"^(?:[-*•]|\d+[.)])\s+")
+_HEADER = re.compile(r"^(?:YOUR\s+)?([A-Z][A-Z' ]+?)\s*:\s*(.*)$")
+_WORD = re.compile(r"[a-z0-9$%']+")
+_STOPWORDS = {"your", "the", "a", "an", "and", "to", "of", "with", "in", "for", "you", "are", "is"}
+
+
+def _header(line):
+    """(title, rest) for an all-caps section header like 'YOUR MISSION: ...', else None"""
+    match = _HEADER.match(line)
+    if not match:
+        return None
+    return match.group(1).strip().capitalize(), match.group(2).strip()
+
+
+def compact_instructions(text):
+    """Minimal equivalent of an instruction prompt.
+
+    Drops indentation, blank lines, emoji and exact duplicate lines, shortens
+    'YOUR SECTION:' headers to 'Section:' and folds each header's bullet list
+    into one '; '-separated line. Every instruction sentence is kept verbatim.
+    """
+    lines, seen = [], set()
+    title, items = None, []
+
+    def flush():
+        nonlocal title, items
+        if title is not None:
+            lines.append(f"{title}: {'; '.join(items)}." if items else f"{title}:")
+        title, items = None, []
+
+    for raw in textwrap.dedent(text).splitlines():
+        line = " ".join(_DECORATION.sub("", raw).split())
+        if not line or line.lower() in seen:
+            continue
+        seen.add(line.lower())
+
+        header = _header(line)
+        if header and not header[1]:
+            # A header introducing a list
+            flush()
+            title = header[0]
+        elif _BULLET.match(line) and title is not None:
+            items.append(_BULLET.sub("", line).rstrip(".;"))
+        else:
+            flush()
+            lines.append(f"{header[0]}: {header[1]}" if header else line)
+    flush()
+    return "\n".join(lines)
+
+
+def content_words(text):
+    # List numbering is layout, not content
+    text = "\n".join(_BULLET.sub("", line.strip()) for line in text.splitlines())
+    return {word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS}
+
+
+def coverage(original, compacted):
+    """Share of the original's content words still present in the compacted prompt"""
+    words = content_words(original)
+    return len(words & content_words(compacted)) / len(words) if words else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    from master_agent import INSTRUCTIONS
+
+    compacted = compact_instructions(INSTRUCTIONS)
+    print(compacted)
+    print(f"\ntokens {estimate_tokens(INSTRUCTIONS)} -> {estimate_tokens(compacted)} "
+          f"| characters {len(INSTRUCTIONS)} -> {len(compacted)} "
+          f"| content words kept {coverage(INSTRUCTIONS, compacted):.0%}")
+
+
+if __name__ == "__main__":
+    main()
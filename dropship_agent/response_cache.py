@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "responses")
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def normalize_prompt(prompt):
+    """Lowercase and collapse whitespace so trivially different prompts share a key"""
+    return " ".join(prompt.lower().split())
+
+
+def agent_fingerprint(agent, config):
+    """Hash of everything besides the prompt that shapes the answer"""
+    model = getattr(config.model, "model", config.model) if config else None
+    tools = sorted(
+        (tool.name, json.dumps(getattr(tool, "params_json_schema", {}), sort_keys=True))
+        for tool in agent.tools
+    )
+    output_type = getattr(agent, "output_type", None)
+    payload = json.dumps(
+        [str(model), agent.instructions, tools, getattr(output_type, "__name__", str(output_type))],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Exact-match cache of final agent responses: in-memory LRU over an on-disk tier"""
+
+    def __init__(self, max_entries=256, ttl=DEFAULT_TTL_SECONDS, cache_dir=CACHE_DIR):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.sweep()
+
+    def key(self, prompt, agent, config, vary=None):
+        """Key of a prompt's answer; vary holds whatever else the answer depends on (e.g. today's date)"""
+        raw = f"{agent_fingerprint(agent, config)}\n{normalize_prompt(prompt)}"
+        if vary is not None:
+            raw += "\n" + json.dumps(vary, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Cached response text for a key, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry["created"] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry["response"]
+
+        entry = None
+        if self.cache_dir:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+
+        with self._lock:
+            if entry and now - entry["created"] < self.ttl:
+                self._remember(key, entry)
+                self.hits += 1
+                self.disk_hits += 1
+                return entry["response"]
+            self._entries.pop(key, None)
+            self.misses += 1
+        if entry:
+            self._remove(key)
+        return None
+
+    def put(self, key, response):
+        entry = {"created": time.time(), "response": response}
+        with self._lock:
+            self._remember(key, entry)
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+
+    def _remove(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def sweep(self):
+        """Delete expired entries from the disk tier; returns how many were removed"""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        cutoff = time.time() - self.ttl
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                # Written once, so the file's mtime is the entry's creation time
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            hits, disk_hits, misses, entries = self.hits, self.disk_hits, self.misses, len(self._entries)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide response cache shared by every session"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
@@ -0,0 +1,188 @@
+import asyncio
+import queue
+import threading
+import concurrent.futures
+
+
+_DONE = object()
+
+
+class TurnCancelled(Exception):
+    """A run stopped through its CancelToken; reason is "cancelled" (user) or "timeout" (deadline)"""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancelToken:
+    """Stops the runtime tasks of one turn on request, or once its deadline (seconds) passes"""
+
+    def __init__(self, deadline=None):
+        self.deadline = deadline
+        self.reason = None
+        self._closed = False
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._timer = None
+        if deadline:
+            self._timer = threading.Timer(deadline, self.cancel, args=("timeout",))
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def cancelled(self):
+        return self.reason is not None
+
+    def cancel(self, reason="cancelled"):
+        with self._lock:
+            if self._closed or self.reason is not None:
+                return
+            self.reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+        if self._timer is not None:
+            self._timer.cancel()
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback):
+        """Call callback() on cancellation, right away if that already happened"""
+        with self._lock:
+            if self.reason is None:
+                if not self._closed:
+                    self._callbacks.append(callback)
+                return
+        callback()
+
+    def close(self):
+        """The turn is over: disarm the deadline, later cancel() calls do nothing"""
+        with self._lock:
+            self._closed = True
+            self._callbacks = []
+        if self._timer is not None:
+            self._timer.cancel()
+
+
+class AgentRuntime:
+    """One background thread owning one asyncio event loop for agent runs.
+
+    Streamlit re-executes the script on every interaction, but imported modules
+    live for the whole process, so the loop (and the HTTP keep-alive connections
+    the AsyncOpenAI client opens on it) survives across chat turns.
+    """
+
+    def __init__(self, name="dropship-agent-loop"):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self):
+        self.start()
+        return self._loop
+
+    def start(self):
+        """Start the loop thread if it is not running yet"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            ready = threading.Event()
+            self._loop = asyncio.new_event_loop()
+
+            def run_loop():
+                asyncio.set_event_loop(self._loop)
+                self._loop.call_soon(ready.set)
+                self._loop.run_forever()
+
+            self._thread = threading.Thread(target=run_loop, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def submit(self, coro, token=None) -> concurrent.futures.Future:
+        """Schedule a coroutine on the background loop and return its future.
+
+        With a CancelToken, cancelling it cancels the task on the loop, and with
+        it whatever the task awaits (e.g. an in-flight HTTP request). The future
+        alone cannot do that once the task has started.
+        """
+        if token is not None:
+            coro = self._cancellable(coro, token)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def _cancellable(self, coro, token):
+        task = asyncio.current_task()
+        token.on_cancel(lambda: self._loop.call_soon_threadsafe(task.cancel))
+        return await coro
+
+    def run(self, coro, timeout=None, token=None):
+        """Run a coroutine on the background loop and wait for its result.
+
+        Raises TurnCancelled if the token stopped it first.
+        """
+        future = self.submit(coro, token)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.CancelledError:
+            if token is not None and token.cancelled:
+                raise TurnCancelled(token.reason) from None
+            raise
+
+    def iterate(self, agen, token=None):
+        """Consume an async iterator on the background loop as a plain generator.
+
+        Raises TurnCancelled if the token stopped it before it was exhausted.
+        """
+        items = queue.Queue()
+
+        async def pump():
+            try:
+                async for item in agen:
+                    items.put(item)
+            finally:
+                items.put(_DONE)
+
+        future = self.submit(pump(), token)
+        if token is not None:
+            # A cancelled pump may never reach its finally, don't wait for it
+            token.on_cancel(lambda: items.put(_DONE))
+        try:
+            while True:
+                item = items.get()
+                if item is _DONE:
+                    break
+                yield item
+            # Re-raise anything the stream failed with
+            try:
+                future.result()
+            except concurrent.futures.CancelledError:
+                if token is None or not token.cancelled:
+                    raise
+            if token is not None and token.cancelled:
+                raise TurnCancelled(token.reason)
+        finally:
+            future.cancel()
+
+    def stop(self):
+        """Stop the loop and join its thread"""
+        with self._lock:
+            if self._thread is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AgentRuntime:
+    """Process-wide agent runtime, created on first use"""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AgentRuntime()
+        return _runtime
@@ -0,0 +1,112 @@
+import bisect
+import calendar
+import json
+import os
+import threading
+from datetime import date, timedelta
+
+from catalog import DATA_DIR
+
+SEASONAL_PATH = os.environ.get("DROPSHIP_SEASONAL_PATH", os.path.join(DATA_DIR, "seasonal.json"))
+
+_WEEKDAYS = {name.lower(): i for i, name in enumerate(calendar.day_name)}
+
+
+def event_date(spec, year):
+    """Peak day of an event in a year: 'MM-DD', or {month, weekday, nth[, offset_days]} for moving holidays"""
+    if isinstance(spec, str):
+        month, day = (int(part) for part in spec.split("-"))
+        return date(year, month, day)
+    first = date(year, spec["month"], 1)
+    weekday = _WEEKDAYS[spec["weekday"].lower()]
+    day = first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (spec["nth"] - 1))
+    return day + timedelta(days=spec.get("offset_days", 0))
+
+
+class SeasonalIndex:
+    """Month profiles and holiday peak windows, indexed for lookups and date-range queries.
+
+    Months resolve through a dict of names, abbreviations and numbers. Peak
+    windows are expanded per calendar year on first use and kept sorted by
+    window start, so a range query is a bisect plus the windows it returns.
+    """
+
+    def __init__(self, data):
+        self.months = {}
+        self._month_keys = {}
+        for number, name in enumerate(calendar.month_name[1:], 1):
+            self.months[name] = data["months"][name]
+            for key in (name, calendar.month_abbr[number], str(number)):
+                self._month_keys[key.lower()] = name
+        self.events = data["events"]
+        # A window that started this many days before a query can still be open
+        self.max_window = max((event["window_days"] for event in self.events), default=0)
+        self._by_year = {}
+        self._lock = threading.Lock()
+
+    def month(self, month):
+        """(month name, profile) for 'March', 'mar' or '3', else None"""
+        name = self._month_keys.get(str(month).strip().lower())
+        return (name, self.months[name]) if name else None
+
+    def _year(self, year):
+        """(window starts, windows) for peak windows opening in a year, sorted by start"""
+        with self._lock:
+            if year not in self._by_year:
+                windows = []
+                # Early-January peaks open in the previous December
+                for event_year in (year, year + 1):
+                    for event in self.events:
+                        peak = event_date(event["date"], event_year)
+                        start = peak - timedelta(days=event["window_days"])
+                        if start.year == year:
+                            windows.append({
+                                "name": event["name"],
+                                "start": start,
+                                "peak": peak,
+                                "launch_by": peak - timedelta(days=event["lead_days"]),
+                                "trends": event["trends"],
+                                "competition": event["competition"],
+                            })
+                windows.sort(key=lambda window: window["start"])
+                self._by_year[year] = ([window["start"] for window in windows], windows)
+            return self._by_year[year]
+
+    def peaks_between(self, first, last):
+        """Peak windows overlapping first..last (inclusive), soonest to open first"""
+        earliest = first - timedelta(days=self.max_window)
+        found = []
+        for year in range(earliest.year, last.year + 1):
+            starts, windows = self._year(year)
+            lo = bisect.bisect_left(starts, earliest)
+            hi = bisect.bisect_right(starts, last)
+            found.extend(window for window in windows[lo:hi] if window["peak"] >= first)
+        return found
+
+    def upcoming(self, today=None, days=45):
+        """Peak windows open now or opening within `days`, by lead time (days until the window opens)"""
+        today = today or date.today()
+        peaks = []
+        for window in self.peaks_between(today, today + timedelta(days=days)):
+            lead = max((window["start"] - today).days, 0)
+            peaks.append(dict(window, lead_days=lead, days_to_peak=(window["peak"] - today).days))
+        peaks.sort(key=lambda window: (window["lead_days"], window["peak"]))
+        return peaks
+
+
+def load_seasonal(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_seasonal_index() -> SeasonalIndex:
+    """Process-wide seasonal index, loaded from SEASONAL_PATH on first use"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SeasonalIndex(load_seasonal(SEASONAL_PATH))
+        return _index
@@ -0,0 +1,152 @@
+import threading
+import time
+
+from response_cache import normalize_prompt
+from runtime import CancelToken, TurnCancelled
+
+# A finished turn nobody has recorded yet stays joinable this long, so a rerun
+# that interrupted the submitting script can still pick up its answer
+FINISHED_TTL_SECONDS = 60
+
+
+def flight_key(session_id, prompt):
+    return session_id, normalize_prompt(prompt)
+
+
+class Flight:
+    """One agent turn running in the background; every submission of its prompt follows the same events"""
+
+    def __init__(self, key, telemetry=None, deadline=None):
+        self.key = key
+        self.telemetry = telemetry
+        self.token = CancelToken(deadline)
+        self.followers = 0
+        self.finished_at = None
+        self.recorded = False
+        self._events = []
+        self._cond = threading.Condition()
+
+    def publish(self, kind, payload):
+        with self._cond:
+            self._events.append((kind, payload))
+            if kind in ("done", "stopped", "error"):
+                self.finished_at = time.monotonic()
+            self._cond.notify_all()
+
+    def cancel(self):
+        """Stop the turn (the user pressed Stop); followers get a "stopped" event"""
+        self.token.cancel("cancelled")
+
+    def follow(self, poll=None):
+        """Yield the turn's (kind, payload) events from the start, then live until "done" or "stopped".
+
+        With poll (seconds), a ("waiting", None) event is yielded whenever that
+        long passes without news, so the caller gets control back while it waits.
+        An "error" event is re-raised here, in every follower.
+        """
+        seen = 0
+        while True:
+            with self._cond:
+                if seen == len(self._events) and self.finished_at is None:
+                    self._cond.wait_for(lambda: seen < len(self._events) or self.finished_at is not None, poll)
+                events = self._events[seen:]
+                seen = len(self._events)
+                finished = self.finished_at is not None
+            if not events and not finished:
+                yield "waiting", None
+                continue
+            for kind, payload in events:
+                if kind == "error":
+                    raise payload
+                yield kind, payload
+            if finished and seen == len(self._events):
+                return
+
+
+class SingleFlight:
+    """Coalesces submissions of the same prompt in the same session into one agent turn.
+
+    The first submission starts the turn on a worker thread, outside the
+    Streamlit script, so a rerun that interrupts the script does not stop it.
+    Duplicates (double clicks, reruns) attach to the running turn instead of
+    starting another. The first script to finish following it records it.
+    """
+
+    def __init__(self, ttl=FINISHED_TTL_SECONDS):
+        self.ttl = ttl
+        self.started = 0
+        self.suppressed = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def _prune(self):
+        now = time.monotonic()
+        for key, flight in list(self._flights.items()):
+            if flight.finished_at is not None and now - flight.finished_at > self.ttl:
+                del self._flights[key]
+
+    def get(self, key):
+        """The flight for key, running or finished but unrecorded, else None"""
+        with self._lock:
+            self._prune()
+            return self._flights.get(key)
+
+    def in_flight(self, key):
+        return self.get(key) is not None
+
+    def join(self, key, start, telemetry=None, deadline=None):
+        """(flight, leader): attach to the turn running for key, or start one.
+
+        start(token) returns the turn's (kind, payload) event iterator and runs
+        on the worker thread; the CancelToken stops it on Stop or after
+        `deadline` seconds. telemetry is kept on the flight for followers.
+        """
+        with self._lock:
+            self._prune()
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.followers += 1
+                self.suppressed += 1
+                return flight, False
+            flight = self._flights[key] = Flight(key, telemetry, deadline)
+            self.started += 1
+        threading.Thread(target=self._run, args=(flight, start), name="dropship-turn", daemon=True).start()
+        return flight, True
+
+    def _run(self, flight, start):
+        try:
+            for kind, payload in start(flight.token):
+                flight.publish(kind, payload)
+        except TurnCancelled as e:
+            flight.publish("stopped", e.reason)
+        except Exception as e:
+            flight.publish("error", e)
+        finally:
+            flight.token.close()
+
+    def complete(self, flight):
+        """Release a followed turn; True only for the first caller, who records it"""
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+            if flight.recorded:
+                return False
+            flight.recorded = True
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {"started": self.started, "suppressed": self.suppressed, "in_flight": len(self._flights)}
+
+
+_flights = None
+_flights_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide turn coalescer shared by every session"""
+    global _flights
+    with _flights_lock:
+        if _flights is None:
+            _flights = SingleFlight()
+        return _flights
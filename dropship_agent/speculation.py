@@ -0,0 +1,357 @@
+import asyncio
+import calendar
+import contextvars
+import dataclasses
+import json
+import math
+import re
+import threading
+import time
+
+from agents import RunContextWrapper
+
+from bulkhead import DEFAULT_TIMEOUT, Bulkhead
+from catalog import get_catalog
+from telemetry import current_turn
+from tool_cache import ToolFailure, get_tool_cache, normalize_arguments, nullable
+
+# The speculation of the turn being run, visible to the tool wrappers inside it
+current_speculation = contextvars.ContextVar("current_speculation", default=None)
+
+# Calls started ahead of the model per turn, at most
+MAX_PREDICTIONS = 3
+# Threads for speculative calls, shared by every turn; a prediction with none free is not started
+SPECULATIVE_LIMIT = 4
+# Summed keyword weight a prompt needs before a tool is predicted
+MIN_SCORE = 1.2
+
+# Docstring words that say nothing about which tool fits
+_STOPWORDS = {"and", "for", "from", "the", "with", "get", "find", "generate", "create", "multiple",
+              "dropshipping", "deep", "best", "comprehensive", "high", "converting"}
+_MONTHS = list(calendar.month_name[1:])
+_NUMBER = r"(\d[\d,]*(?:\.\d+)?)"
+
+
+def stem(word):
+    """Crude suffix stripping, enough for 'suppliers' to meet 'supplier' and 'seasonal' to meet 'season'"""
+    word = word.lower()
+    for suffix in ("ing", "al", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[:-len(suffix)]
+    return word
+
+
+def keywords(text):
+    return {stem(word) for word in re.findall(r"[a-z]+", text.lower()) if len(word) > 2 and word not in _STOPWORDS}
+
+
+def prompt_text(user_input):
+    """The newest user message of a Runner input: a string, or input items ending in one"""
+    if isinstance(user_input, str):
+        return user_input
+    for item in reversed(user_input or []):
+        if isinstance(item, dict) and item.get("role") == "user" and isinstance(item.get("content"), str):
+            return item["content"]
+    return ""
+
+
+def _number(text):
+    return float(text.replace(",", ""))
+
+
+def _product(prompt):
+    lowered = prompt.lower()
+    # A catalog product as the user typed it, longest name first so 'Wireless Earbuds Pro' beats a shorter one
+    for name in sorted(set(get_catalog().names), key=len, reverse=True):
+        start = lowered.find(name.lower())
+        if start >= 0:
+            return prompt[start:start + len(name)]
+    quoted = re.search(r"[\"“']([^\"”']{3,60})[\"”']", prompt)
+    if quoted:
+        return quoted.group(1).strip()
+    named = re.search(r"\b(?:for|on|of|about|selling|sell)\s+(?:the\s+|my\s+|a\s+)?([A-Z][\w-]*(?:\s+[A-Z][\w-]*)*)", prompt)
+    return named.group(1) if named else None
+
+
+def _category(prompt):
+    for category in sorted(set(get_catalog().categories)):
+        if re.search(rf"\b{re.escape(category)}\b", prompt, re.IGNORECASE):
+            return category
+    return None
+
+
+def _money(prompt):
+    match = re.search(r"\$\s?" + _NUMBER, prompt)
+    return _number(match.group(1)) if match else None
+
+
+def _budget(prompt):
+    match = (re.search(r"budget\D{0,12}?" + _NUMBER, prompt, re.IGNORECASE)
+             or re.search(r"\$?" + _NUMBER + r"\s*(?:ad\s+)?budget", prompt, re.IGNORECASE))
+    return _number(match.group(1)) if match else None
+
+
+def _volume(prompt):
+    match = re.search(_NUMBER + r"\s*(?:units|orders|sales|pieces)\b", prompt, re.IGNORECASE)
+    return _number(match.group(1)) if match else None
+
+
+def _price_range(prompt):
+    match = re.search(r"\$?(\d+(?:\.\d+)?)\s*(?:-|to)\s*\$?(\d+(?:\.\d+)?)", prompt)
+    if match:
+        return f"{match.group(1)}-{match.group(2)}"
+    match = re.search(r"\bunder\s+\$?(\d+(?:\.\d+)?)", prompt, re.IGNORECASE)
+    return f"0-{match.group(1)}" if match else None
+
+
+def _month(prompt):
+    for month in _MONTHS:
+        # 'may' is usually the verb
+        if re.search(rf"\b{month}\b", prompt, 0 if month == "May" else re.IGNORECASE):
+            return month
+    return None
+
+
+def _days(prompt):
+    match = re.search(r"next\s+(\d+)\s+days", prompt, re.IGNORECASE)
+    return int(match.group(1)) if match else None
+
+
+# Where each tool parameter can be read from a prompt; anything else only ever takes its default
+EXTRACTORS = {
+    "product_name": _product,
+    "niche": _category,
+    "category": _category,
+    "target_selling_price": _money,
+    "price": _money,
+    "budget": _budget,
+    "monthly_volume": _volume,
+    "price_range": _price_range,
+    "current_month": _month,
+    "days_ahead": _days,
+}
+
+
+def predict_arguments(tool, prompt):
+    """Arguments for a call of tool read off the prompt, or None when a required one is missing"""
+    schema = tool.params_json_schema
+    required = set(schema.get("required", ()))
+    arguments = {}
+    for name, spec in schema.get("properties", {}).items():
+        extractor = EXTRACTORS.get(name)
+        value = extractor(prompt) if extractor else None
+        # Strict schemas list every parameter as required; one with a default, or nullable, can still be left out
+        if value is None:
+            if name in required and "default" not in spec and not nullable(spec):
+                return None
+            continue
+        if spec.get("type") == "integer":
+            value = int(value)
+        arguments[name] = value
+    return arguments
+
+
+@dataclasses.dataclass
+class SpeculativeCall:
+    task: asyncio.Task = None
+    started: float = 0.0
+    finished: float = None
+
+
+class Speculation:
+    """One turn's predicted calls, running while the model decides what to call.
+
+    A tool call of the turn that matches one exactly (same tool, same
+    arguments once normalized) takes its result; the rest are cancelled and
+    thrown away when the turn closes the speculation.
+    """
+
+    def __init__(self, speculator, loop):
+        self.speculator = speculator
+        self.turn = current_turn.get()
+        self._loop = loop
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def start(self, tool, arguments):
+        args_json = json.dumps(arguments)
+        call = SpeculativeCall(started=time.perf_counter())
+
+        async def run():
+            try:
+                return await tool.on_invoke_tool(RunContextWrapper(context=None), args_json)
+            finally:
+                call.finished = time.perf_counter()
+
+        # A fresh context: the speculative call is not part of any turn until it is claimed
+        call.task = self._loop.create_task(run(), context=contextvars.Context())
+        call.task.add_done_callback(_retrieve)
+        self._calls[(tool.name, normalize_arguments(tool, args_json))] = call
+
+    @property
+    def predicted(self):
+        return list(self._calls)
+
+    async def claim(self, tool, args_json):
+        """The predicted result for this call, or None if it was not predicted or did not succeed"""
+        with self._lock:
+            call = self._calls.pop((tool.name, normalize_arguments(tool, args_json)), None)
+        if call is None:
+            return None
+        requested = time.perf_counter()
+        try:
+            result = await call.task
+        except Exception:
+            result = None
+        if result is None or isinstance(result, ToolFailure):
+            self.speculator._record(failed=1)
+            return None
+        # The part of the call's run that overlapped the model, rather than following its request
+        saved = max((call.finished - call.started) - max(call.finished - requested, 0.0), 0.0)
+        self.speculator._record(hits=1, saved=saved)
+        if self.turn is not None:
+            self.turn.speculative_hits += 1
+            self.turn.speculation_saved += saved
+        return result
+
+    def close(self):
+        """Discard every unclaimed call; safe from any thread"""
+        with self._lock:
+            leftover, self._calls = list(self._calls.values()), {}
+        if leftover:
+            self.speculator._record(discarded=len(leftover))
+            if self.turn is not None:
+                self.turn.speculative_discarded += len(leftover)
+            for call in leftover:
+                self._loop.call_soon_threadsafe(call.task.cancel)
+
+
+def _retrieve(task):
+    # A discarded call's error is nobody's business
+    if not task.cancelled():
+        task.exception()
+
+
+class ToolSpeculator:
+    """Starts the tool calls a prompt will likely need before the model asks for them.
+
+    Which tools: each wrapped tool's docstring and name become keyword rules,
+    weighted by how few tools share the word, and a prompt predicts the tools
+    its words score highest on. Which arguments: EXTRACTORS read them off the
+    prompt; a tool with a required argument the prompt does not give is never
+    predicted. Predictions run outside the turn on the speculator's own
+    bulkhead, so a miss leaves no trace in the turn, the tool cache or the
+    conversation, and never takes a slot a real call of the tool is waiting for.
+    """
+
+    def __init__(self, tool_cache=None, max_predictions=MAX_PREDICTIONS, min_score=MIN_SCORE,
+                 limit=SPECULATIVE_LIMIT):
+        self.tool_cache = tool_cache
+        self.max_predictions = max_predictions
+        self.min_score = min_score
+        self.bulkhead = Bulkhead("speculative", limit)
+        self._tools = {}
+        self._rules = {}
+        self._lock = threading.Lock()
+        self._stats = {"turns": 0, "predicted": 0, "skipped": 0, "hits": 0, "failed": 0, "discarded": 0,
+                       "saved": 0.0}
+
+    def wrap(self, tool, bare=None, timeout=DEFAULT_TIMEOUT):
+        """Return a copy of a FunctionTool that takes its result from the turn's speculation when it matches.
+
+        tool is what a turn's call runs when nothing matches, usually the tool
+        on its bulkhead; predictions run bare (the tool before that wrapping,
+        tool itself by default) on the speculator's threads with this timeout.
+        """
+        invoke = tool.on_invoke_tool
+
+        async def on_invoke_tool(ctx, args_json):
+            speculation = current_speculation.get()
+            if speculation is not None:
+                result = await speculation.claim(tool, args_json)
+                if result is not None:
+                    return result
+            return await invoke(ctx, args_json)
+
+        with self._lock:
+            self._tools[tool.name] = self.bulkhead.wrap(bare or tool, timeout)
+            self._build_rules()
+        return dataclasses.replace(tool, on_invoke_tool=on_invoke_tool)
+
+    def _build_rules(self):
+        words = {name: keywords(f"{tool.description} {name.replace('_', ' ')}") for name, tool in self._tools.items()}
+        counts = {}
+        for tool_words in words.values():
+            for word in tool_words:
+                counts[word] = counts.get(word, 0) + 1
+        self._rules = {name: {word: math.log((len(words) + 1) / counts[word]) for word in tool_words}
+                       for name, tool_words in words.items()}
+
+    def predict(self, prompt, tool_names=None):
+        """[(tool, arguments)] for the likeliest calls, best first"""
+        prompt_words = keywords(prompt)
+        with self._lock:
+            rules = self._rules
+            tools = self._tools
+        scored = []
+        for name, weights in rules.items():
+            if tool_names is not None and name not in tool_names:
+                continue
+            score = sum(weight for word, weight in weights.items() if word in prompt_words)
+            if score >= self.min_score:
+                scored.append((score, name))
+        predictions = []
+        for _, name in sorted(scored, reverse=True):
+            arguments = predict_arguments(tools[name], prompt)
+            if arguments is not None:
+                predictions.append((tools[name], arguments))
+            if len(predictions) == self.max_predictions:
+                break
+        return predictions
+
+    def start(self, agent, user_input):
+        """Start the turn's predicted calls and make them claimable; call on the event loop, then close()"""
+        speculation = Speculation(self, asyncio.get_running_loop())
+        tool_names = {tool.name for tool in agent.tools}
+        free, skipped = self.bulkhead.free_slots(), 0
+        for tool, arguments in self.predict(prompt_text(user_input), tool_names):
+            # Already memoized: the cache answers faster than any speculation
+            if self.tool_cache is not None and self.tool_cache.contains(tool, json.dumps(arguments)):
+                continue
+            # A queued guess would only finish after the real call it was meant to beat
+            if free == 0:
+                skipped += 1
+                continue
+            speculation.start(tool, arguments)
+            free -= 1
+        self._record(turns=1, predicted=len(speculation.predicted), skipped=skipped)
+        current_speculation.set(speculation)
+        return speculation
+
+    def _record(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                self._stats[key] += value
+
+    def stats(self):
+        """Turns, predicted / skipped / hit / failed / discarded calls, hit rate and seconds saved"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["hit_rate"] = stats["hits"] / stats["predicted"] if stats["predicted"] else 0.0
+        return stats
+
+    def shutdown(self):
+        self.bulkhead.shutdown()
+
+
+_speculator = None
+_speculator_lock = threading.Lock()
+
+
+def get_speculator() -> ToolSpeculator:
+    """Process-wide tool speculator shared by every session"""
+    global _speculator
+    with _speculator_lock:
+        if _speculator is None:
+            _speculator = ToolSpeculator(get_tool_cache())
+        return _speculator
@@ -0,0 +1,53 @@
+import time
+
+from agents import Runner
+from openai.types.responses import ResponseTextDeltaEvent
+
+from runtime import get_runtime
+from speculation import get_speculator
+from telemetry import current_turn
+
+
+def stream_agent_turn(agent, user_input, config, telemetry=None, token=None):
+    """Run one streamed agent turn, yielding (kind, payload) events.
+
+    kinds: "text" (a token delta), "tool_called" / "tool_output" (tool name),
+    and finally "done" with {"result", "ttft", "total"} (seconds, ttft may be None).
+    Raises runtime.TurnCancelled if the CancelToken stops the turn.
+    """
+    runtime = get_runtime()
+    start = time.perf_counter()
+    ttft = None
+    tool_names = {}
+
+    # run_streamed schedules its task on the running loop, so start it there
+    async def start_run():
+        current_turn.set(telemetry)
+        # The run's task copies this context, speculation included
+        speculation = get_speculator().start(agent, user_input)
+        return Runner.run_streamed(agent, user_input, run_config=config, hooks=telemetry), speculation
+
+    result, speculation = runtime.run(start_run(), token=token)
+    try:
+        for event in runtime.iterate(result.stream_events(), token=token):
+            if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                if not event.data.delta:
+                    continue
+                if ttft is None:
+                    ttft = time.perf_counter() - start
+                yield "text", event.data.delta
+            elif event.type == "run_item_stream_event" and event.name == "tool_called":
+                raw = event.item.raw_item
+                name = getattr(raw, "name", "tool")
+                tool_names[getattr(raw, "call_id", None)] = name
+                yield "tool_called", name
+            elif event.type == "run_item_stream_event" and event.name == "tool_output":
+                raw = event.item.raw_item
+                call_id = raw.get("call_id") if isinstance(raw, dict) else getattr(raw, "call_id", None)
+                yield "tool_output", tool_names.get(call_id, "tool")
+    finally:
+        # Stops the background run if the caller abandons the stream early
+        runtime.loop.call_soon_threadsafe(result.cancel)
+        speculation.close()
+
+    yield "done", {"result": result, "ttft": ttft, "total": time.perf_counter() - start}
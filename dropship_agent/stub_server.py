@@ -0,0 +1,375 @@
+"""Local stand-in for the OpenAI-compatible chat-completions endpoint.
+
+Run it and point an app at it with GEMINI_BASE_URL, fully offline:
+    python stub_server.py --port 8765 --profile gemini-flash
+    GEMINI_BASE_URL=http://127.0.0.1:8765/v1/ streamlit run main.py
+"""
+import argparse
+import json
+import math
+import random
+import re
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Base time to first token (s), prompt prefill speed and output speed (tokens/s, None = free)
+# and +/- jitter fraction
+PROFILES = {
+    "instant": {"latency": 0.0, "prefill_tokens_per_second": None, "tokens_per_second": None, "jitter": 0.0},
+    "fast": {"latency": 0.15, "prefill_tokens_per_second": 20000, "tokens_per_second": 250, "jitter": 0.1},
+    "gemini-flash": {"latency": 0.35, "prefill_tokens_per_second": 8000, "tokens_per_second": 120, "jitter": 0.2},
+    "slow": {"latency": 1.2, "prefill_tokens_per_second": 2000, "tokens_per_second": 25, "jitter": 0.3},
+}
+
+# Scripted first-step replies: the first rule whose pattern matches the last user message and
+# whose tools are all offered in the request answers with those tool calls. After the tool
+# results come back the rule's reply ends the turn ({tools} is replaced by the tools called).
+DEFAULT_SCRIPT = [
+    # dropship_agent
+    {"match": r"launch|full analysis",
+     "tool_calls": [{"name": "get_trending_products", "arguments": {"category": "all", "price_range": "0-50"}},
+                    {"name": "analyze_market_competition",
+                     "arguments": {"product_name": "Wireless Earbuds", "niche": "electronics"}},
+                    {"name": "find_suppliers_and_calculate_profits",
+                     "arguments": {"product_name": "Wireless Earbuds", "target_selling_price": 49.99}}],
+     "reply": "Launch analysis assembled from {tools}."},
+    {"match": r"trending|find .*products",
+     "tool_calls": [{"name": "get_trending_products", "arguments": {"category": "all", "price_range": "0-50"}}],
+     "reply": "Here are the trending products I found with {tools}."},
+    {"match": r"profit|supplier",
+     "tool_calls": [{"name": "find_suppliers_and_calculate_profits",
+                     "arguments": {"product_name": "Wireless Earbuds", "target_selling_price": 49.99}}],
+     "reply": "Supplier comparison and profits are ready from {tools}."},
+    {"match": r"competition|market",
+     "tool_calls": [{"name": "analyze_market_competition",
+                     "arguments": {"product_name": "Wireless Earbuds", "niche": "electronics"}}],
+     "reply": "Market analysis done with {tools}."},
+    {"match": r"marketing|strategy",
+     "tool_calls": [{"name": "create_marketing_strategy",
+                     "arguments": {"product_name": "Wireless Earbuds", "budget": 1000,
+                                   "target_audience": "students", "niche": "electronics"}}],
+     "reply": "Your marketing plan comes from {tools}."},
+    {"match": r"copy|description",
+     "tool_calls": [{"name": "generate_product_copy",
+                     "arguments": {"product_name": "Wireless Earbuds", "key_features": "noise cancelling, 30h battery",
+                                   "target_audience": "commuters", "price": 49.99}}],
+     "reply": "Product copy written with {tools}."},
+    {"match": r"season",
+     "tool_calls": [{"name": "seasonal_opportunity_finder", "arguments": {}}],
+     "reply": "Seasonal opportunities from {tools}."},
+    # travel_agent
+    {"match": r"budget",
+     "tool_calls": [{"name": "analyze_budget", "arguments": {"amount": 300}},
+                    {"name": "suggest_destination", "arguments": {"mood": "adventure", "budget_level": "Premium"}}],
+     "reply": "Your trip plan is ready, built with {tools}."},
+]
+
+
+def _count_tokens(text):
+    """Prompt token estimate, about four characters per token"""
+    return math.ceil(len(text) / 4) if text else 0
+
+
+def _tokens(text):
+    """Word-sized chunks that join back into the text, used as the stub's tokens"""
+    return re.findall(r"\s*\S+", text) or [text]
+
+
+def _message_text(message):
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return str(content)
+
+
+def _structured(reply, response_format):
+    """Reply wrapped in the JSON object a json_schema response_format asks for"""
+    schema = (response_format.get("json_schema") or {}).get("schema") or {}
+    properties = schema.get("properties") or {}
+    obj = {}
+    for name, spec in properties.items():
+        kind = spec.get("type")
+        if kind == "string":
+            obj[name] = reply
+        elif kind in ("number", "integer"):
+            obj[name] = 0
+        elif kind == "boolean":
+            obj[name] = False
+        elif kind == "array":
+            obj[name] = []
+        else:
+            obj[name] = None
+    return json.dumps(obj if properties else {"answer": reply}, ensure_ascii=False)
+
+
+class StubModelServer:
+    """Deterministic OpenAI-compatible chat-completions server for offline load and latency tests"""
+
+    def __init__(self, host="127.0.0.1", port=0, reply="Stub reply from the local model server.", latency=None,
+                 connect_latency=0.0, tokens_per_second=None, jitter=None, profile="instant",
+                 script=DEFAULT_SCRIPT, seed=0, prefill_tokens_per_second=None):
+        settings = dict(PROFILES[profile])
+        for key, value in (("latency", latency), ("tokens_per_second", tokens_per_second), ("jitter", jitter),
+                           ("prefill_tokens_per_second", prefill_tokens_per_second)):
+            if value is not None:
+                settings[key] = value
+        self.reply = reply
+        self.latency = settings["latency"]
+        self.prefill_tokens_per_second = settings["prefill_tokens_per_second"]
+        self.tokens_per_second = settings["tokens_per_second"]
+        self.jitter = settings["jitter"]
+        # Paid once per new connection, standing in for DNS + TCP + TLS setup to a remote endpoint
+        self.connect_latency = connect_latency
+        self.script = [dict(rule, pattern=re.compile(rule["match"], re.IGNORECASE)) for rule in script or []]
+        self.connections = 0
+        self.requests = 0
+        self.tool_call_requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this, delayed ACKs add ~40 ms per request
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+                if server.connect_latency:
+                    time.sleep(server.connect_latency)
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def send_event(self, payload):
+                data = f"data: {payload}\n\n".encode()
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_GET(self):
+                # models.list(), used to pre-warm client connections
+                self.send_json({"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "stub"}]})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.requests += 1
+                    number = server.requests
+                if not request.get("stream"):
+                    completion = server.completion(request, number)
+                    server.pace(completion["usage"])
+                    self.send_json(completion)
+                    return
+
+                # Server-sent events over a chunked keep-alive response
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for chunk in server.stream(request, number):
+                        self.send_event(json.dumps(chunk))
+                    self.send_event("[DONE]")
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client cancelled the stream
+                    self.close_connection = True
+
+        return Handler
+
+    def _delay(self, seconds):
+        if seconds <= 0:
+            return 0.0
+        if self.jitter:
+            with self._lock:
+                seconds *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return seconds
+
+    def _prefill_seconds(self, usage):
+        if not self.prefill_tokens_per_second:
+            return 0.0
+        return usage["prompt_tokens"] / self.prefill_tokens_per_second
+
+    def pace(self, usage):
+        """Sleep for the profile's time to first token, prefill of the prompt tokens and generation"""
+        seconds = self._delay(self.latency) + self._prefill_seconds(usage)
+        if self.tokens_per_second:
+            seconds += usage["completion_tokens"] / self.tokens_per_second
+        time.sleep(seconds)
+
+    def prompt_usage(self, request):
+        """Prompt tokens of a request: tools, response format and messages"""
+        static = json.dumps([request.get("tools") or [], request.get("response_format") or {}], sort_keys=True)
+        return _count_tokens(static) + sum(_count_tokens(_message_text(m)) for m in request.get("messages", []))
+
+    def plan(self, request):
+        """(content, tool_calls) for the next assistant message of a request"""
+        messages = request.get("messages", [])
+        offered = {tool["function"]["name"] for tool in request.get("tools") or [] if tool.get("function")}
+        user_text = next((_message_text(m) for m in reversed(messages) if m.get("role") == "user"), "")
+        rule = next(
+            (rule for rule in self.script
+             if rule["pattern"].search(user_text) and {call["name"] for call in rule["tool_calls"]} <= offered),
+            None
+        )
+
+        if messages and messages[-1].get("role") == "tool":
+            # Tool results are in, finish the turn
+            last_user = max((i for i, m in enumerate(messages) if m.get("role") == "user"), default=-1)
+            called = [call["function"]["name"]
+                      for m in messages[last_user + 1:] if m.get("role") == "assistant"
+                      for call in m.get("tool_calls") or []]
+            template = rule.get("reply", self.reply) if rule else self.reply
+            content = template.replace("{tools}", ", ".join(dict.fromkeys(called)))
+        elif rule:
+            return None, rule["tool_calls"]
+        else:
+            content = self.reply
+
+        response_format = request.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            content = _structured(content, response_format)
+        return content, []
+
+    def _usage(self, prompt_tokens, completion_tokens):
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": 0},
+        }
+
+    def completion(self, request, number=0):
+        """Build a chat.completion payload for a request"""
+        prompt_tokens = self.prompt_usage(request)
+        content, tool_calls = self.plan(request)
+        message = {"role": "assistant", "content": content}
+        if tool_calls:
+            with self._lock:
+                self.tool_call_requests += 1
+            message["tool_calls"] = [
+                {"id": f"call_{number}_{i}", "type": "function",
+                 "function": {"name": call["name"], "arguments": json.dumps(call["arguments"])}}
+                for i, call in enumerate(tool_calls)
+            ]
+        completion_tokens = len(_tokens(content)) if content else 8 * len(tool_calls)
+        return {
+            "id": f"chatcmpl-stub-{number}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_calls else "stop",
+            }],
+            "usage": self._usage(prompt_tokens, completion_tokens),
+        }
+
+    def stream(self, request, number=0):
+        """chat.completion.chunk payloads for a streamed request, paced by the profile"""
+        content, tool_calls = self.plan(request)
+        base = {
+            "id": f"chatcmpl-stub-{number}",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+        }
+
+        def chunk(delta, finish_reason=None, usage=None):
+            return dict(base, choices=[{"index": 0, "delta": delta, "finish_reason": finish_reason}], usage=usage)
+
+        usage = self._usage(self.prompt_usage(request), 0)
+        time.sleep(self._delay(self.latency) + self._prefill_seconds(usage))
+        yield chunk({"role": "assistant", "content": ""})
+        step = 1 / self.tokens_per_second if self.tokens_per_second else 0.0
+        if tool_calls:
+            with self._lock:
+                self.tool_call_requests += 1
+            for i, call in enumerate(tool_calls):
+                yield chunk({"tool_calls": [{
+                    "index": i, "id": f"call_{number}_{i}", "type": "function",
+                    "function": {"name": call["name"], "arguments": json.dumps(call["arguments"])},
+                }]})
+            completion_tokens = 8 * len(tool_calls)
+        else:
+            tokens = _tokens(content)
+            for token in tokens:
+                if step:
+                    time.sleep(step)
+                yield chunk({"content": token})
+            completion_tokens = len(tokens)
+        # The client keeps the usage of the last chunk only
+        usage["completion_tokens"] = completion_tokens
+        usage["total_tokens"] += completion_tokens
+        yield chunk({}, "tool_calls" if tool_calls else "stop", usage)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="gemini-flash")
+    parser.add_argument("--script", help="JSON file with a list of rules replacing the default script")
+    parser.add_argument("--reply", default="Stub reply from the local model server.")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter")
+    args = parser.parse_args()
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            script = json.load(f)
+
+    server = StubModelServer(args.host, args.port, reply=args.reply, profile=args.profile,
+                             script=script, seed=args.seed)
+    print(f"Stub model server ({args.profile}) on {server.base_url}")
+    print(f"Point the apps at it with: GEMINI_BASE_URL={server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles")
+
+# Cascade order, as the blocks used to appear on the page: later files win conflicts
+STYLE_SOURCES = ("base.css", "chat.css", "status.css")
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+
+# Adds the stylesheet to the parent page's <head>, replacing an older build of it.
+# The head is outside the React tree, so the styles outlive this iframe and later reruns.
+_INJECT_TEMPLATE = """<script>
+(function () {
+  var doc = window.parent.document, id = "dropship-styles-" + %(digest)s;
+  if (doc.getElementById(id)) return;
+  doc.querySelectorAll("style[data-dropship-styles]").forEach(function (old) { old.remove(); });
+  var style = doc.createElement("style");
+  style.id = id;
+  style.setAttribute("data-dropship-styles", "");
+  style.textContent = %(css)s;
+  doc.head.appendChild(style);
+})();
+</script>"""
+
+
+def _split(text, separators):
+    """Split on separator characters outside quotes, parentheses and braces"""
+    parts, current, depth, quote = [], [], 0, None
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "({":
+            depth += 1
+        elif char in ")}":
+            depth -= 1
+        elif char in separators and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+def _blocks(css):
+    """Top-level (prelude, body) pairs; body is None for statements like @import"""
+    blocks, prelude, i, quote = [], [], 0, None
+    while i < len(css):
+        char = css[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == ";":
+            blocks.append(("".join(prelude).strip(), None))
+            prelude = []
+            i += 1
+            continue
+        elif char == "{":
+            depth, start = 1, i + 1
+            while depth:
+                i += 1
+                depth += {"{": 1, "}": -1}.get(css[i], 0)
+            blocks.append(("".join(prelude).strip(), css[start:i]))
+            prelude = []
+            i += 1
+            continue
+        prelude.append(char)
+        i += 1
+    return [(prelude, body) for prelude, body in blocks if prelude]
+
+
+def _minify_selector(selector):
+    selector = " ".join(selector.split())
+    return re.sub(r"\s*([>+~,])\s*", r"\1", selector)
+
+
+def _minify_value(value):
+    value = " ".join(value.split())
+    return re.sub(r"\s*,\s*", ",", value)
+
+
+def _declarations(body):
+    """Ordered {property: value}; a repeated property keeps its last value"""
+    declarations = {}
+    for declaration in _split(body, ";"):
+        name, _, value = declaration.partition(":")
+        if value.strip():
+            name = name.strip().lower()
+            declarations.pop(name, None)
+            declarations[name] = _minify_value(value)
+    return declarations
+
+
+def compile_css(sources):
+    """One minified stylesheet from CSS sources in cascade order.
+
+    Rules repeated across sources are merged property by property with later
+    values winning, which is what the browser did with the separate blocks, and
+    the merged rule takes the position of its last occurrence. At-rule blocks
+    (@keyframes, @media) are kept whole, a later one with the same prelude wins.
+    """
+    statements, rules = [], {}
+    for css in sources:
+        for prelude, body in _blocks(_COMMENT.sub("", css)):
+            if body is None:
+                statement = " ".join(prelude.split())
+                if statement not in statements:
+                    statements.append(statement)
+            elif prelude.startswith("@"):
+                key = " ".join(prelude.split())
+                rules.pop(key, None)
+                rules[key] = compile_css([body])
+            else:
+                key = _minify_selector(prelude)
+                merged = rules.pop(key, {})
+                for name, value in _declarations(body).items():
+                    # Re-insert so shorthands and longhands keep the later source's order
+                    merged.pop(name, None)
+                    merged[name] = value
+                rules[key] = merged
+
+    out = [f"{statement};" for statement in statements]
+    for key, body in rules.items():
+        if isinstance(body, str):
+            out.append(f"{key}{{{body}}}")
+        else:
+            out.append(f"{key}{{{';'.join(f'{name}:{value}' for name, value in body.items())}}}")
+    return "".join(out)
+
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+def read_sources(styles_dir=STYLES_DIR, names=STYLE_SOURCES):
+    sources = []
+    for name in names:
+        with open(os.path.join(styles_dir, name), encoding="utf-8") as f:
+            sources.append(f.read())
+    return sources
+
+
+def compiled_stylesheet(styles_dir=STYLES_DIR, names=STYLE_SOURCES):
+    """(css, digest) of the compiled stylesheet, compiled once per distinct source content"""
+    sources = read_sources(styles_dir, names)
+    digest = hashlib.sha256("\0".join(sources).encode()).hexdigest()[:16]
+    with _compiled_lock:
+        if digest not in _compiled:
+            _compiled[digest] = compile_css(sources)
+        return _compiled[digest], digest
+
+
+def _embed_script(html):
+    """Run a script in a same-origin iframe that takes no room on the page"""
+    if hasattr(st, "iframe"):
+        # Replaces components.html in newer Streamlit releases; the body is empty, so it sizes to nothing
+        st.iframe(html, height="content")
+    else:
+        components.html(html, height=0)
+
+
+def inject_styles():
+    """Put the app stylesheet on the page once per session; returns the bytes sent this rerun"""
+    css, digest = compiled_stylesheet()
+    if st.session_state.get("styles_digest") == digest:
+        return 0
+    payload = _INJECT_TEMPLATE % {"digest": json.dumps(digest), "css": json.dumps(css).replace("</", "<\\/")}
+    _embed_script(payload)
+    st.session_state.styles_digest = digest
+    return len(payload.encode())
@@ -0,0 +1,136 @@
+import json
+import math
+import os
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+
+from agents import RunHooks
+
+# Optional JSONL file every finished turn is appended to, for spotting regressions across sessions
+TELEMETRY_LOG = os.environ.get("DROPSHIP_TELEMETRY_LOG")
+
+# The turn being measured, visible to tool wrappers running inside that turn's tasks
+current_turn = ContextVar("current_turn", default=None)
+
+_log_lock = threading.Lock()
+
+
+def _merged_length(intervals):
+    """Total time covered by possibly overlapping (start, end) intervals"""
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+class TurnTelemetry(RunHooks):
+    """Run hooks that time one agent turn and its tool calls"""
+
+    def __init__(self, streamed=False, context_tokens=0):
+        self.streamed = streamed
+        self.context_tokens = context_tokens
+        self.started = time.perf_counter()
+        self.tool_calls = 0
+        self.tool_cache_hits = 0
+        self.tool_queue_wait = 0.0
+        self.tool_timeouts = 0
+        self.speculative_hits = 0
+        self.speculative_discarded = 0
+        self.speculation_saved = 0.0
+        self._tool_intervals = []
+        self._open_tools = {}
+
+    async def on_tool_start(self, context, agent, tool):
+        self._open_tools.setdefault(tool.name, []).append(time.perf_counter())
+
+    async def on_tool_end(self, context, agent, tool, result):
+        started = self._open_tools[tool.name].pop()
+        self._tool_intervals.append((started, time.perf_counter()))
+        self.tool_calls += 1
+
+    def finish(self, run_result=None, ttft=None, cached=False):
+        """Per-turn record: wall, model and tool seconds, tool calls, tokens and cache hits"""
+        wall = time.perf_counter() - self.started
+        tool = _merged_length(self._tool_intervals)
+        usage = run_result.context_wrapper.usage if run_result is not None else None
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'streamed': self.streamed,
+            'wall': wall,
+            'ttft': ttft,
+            'model': max(wall - tool, 0.0) if not cached else 0.0,
+            'tool': tool,
+            'tool_calls': self.tool_calls,
+            'requests': usage.requests if usage else 0,
+            'input_tokens': usage.input_tokens if usage else 0,
+            'output_tokens': usage.output_tokens if usage else 0,
+            'cached_tokens': usage.input_tokens_details.cached_tokens if usage else 0,
+            'context_tokens': self.context_tokens,
+            'response_cache_hit': cached,
+            'tool_cache_hits': self.tool_cache_hits,
+            'tool_queue_wait': self.tool_queue_wait,
+            'tool_timeouts': self.tool_timeouts,
+            'speculative_hits': self.speculative_hits,
+            'speculative_discarded': self.speculative_discarded,
+            'speculation_saved': self.speculation_saved,
+        }
+
+
+class SessionTelemetry:
+    """Incrementally maintained counters and per-turn records for one chat session"""
+
+    def __init__(self):
+        self.messages = {'user': 0, 'ai': 0}
+        self.turns = []
+        self.totals = {
+            'wall': 0.0, 'model': 0.0, 'tool': 0.0, 'tool_calls': 0,
+            'input_tokens': 0, 'output_tokens': 0, 'cached_tokens': 0, 'context_tokens': 0,
+            'response_cache_hits': 0, 'tool_cache_hits': 0, 'tool_queue_wait': 0.0, 'tool_timeouts': 0,
+            'duplicates_suppressed': 0, 'cancelled_turns': 0, 'timed_out_turns': 0,
+            'speculative_hits': 0, 'speculative_discarded': 0, 'speculation_saved': 0.0,
+        }
+
+    def count_message(self, message_type):
+        self.messages[message_type] = self.messages.get(message_type, 0) + 1
+
+    def count_duplicate(self):
+        """A repeat submission that joined a turn already in flight instead of starting one"""
+        self.totals['duplicates_suppressed'] += 1
+
+    def count_stopped(self, reason):
+        """A turn that ended without an answer: "cancelled" by the user or "timeout" at its deadline"""
+        self.totals['timed_out_turns' if reason == "timeout" else 'cancelled_turns'] += 1
+
+    def record_turn(self, record):
+        self.turns.append(record)
+        for key in ('wall', 'model', 'tool', 'tool_calls', 'input_tokens', 'output_tokens', 'cached_tokens',
+                    'context_tokens', 'tool_cache_hits', 'tool_queue_wait', 'tool_timeouts',
+                    'speculative_hits', 'speculative_discarded', 'speculation_saved'):
+            self.totals[key] += record[key]
+        self.totals['response_cache_hits'] += int(record['response_cache_hit'])
+        if TELEMETRY_LOG:
+            with _log_lock, open(TELEMETRY_LOG, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+    @property
+    def last_turn(self):
+        return self.turns[-1] if self.turns else None
+
+    def to_ndjson(self):
+        return "".join(json.dumps(record) + "\n" for record in self.turns)
@@ -0,0 +1,34 @@
+import json
+
+from batch import completed_ids, load_prompts
+from telemetry import percentile
+
+
+def test_text_prompts_are_numbered_by_line(tmp_path):
+    path = tmp_path / "prompts.txt"
+    path.write_text("Find trending products\n\n  Seasonal ideas for December  \n", encoding="utf-8")
+    assert load_prompts(str(path)) == [("1", "Find trending products"), ("3", "Seasonal ideas for December")]
+
+
+def test_jsonl_prompts_keep_their_ids(tmp_path):
+    path = tmp_path / "prompts.jsonl"
+    lines = [{"id": "earbuds", "prompt": "Find suppliers for Wireless Earbuds"}, {"prompt": "Write product copy"}]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n", encoding="utf-8")
+    assert load_prompts(str(path)) == [("earbuds", "Find suppliers for Wireless Earbuds"), ("2", "Write product copy")]
+
+
+def test_only_successful_results_count_as_done(tmp_path):
+    path = tmp_path / "results.jsonl"
+    records = [{"id": "1", "status": "ok"}, {"id": "2", "status": "error"}, {"id": "3", "status": "ok"}]
+    # The last line was cut short by an interruption
+    path.write_text("\n".join(json.dumps(r) for r in records) + '\n{"id": "4", "sta', encoding="utf-8")
+    assert completed_ids(str(path)) == {"1", "3"}
+    assert completed_ids(str(tmp_path / "missing.jsonl")) == set()
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 21))
+    assert percentile(values, 50) == 10
+    assert percentile(values, 95) == 19
+    assert percentile(values, 100) == 20
+    assert percentile([3.0], 99) == 3.0
@@ -0,0 +1,53 @@
+import json
+import sys
+
+import pytest
+
+from benchmarks import suite
+
+
+def write_results(path, results):
+    path.write_text(json.dumps({"meta": {}, "results": {name: {"median_ms": ms} for name, ms in results.items()}}))
+    return str(path)
+
+
+def run_cli(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["suite", *argv])
+    suite.main()
+
+
+def test_compare_fails_on_a_slower_median(tmp_path, monkeypatch, capsys):
+    base = write_results(tmp_path / "base.json", {"tool.copy": 1.0, "turn.plain": 10.0, "gone": 1.0})
+    new = write_results(tmp_path / "new.json", {"tool.copy": 1.3, "turn.plain": 9.0, "added": 2.0})
+    with pytest.raises(SystemExit) as exited:
+        run_cli(monkeypatch, "compare", base, new, "--threshold", "0.15")
+    assert exited.value.code == 1
+    out = capsys.readouterr().out
+    assert "REGRESSION" in out.splitlines()[2] and "tool.copy" in out.splitlines()[2]
+    assert "gone" in out and "removed" in out and "added" in out
+    assert "1 regression(s) beyond 15%" in out
+
+
+def test_compare_passes_within_the_threshold(tmp_path, monkeypatch, capsys):
+    base = write_results(tmp_path / "base.json", {"tool.copy": 1.0, "tiny": 0.0001})
+    # tiny doubled, but by less than --min-delta-ms
+    new = write_results(tmp_path / "new.json", {"tool.copy": 1.1, "tiny": 0.0002})
+    run_cli(monkeypatch, "compare", base, new)
+    assert "0 regression(s)" in capsys.readouterr().out
+
+
+def test_summarize_reports_milliseconds():
+    stats = suite.summarize([0.001, 0.003, 0.002, 0.010])
+    assert stats["median_ms"] == pytest.approx(2.5)
+    assert stats["min_ms"] == pytest.approx(1.0)
+    assert stats["p95_ms"] == pytest.approx(10.0)
+    assert stats["samples"] == 4
+
+
+def test_run_saves_results(tmp_path, monkeypatch):
+    out = tmp_path / "results.json"
+    run_cli(monkeypatch, "run", "--only", "extraction", "--repeat", "2", "--out", str(out))
+    report = json.loads(out.read_text())
+    assert set(report["results"]) == {"extraction.text", "extraction.json", "extraction.fallback", "extraction.stream"}
+    assert all(stats["samples"] == 2 for stats in report["results"].values())
+    assert report["meta"]["repeat"] == 2
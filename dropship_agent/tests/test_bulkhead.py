@@ -0,0 +1,73 @@
+import asyncio
+import dataclasses
+import time
+
+from agents.run_context import RunContextWrapper
+
+import tools
+from bulkhead import Bulkhead, ToolBulkheads
+from tool_cache import ToolFailure
+
+
+def slowed(tool, delay):
+    invoke = tool.on_invoke_tool
+
+    async def on_invoke_tool(ctx, args_json):
+        time.sleep(delay)
+        return await invoke(ctx, args_json)
+
+    return dataclasses.replace(tool, on_invoke_tool=on_invoke_tool)
+
+
+def call_all(tool, calls):
+    """Run `calls` concurrent invocations; (results, wall seconds)"""
+    async def run():
+        ctx = RunContextWrapper(context=None)
+        return await asyncio.gather(*(tool.on_invoke_tool(ctx, "{}") for _ in range(calls)))
+
+    started = time.perf_counter()
+    results = asyncio.run(run())
+    return results, time.perf_counter() - started
+
+
+def test_timeout_answers_with_a_tool_failure():
+    bulkhead = Bulkhead("trending", limit=1, timeout=0.1)
+    tool = bulkhead.wrap(slowed(tools.get_trending_products, 0.5))
+    (result,), wall = call_all(tool, 1)
+    assert isinstance(result, ToolFailure)
+    assert "timed out after 0.1s" in result
+    assert wall < 0.4
+    assert bulkhead.stats()["timeouts"] == 1
+    # The timed-out call keeps its thread until it returns
+    assert bulkhead.free_slots() == 0
+    time.sleep(0.6)
+    assert bulkhead.free_slots() == 1
+    bulkhead.shutdown()
+
+
+def test_limit_bounds_concurrent_calls():
+    parallel = Bulkhead("parallel", limit=3, timeout=5.0)
+    serial = Bulkhead("serial", limit=1, timeout=5.0)
+    bare = slowed(tools.get_trending_products, 0.3)
+
+    results, wall = call_all(parallel.wrap(bare), 3)
+    assert not any(isinstance(result, ToolFailure) for result in results)
+    assert wall < 0.6
+
+    _, wall = call_all(serial.wrap(bare), 3)
+    assert wall >= 0.9
+    stats = serial.stats()
+    assert stats["calls"] == 3 and stats["in_flight"] == 0
+    assert stats["max_queue_wait"] >= 0.5
+    parallel.shutdown()
+    serial.shutdown()
+
+
+def test_bulkheads_are_per_tool_name():
+    bulkheads = ToolBulkheads()
+    first = bulkheads.get("get_trending_products", limit=2, timeout=1.0)
+    assert bulkheads.get("get_trending_products", limit=8) is first
+    assert first.limit == 2
+    bulkheads.wrap(tools.generate_product_copy, limit=1)
+    assert set(bulkheads.stats()) == {"get_trending_products", "generate_product_copy"}
+    bulkheads.shutdown()
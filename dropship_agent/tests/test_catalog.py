@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from catalog import ProductCatalog, get_catalog, parse_price_range
+
+CATEGORIES = ["electronics", "fashion", "home", "beauty"]
+DEMANDS = ["Low", "Medium", "High", "Very High"]
+COMPETITIONS = ["Low", "Medium", "High", "Extreme"]
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    rng = random.Random(5)
+    rows = []
+    for i in range(6000):
+        cost = rng.uniform(2, 80)
+        rows.append({"name": f"SKU {i}", "category": rng.choice(CATEGORIES), "cost": cost,
+                     "sell": f"${cost * rng.uniform(1.2, 4):.6f}", "demand": rng.choice(DEMANDS),
+                     "competition": rng.choice(COMPETITIONS)})
+    return ProductCatalog(rows)
+
+
+def linear_scan(catalog, category="all", min_price=0.0, max_price=float("inf"),
+                demand=None, competition=None, sort_by="score", k=8):
+    """Every row checked in turn, as get_trending_products did before the indexes"""
+    rows = [catalog.row(i) for i in range(len(catalog))]
+    matches = [
+        row for row in rows
+        if category in ("all", row["category"]) and min_price <= row["sell"] <= max_price
+        and (demand is None or row["demand"].lower() == demand.lower())
+        and (competition is None or row["competition"].lower() == competition.lower())
+    ]
+    return sorted(matches, key=lambda row: row[sort_by], reverse=True)[:k]
+
+
+@pytest.mark.parametrize("query", [
+    {"category": "fashion", "min_price": 40, "max_price": 45},
+    {"category": "all", "min_price": 0, "max_price": 500},
+    {"category": "home", "min_price": 10, "max_price": 300, "sort_by": "margin", "k": 20},
+    {"category": "all", "min_price": 0, "max_price": 100, "demand": "Very High", "competition": "low",
+     "sort_by": "margin"},
+    {"category": "all", "min_price": 0, "max_price": 400, "demand": "high", "competition": "Extreme"},
+    {"category": "beauty", "min_price": 900, "max_price": 1000},
+])
+def test_queries_match_a_linear_scan(catalog, query):
+    assert catalog.query(**query) == linear_scan(catalog, **query)
+
+
+def test_unknown_category_searches_everything(catalog):
+    assert catalog.query(category="garden", max_price=50) == catalog.query(category="all", max_price=50)
+
+
+def test_shipped_catalog_loads():
+    catalog = get_catalog()
+    assert len(catalog) > 0
+    assert catalog.query(k=3) == linear_scan(catalog, k=3)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("0-50", (0.0, 50.0)),
+    ("$40-$20", (20.0, 40.0)),
+    ("1,000-2,500", (1000.0, 2500.0)),
+    ("50+", (50.0, float("inf"))),
+    ("under 30", (0.0, 30.0)),
+    ("", (0.0, float("inf"))),
+])
+def test_parse_price_range(text, expected):
+    assert parse_price_range(text) == expected
@@ -0,0 +1,37 @@
+from chat_view import format_latency, history_window, message_html
+
+
+def chat(i):
+    return {'type': 'user' if i % 2 == 0 else 'ai', 'message': f"message {i}"}
+
+
+def test_window_shows_the_latest_messages():
+    history = [chat(i) for i in range(50)]
+    hidden, html = history_window(history, 20, {})
+    assert hidden == 30
+    assert "message 29<" not in html and "message 30<" in html and "message 49<" in html
+    assert html.index("message 30<") < html.index("message 49<")
+    assert history_window(history, 100, {})[0] == 0
+
+
+def test_joined_html_is_reused_until_the_history_changes():
+    history, memo = [chat(i) for i in range(5)], {}
+    _, html = history_window(history, 20, memo)
+    assert history_window(history, 20, memo)[1] is html
+    history.append(chat(5))
+    _, grown = history_window(history, 20, memo)
+    assert grown is not html and grown.endswith(message_html(history[-1]))
+
+
+def test_bubbles_are_formatted_once():
+    message = {'type': 'ai', 'message': "Earbuds", 'latency': {'ttft': 0.4, 'total': 1.25, 'tokens': 900}}
+    html = message_html(message)
+    assert "🤖 Master AI:" in html and "⚡ first token 0.40s · ⏱️ total 1.25s · 📨 900 tokens sent" in html
+    message['message'] = "changed"
+    assert message_html(message) is html
+
+
+def test_latency_footer():
+    assert format_latency(None) == ""
+    assert "served from cache" in format_latency({'cached': True, 'total': 0.0})
+    assert "first token" not in format_latency({'ttft': None, 'total': 2.0})
@@ -0,0 +1,46 @@
+import pytest
+
+from copy_templates import render_product_copy
+
+
+def baseline_copy(product_name: str, key_features: str, target_audience: str, price: float) -> str:
+    """generate_product_copy as it was in main.py before copy_templates"""
+    title = f"🔥 {product_name.upper()} - Transform Your {target_audience} Experience!"
+
+    result = f"✍️ HIGH-CONVERTING PRODUCT COPY\n\n"
+    result += f"📝 PRODUCT TITLE:\n{title}\n\n"
+
+    result += f"🎯 MAIN DESCRIPTION:\n"
+    result += f"✨ Discover the game-changing {product_name} that's taking {target_audience} by storm!\n\n"
+    result += f"🔥 KEY FEATURES:\n{key_features}\n\n"
+    result += f"💫 WHY CHOOSE US?\n"
+    result += f"✅ Premium Quality Materials\n"
+    result += f"✅ Fast Worldwide Shipping (7-15 days)\n"
+    result += f"✅ 30-Day Money Back Guarantee\n"
+    result += f"✅ 24/7 Customer Support\n"
+    result += f"✅ Trusted by 10,000+ Happy Customers\n\n"
+
+    result += f"💰 SPECIAL OFFER: Just ${price} (Limited Time!)\n"
+    result += f"🚚 FREE SHIPPING on orders over $25\n\n"
+
+    result += f"⭐ CUSTOMER REVIEWS:\n"
+    result += f"\"Amazing quality! Exactly as described\" - Sarah M. ⭐⭐⭐⭐⭐\n"
+    result += f"\"Fast shipping and great customer service\" - Mike R. ⭐⭐⭐⭐⭐\n"
+    result += f"\"Perfect for my needs, highly recommend!\" - Lisa K. ⭐⭐⭐⭐⭐\n\n"
+
+    result += f"🔥 AD COPY VARIATIONS:\n"
+    result += f"1. \"This {product_name} is going VIRAL! Get yours before it's too late!\"\n"
+    result += f"2. \"Why pay more? Get premium {product_name} for just ${price}!\"\n"
+    result += f"3. \"10,000+ customers can't be wrong! Try {product_name} risk-free!\"\n"
+
+    return result
+
+
+@pytest.mark.parametrize("product", [
+    ("Wireless Earbuds Pro", "Noise cancelling, 30h battery", "commuters", 35.0),
+    ("Sunset Lamp", "- 16 colours\n- USB-C", "Gen Z {decor} fans", 19.99),
+    ("ünïcode 🔥 mug", "", "", 0),
+    ('Quote "Glow" \\ lamp', "{braces} and $signs", "100% of buyers", 1e-05),
+])
+def test_matches_the_baseline_copy_byte_for_byte(product):
+    assert render_product_copy(*product).encode() == baseline_copy(*product).encode()
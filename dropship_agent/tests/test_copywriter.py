@@ -0,0 +1,83 @@
+import asyncio
+import csv
+import json
+
+import pytest
+
+from copy_templates import render_product_copy
+from copywriter import build_polisher, checkpoint_path, row_fields, run_pipeline
+from master_agent import SharedAgent
+from stub_server import StubModelServer
+
+
+@pytest.fixture
+def products(tmp_path):
+    path = tmp_path / "products.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "category", "sell", "demand", "features"])
+        for i in range(10):
+            writer.writerow([f"Lamp {i}", "home", f"${i + 10}.50", "High", "" if i % 2 else f"{i} colours"])
+    return str(path)
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_row_fields_accept_column_aliases():
+    assert row_fields({"title": " Mug ", "sell": "$1,299.00", "audience": "chefs", "features": "steel"}, "x") == {
+        "product_name": "Mug", "key_features": "steel", "target_audience": "chefs", "price": 1299.0}
+    # Missing columns fall back to the category and demand, the default audience and a zero price
+    assert row_fields({"category": "home", "demand": "High"}, "shoppers") == {
+        "product_name": "Product", "key_features": "home, High demand", "target_audience": "shoppers", "price": 0.0}
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".csv"])
+def test_every_row_gets_the_template_copy(products, tmp_path, suffix):
+    out = str(tmp_path / f"copy{suffix}")
+    report = asyncio.run(run_pipeline(products, out, batch_size=3, default_audience="shoppers"))
+    assert (report["rows"], report["rows_this_run"], report["complete"]) == (10, 10, True)
+    if suffix == ".csv":
+        with open(out, newline="", encoding="utf-8") as f:
+            records = list(csv.DictReader(f))
+    else:
+        records = read_jsonl(out)
+    assert [int(r["row"]) for r in records] == list(range(10))
+    assert records[4]["copy"] == render_product_copy("Lamp 4", "4 colours", "shoppers", 14.5)
+
+
+def test_an_interrupted_run_resumes_at_its_checkpoint(products, tmp_path):
+    complete = str(tmp_path / "complete.jsonl")
+    asyncio.run(run_pipeline(products, complete, batch_size=4, default_audience="shoppers"))
+
+    out = str(tmp_path / "copy.jsonl")
+    asyncio.run(run_pipeline(products, out, batch_size=4, default_audience="shoppers"))
+    # Pretend the run stopped after the first batch, halfway through writing the second
+    with open(checkpoint_path(out), encoding="utf-8") as f:
+        state = json.load(f)
+    with open(out, encoding="utf-8") as f:
+        first_batch = "".join(f.readline() for _ in range(4))
+    state.update(rows=4, offset=len(first_batch.encode()), complete=False)
+    with open(checkpoint_path(out), "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    with open(out, "w", encoding="utf-8") as f:
+        f.write(first_batch + '{"row": 4, "prod')
+
+    report = asyncio.run(run_pipeline(products, out, batch_size=4, default_audience="shoppers"))
+    assert report["rows_this_run"] == 6
+    assert read_jsonl(out) == read_jsonl(complete)
+    # A finished run is not repeated
+    assert asyncio.run(run_pipeline(products, out, batch_size=4, default_audience="shoppers"))["rows_this_run"] == 0
+
+
+def test_polish_rewrites_each_description(products, tmp_path):
+    out = str(tmp_path / "copy.jsonl")
+    with StubModelServer(profile="instant", reply="A lamp for every room.") as server:
+        shared = SharedAgent(api_key="stub", base_url=server.base_url)
+        polisher = build_polisher(shared.config)
+        report = asyncio.run(run_pipeline(products, out, batch_size=3, default_audience="shoppers",
+                                          polisher=polisher, concurrency=4))
+    assert (report["polished"], report["failed"]) == (10, 0)
+    assert all(r["polished"] and r["description"] == "A lamp for every room." for r in read_jsonl(out))
@@ -0,0 +1,42 @@
+import gzip
+import json
+from datetime import datetime
+
+from export import ExportCursor, deferred_export, iter_ndjson, write_export
+
+
+def history(count):
+    return [{'type': 'user' if i % 2 == 0 else 'ai', 'message': f"Earbuds {i} 🔥\n\"quoted\"",
+             'timestamp': datetime(2026, 10, 1, 12, 0, i), 'html': "<div>not exported</div>"} for i in range(count)]
+
+
+def records(data):
+    return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+
+def test_one_json_line_per_message():
+    lines = list(iter_ndjson(history(3)))
+    assert len(lines) == 3 and all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    assert json.loads(lines[1]) == {'type': 'ai', 'message': "Earbuds 1 🔥\n\"quoted\"",
+                                    'timestamp': "2026-10-01T12:00:01"}
+
+
+def test_plain_and_gzip_exports_hold_the_same_records():
+    chats = history(4)
+    plain = write_export(chats).read()
+    compressed = write_export(chats, compress=True).read()
+    assert records(gzip.decompress(compressed)) == records(plain)
+    assert [r['message'] for r in records(plain)] == [c['message'] for c in chats]
+
+
+def test_since_last_exports_only_new_messages():
+    chats, cursor = history(3), ExportCursor()
+    export_new = deferred_export(chats, cursor, since_last=True)
+    assert len(records(export_new().read())) == 3
+    chats.extend(history(5)[3:])
+    assert [r['timestamp'] for r in records(export_new().read())] == ["2026-10-01T12:00:03", "2026-10-01T12:00:04"]
+    assert export_new().read() == b""
+    # A full export ignores the cursor
+    assert len(records(deferred_export(chats, cursor)().read())) == 5
+    cursor.reset()
+    assert len(records(export_new().read())) == 5
@@ -0,0 +1,67 @@
+import os
+import time
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import master_agent
+import tools
+from app_content import QUICK_ACTIONS
+from single_flight import get_single_flight
+from stub_server import StubModelServer
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+@pytest.fixture
+def slow_agent(monkeypatch):
+    """The app's shared agent, pointed at a stub that takes 10s per model call"""
+    with StubModelServer(latency=10.0, jitter=0.0) as server:
+        monkeypatch.setattr(master_agent, "_shared", master_agent.SharedAgent(api_key="stub", base_url=server.base_url))
+        yield
+
+
+def test_clear_chat_stops_a_running_turn(slow_agent):
+    at = AppTest.from_file(APP_PATH, default_timeout=30)
+    at.run()
+    clear = next(button for button in at.button if button.label == "🗑️ Clear Chat")
+
+    # The rerun that sent the message is still following the turn when the click comes in
+    at.toggle(key="bypass_cache").set_value(True)
+    at.text_input[0].input("Find trending products")
+    with pytest.raises(RuntimeError, match="timed out"):
+        at.run(timeout=2)
+    flight = get_single_flight().get(at.session_state["active_turn"]["key"])
+    assert flight is not None and not flight.token.cancelled
+
+    started = time.perf_counter()
+    clear.click().run()
+    assert time.perf_counter() - started < 5
+    assert flight.token.cancelled
+    assert at.session_state["active_turn"] is None
+    assert at.session_state["chat_history"] == []
+    assert at.session_state["telemetry"].totals["cancelled_turns"] == 1
+    assert not at.exception
+
+
+def test_reruns_reuse_the_process_wide_setup(monkeypatch):
+    built = []
+
+    class CountingAgent(master_agent.SharedAgent):
+        def __init__(self):
+            built.append(self)
+            super().__init__(api_key="stub", base_url=server.base_url)
+
+    with StubModelServer(profile="instant") as server:
+        monkeypatch.setattr(master_agent, "_shared", None)
+        monkeypatch.setattr(master_agent, "SharedAgent", CountingAgent)
+        tool = tools.get_trending_products
+        at = AppTest.from_file(APP_PATH, default_timeout=30)
+        for _ in range(3):
+            at.run()
+        assert not at.exception
+    # One agent for every rerun, and the tool objects were not rebuilt by the script
+    assert len(built) == 1 and master_agent._shared is built[0]
+    assert tools.get_trending_products is tool
+    labels = [button.label for button in at.button]
+    assert all(action["label"] in labels for action in QUICK_ACTIONS)
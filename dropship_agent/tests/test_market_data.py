@@ -0,0 +1,65 @@
+import pytest
+
+from market_data import DEFAULT_ANALYSIS, MarketDataStore, candidate_keys, create_database, load_records
+
+
+def market(product, niche, audience, captured, market_size, competition_level="Low"):
+    return [product, niche, audience, captured, market_size, 12.0, 30.0, competition_level, 8.4,
+            "TikTok|Instagram", "Gen Z", "Peak: Dec"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = str(tmp_path / "market.db")
+    create_database(path, seed_files=())
+    load_records(path, "markets", [
+        market("wireless earbuds", "electronics", "", "2026-01-01", 4_000_000),
+        market("wireless earbuds", "electronics", "", "2026-03-01", 5_000_000, "High"),
+        market("", "electronics", "", "2026-03-01", 900_000),
+    ])
+    load_records(path, "competitor_prices", [
+        ["wireless earbuds", "electronics", "", "2026-03-01", "SoundCo", 40.0, 0.5],
+        ["wireless earbuds", "electronics", "", "2026-03-01", "BudBay", 20.0, 0.3],
+    ])
+    return MarketDataStore(path)
+
+
+def test_candidate_keys_run_from_specific_to_catch_all():
+    assert candidate_keys("  Wireless   Earbuds", "Electronics", "Gen Z") == [
+        ("wireless earbuds", "electronics", "gen z"),
+        ("wireless earbuds", "electronics", ""),
+        ("wireless earbuds", None, None),
+        ("", "electronics", "gen z"),
+        ("", "electronics", ""),
+        ("", "", ""),
+    ]
+    # Duplicates collapse when the product or audience is empty
+    assert candidate_keys(None, "Electronics", "") == [("", "electronics", ""), ("", None, None), ("", "", "")]
+
+
+def test_lookup_takes_the_latest_closest_snapshot(store):
+    analysis = store.analysis("Wireless Earbuds", "electronics", "general")
+    assert analysis["snapshot"] == "2026-03-01"
+    assert analysis["market_size"] == "$5.0M monthly"
+    assert analysis["competition_level"] == "High"
+    assert analysis["top_players"] == ["SoundCo", "BudBay"]
+    assert analysis["avg_price"] == "$30.00"
+    # Another product falls back to the niche row, with the default competitor figures
+    lamp = store.analysis("Sunset Lamp", "electronics")
+    assert lamp["market_size"] == "$900K monthly"
+    assert lamp["top_players"] == DEFAULT_ANALYSIS["top_players"]
+    assert store.analysis("Yoga Mat", "fitness") == DEFAULT_ANALYSIS
+
+
+def test_a_new_load_invalidates_cached_analyses(store):
+    before = store.analysis("Wireless Earbuds", "electronics")
+    assert store.analysis("Wireless Earbuds", "electronics") is before
+    assert store.stats()["hits"] == 1
+    version = store.data_version()
+
+    load_records(store.path, "markets", [market("wireless earbuds", "electronics", "", "2026-06-01", 7_500_000)])
+    assert store.data_version() == version + 1
+    after = store.analysis("Wireless Earbuds", "electronics")
+    assert after["snapshot"] == "2026-06-01"
+    assert after["market_size"] == "$7.5M monthly"
+    assert store.stats()["hits"] == 1
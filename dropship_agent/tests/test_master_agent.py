@@ -0,0 +1,45 @@
+import threading
+
+import master_agent
+from master_agent import SharedAgent, get_shared_agent
+from stub_server import StubModelServer
+
+
+def test_every_session_gets_the_same_agent(monkeypatch):
+    monkeypatch.setattr(master_agent, "_shared", None)
+    monkeypatch.setenv("GEMINI_API_KEY", "stub")
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(get_shared_agent(prewarm=False))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(seen) == 8 and all(shared is seen[0] for shared in seen)
+    assert get_shared_agent(prewarm=False) is seen[0]
+
+
+def test_prewarm_opens_a_connection_once():
+    with StubModelServer(profile="instant") as server:
+        shared = SharedAgent(api_key="stub", base_url=server.base_url)
+        assert not shared.warm
+        future = shared.prewarm()
+        assert shared.prewarm() is future
+        future.result(timeout=10)
+        assert shared.warm and shared.prewarm_error is None
+        assert shared.prewarm_seconds is not None
+
+
+def test_prewarm_failure_is_recorded_not_raised():
+    # Nothing listens on port 9 locally, so the request fails fast
+    shared = SharedAgent(api_key="stub", base_url="http://127.0.0.1:9/v1/")
+    shared.client = shared.client.with_options(max_retries=0)
+    shared.prewarm().result(timeout=30)
+    assert not shared.warm
+    assert shared.prewarm_error
+
+
+def test_agent_is_built_with_every_tool():
+    shared = SharedAgent(api_key="stub", base_url="http://127.0.0.1:9/v1/")
+    assert [tool.name for tool in shared.agent.tools] == list(master_agent.TOOL_BULKHEADS)
+    assert shared.agent.instructions == master_agent.agent_instructions()
+    assert shared.config.model.model == master_agent.MODEL_NAME
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+from memory import ConversationMemory, item_tokens
+
+
+def tool_run(output):
+    """A run result with one tool call and its output"""
+    call = {"type": "function_call", "call_id": "1", "name": "get_trending_products", "arguments": "{}"}
+    result = {"type": "function_call_output", "call_id": "1", "output": output}
+    return SimpleNamespace(new_items=[
+        SimpleNamespace(type="tool_call_item", to_input_item=lambda: call),
+        SimpleNamespace(type="tool_call_output_item", to_input_item=lambda: result),
+    ])
+
+
+def test_input_stays_within_the_budget():
+    memory = ConversationMemory(budget=300)
+    for i in range(20):
+        memory.add_turn(f"Question {i} about earbuds " * 5, f"Answer {i} with margins " * 10)
+        items, tokens = memory.build_input("What next?")
+        assert tokens <= memory.budget
+        assert tokens == sum(item_tokens(item) for item in items)
+        assert items[-1] == {"role": "user", "content": "What next?"}
+    # The oldest turns were rolled into the summary rather than sent verbatim
+    assert items[0]["role"] == "system"
+    assert "Summary of the earlier conversation" in items[0]["content"]
+
+
+def test_tool_outputs_are_dropped_before_turns():
+    memory = ConversationMemory(budget=200)
+    memory.add_turn("Find trending products", "Earbuds and lamps", tool_run("x" * 800))
+    memory.add_turn("And suppliers?", "AliExpress")
+    items, tokens = memory.build_input("Thanks")
+    assert tokens <= memory.budget
+    assert [item.get("content") for item in items] == [
+        "Find trending products", "Earbuds and lamps", "And suppliers?", "AliExpress", "Thanks"]
+
+
+def test_an_oversized_message_is_sent_whole():
+    memory = ConversationMemory(budget=50)
+    memory.add_turn("Hi", "Hello")
+    message = "word " * 100
+    items, tokens = memory.build_input(message)
+    assert items == [{"role": "user", "content": message}]
+    assert tokens > memory.budget
+
+
+def test_context_key_follows_the_conversation():
+    memory = ConversationMemory()
+    assert memory.context_key() == ""
+    memory.add_turn("Hi", "Hello")
+    key = memory.context_key()
+    assert key and key == memory.context_key()
+    memory.add_turn("More", "Sure")
+    assert memory.context_key() != key
+    memory.clear()
+    assert memory.context_key() == ""
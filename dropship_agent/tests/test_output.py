@@ -0,0 +1,43 @@
+import json
+
+from agents import Agent
+from agents.result import RunResult
+from agents.run_context import RunContextWrapper
+
+from output import fallback_response, reply_text, response_text
+
+REPLY = 'Earbuds hum "softly",\n65% margin \\ sings 🔥'
+
+
+def result(final_output):
+    return RunResult(input="prompt", new_items=[], raw_responses=[], final_output=final_output,
+                     input_guardrail_results=[], output_guardrail_results=[],
+                     context_wrapper=RunContextWrapper(context=None), _last_agent=Agent(name="test"))
+
+
+def test_response_text_reads_plain_and_json_replies():
+    assert response_text(result(f"  {REPLY}\n")) == REPLY
+    assert response_text(result(json.dumps({"answer": REPLY}))) == REPLY
+    assert response_text(result(json.dumps({"answer": REPLY}, ensure_ascii=False))) == REPLY
+
+
+def test_empty_reply_falls_back():
+    assert response_text(result("   ")) is None
+    assert response_text(result(None)) is None
+    assert "dropshipping" in fallback_response("hello")
+
+
+def test_replies_opening_with_a_brace_are_kept():
+    for reply in ['{"products": ["Wireless Earbuds", "Sunset Lamp"]}', "{Note} earbuds sell well", '{"answer": 42}', "{"]:
+        assert reply_text(reply) == reply
+        assert response_text(result(reply)) == reply
+
+
+def test_streamed_json_shows_as_is_until_complete():
+    document = json.dumps({"answer": REPLY})
+    assert all(reply_text(document[:end]) == document[:end] for end in range(len(document)))
+    assert reply_text(document) == REPLY
+
+
+def test_reply_text_leaves_plain_text_alone():
+    assert reply_text("Plain {braces} stay") == "Plain {braces} stay"
@@ -0,0 +1,41 @@
+import pytest
+
+from profit_engine import SUPPLIERS, best_suppliers, calculate_profits, table_rows
+
+
+def scalar_profit(price, volume, supplier):
+    """The per-supplier arithmetic the tool did before it was vectorized"""
+    total_cost = round(price * supplier["cost_ratio"], 2) + supplier["shipping_cost"]
+    fees = price * 0.029 + 0.30 + price * 0.025
+    net_profit = price - total_cost - fees
+    return net_profit, net_profit / price * 100, net_profit * volume
+
+
+def test_matches_the_scalar_formula():
+    prices, volumes = [49.99, 12.5, 120.0], [100, 30, 7]
+    table = calculate_profits(["earbuds", "lamp", "watch"], prices, volumes)
+    assert len(table["product"]) == 3 * len(SUPPLIERS)
+    for row in table_rows(table):
+        net, margin, monthly = scalar_profit(row["target_price"], row["monthly_volume"], SUPPLIERS[row["supplier"]])
+        assert row["net_profit"] == pytest.approx(net)
+        assert row["margin"] == pytest.approx(margin)
+        assert row["monthly_profit"] == pytest.approx(monthly)
+
+
+def test_scalar_volume_applies_to_every_product():
+    table = calculate_profits(["a", "b"], [20, 40], 50)
+    assert set(table["monthly_volume"]) == {50.0}
+
+
+def test_zero_price_has_zero_margin():
+    table = calculate_profits(["free sample"], [0], 10)
+    assert list(table["margin"]) == [0.0] * len(SUPPLIERS)
+
+
+def test_best_suppliers_picks_the_highest_monthly_profit():
+    table = calculate_profits(["earbuds", "lamp"], [49.99, 12.5], [100, 30])
+    best = best_suppliers(table)
+    assert list(best["product"]) == ["earbuds", "lamp"]
+    for i, product in enumerate(best["product"]):
+        rows = table["product"] == product
+        assert best["monthly_profit"][i] == table["monthly_profit"][rows].max()
@@ -0,0 +1,65 @@
+import os
+import time
+from datetime import date, timedelta
+
+from agents import Agent
+
+import market_data
+import master_agent
+from market_data import MarketDataStore, create_database, load_records
+from response_cache import ResponseCache
+
+
+def test_market_reload_and_new_day_change_the_key(tmp_path, monkeypatch):
+    path = str(tmp_path / "market.db")
+    create_database(path, seed_files=())
+    monkeypatch.setattr(market_data, "_store", MarketDataStore(path))
+    cache = ResponseCache(cache_dir=str(tmp_path / "responses"))
+    agent = Agent(name="Master Dropshipping AI", instructions="")
+
+    key = cache.key("Analyze the market for earbuds", agent, None, master_agent.data_stamp())
+    cache.put(key, "Earbuds: medium competition")
+    assert cache.key("analyze the market  for earbuds", agent, None, master_agent.data_stamp()) == key
+
+    load_records(path, "markets", [["earbuds", "electronics", "", "2026-06-01", 5e6, 12.0, 30.0, "High", 8.0,
+                                    "TikTok", "Gen Z", "Peak: Dec"]])
+    reloaded = cache.key("Analyze the market for earbuds", agent, None, master_agent.data_stamp())
+    assert reloaded != key
+    assert cache.get(reloaded) is None
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    monkeypatch.setattr(master_agent, "date", Tomorrow)
+    assert cache.key("Analyze the market for earbuds", agent, None, master_agent.data_stamp()) != reloaded
+
+
+def test_hits_come_from_memory_then_disk(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path))
+    cache.put("k", "Earbuds sell")
+    assert cache.get("k") == "Earbuds sell"
+    assert ResponseCache(cache_dir=str(tmp_path)).get("k") == "Earbuds sell"
+    assert cache.get("other") is None
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_expired_entry_is_a_miss_and_leaves_the_disk(tmp_path, monkeypatch):
+    cache = ResponseCache(ttl=60, cache_dir=str(tmp_path))
+    cache.put("k", "Earbuds sell")
+    later = time.time() + 61
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.get("k") is None
+    assert cache.stats()["misses"] == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_startup_sweeps_expired_files(tmp_path):
+    cache = ResponseCache(ttl=60, cache_dir=str(tmp_path))
+    cache.put("old", "Last year's trends")
+    cache.put("new", "This week's trends")
+    stale = time.time() - 120
+    os.utime(tmp_path / "old.json", (stale, stale))
+    ResponseCache(ttl=60, cache_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == ["new.json"]
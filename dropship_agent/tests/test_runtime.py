@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from runtime import AgentRuntime, CancelToken, TurnCancelled
+
+
+@pytest.fixture
+def runtime():
+    runtime = AgentRuntime(name="test-loop")
+    yield runtime
+    runtime.stop()
+
+
+def test_cancelled_token_stops_the_run(runtime):
+    token, stopped = CancelToken(), threading.Event()
+
+    async def turn():
+        try:
+            await asyncio.sleep(5)
+        finally:
+            stopped.set()
+
+    threading.Timer(0.1, token.cancel).start()
+    started = time.perf_counter()
+    with pytest.raises(TurnCancelled) as raised:
+        runtime.run(turn(), token=token)
+    assert raised.value.reason == "cancelled"
+    assert time.perf_counter() - started < 1
+    # The task on the loop was cancelled, not just abandoned
+    assert stopped.wait(1)
+
+
+def test_deadline_cancels_with_timeout(runtime):
+    token = CancelToken(deadline=0.1)
+    with pytest.raises(TurnCancelled) as raised:
+        runtime.run(asyncio.sleep(5), token=token)
+    assert raised.value.reason == "timeout"
+
+
+def test_closed_token_ignores_late_cancels(runtime):
+    token = CancelToken(deadline=0.1)
+    assert runtime.run(asyncio.sleep(0, result="answer"), token=token) == "answer"
+    token.close()
+    time.sleep(0.2)
+    token.cancel()
+    assert not token.cancelled
+
+
+def test_iterate_stops_on_cancel(runtime):
+    token = CancelToken()
+
+    async def deltas():
+        for word in ("Earbuds", "hum", "softly"):
+            yield word
+        await asyncio.sleep(5)
+        yield "never"
+
+    received = []
+    with pytest.raises(TurnCancelled):
+        for word in runtime.iterate(deltas(), token=token):
+            received.append(word)
+            if len(received) == 3:
+                token.cancel()
+    assert received == ["Earbuds", "hum", "softly"]
+
+
+def test_runs_share_one_loop_thread(runtime):
+    async def where():
+        return asyncio.get_running_loop(), threading.current_thread().name
+
+    first, second = runtime.run(where()), runtime.run(where())
+    assert first == second == (runtime.loop, "test-loop")
+    assert first[1] != threading.current_thread().name
+
+
+def test_submit_runs_concurrently_on_the_loop(runtime):
+    started = time.perf_counter()
+    futures = [runtime.submit(asyncio.sleep(0.2, result=i)) for i in range(5)]
+    assert [future.result() for future in futures] == list(range(5))
+    assert time.perf_counter() - started < 0.6
+
+
+def test_errors_surface_and_the_loop_survives(runtime):
+    async def fail():
+        raise ValueError("quota exceeded")
+
+    with pytest.raises(ValueError, match="quota exceeded"):
+        runtime.run(fail())
+    assert runtime.run(asyncio.sleep(0, result="still running")) == "still running"
+
+
+def test_stopped_runtime_starts_again(runtime):
+    runtime.run(asyncio.sleep(0))
+    runtime.stop()
+    assert runtime.run(asyncio.sleep(0, result="restarted")) == "restarted"
@@ -0,0 +1,91 @@
+import asyncio
+import json
+from datetime import date, timedelta
+
+import pytest
+from agents.run_context import RunContextWrapper
+
+import tools
+from seasonal import event_date, get_seasonal_index
+
+# The three months seasonal_opportunity_finder knew before the full-year index
+BASELINE_MONTHS = {
+    "January": {"trends": ["Fitness Equipment", "Planners & Organizers", "Home Organization", "Self-Care Products"],
+                "keywords": ["New Year", "Resolution", "Fitness", "Organization"],
+                "peak_dates": "Jan 1-31", "competition": "High"},
+    "February": {"trends": ["Valentine's Gifts", "Romantic Decor", "Couple Accessories", "Love-themed Items"],
+                 "keywords": ["Valentine", "Love", "Romantic", "Couple"],
+                 "peak_dates": "Jan 25 - Feb 14", "competition": "Very High"},
+    "December": {"trends": ["Christmas Gifts", "Holiday Decor", "Winter Items", "New Year Prep"],
+                 "keywords": ["Christmas", "Holiday", "Gift", "Winter"],
+                 "peak_dates": "Nov 1 - Dec 25", "competition": "Extreme"},
+}
+
+
+def all_windows(index, years):
+    """Every peak window in the given years, expanded without the per-year index"""
+    for year in years:
+        for event in index.events:
+            peak = event_date(event["date"], year)
+            yield event["name"], peak - timedelta(days=event["window_days"]), peak
+
+
+def test_every_month_has_a_profile_and_the_old_ones_are_unchanged():
+    index = get_seasonal_index()
+    assert len(index.months) == 12
+    for name, profile in BASELINE_MONTHS.items():
+        assert index.months[name] == profile
+
+
+@pytest.mark.parametrize("key", ["March", "mar", "MAR", "3", " march "])
+def test_month_aliases(key):
+    assert get_seasonal_index().month(key)[0] == "March"
+
+
+def test_unknown_month():
+    assert get_seasonal_index().month("Smarch") is None
+
+
+def test_moving_holidays():
+    assert event_date("12-25", 2026) == date(2026, 12, 25)
+    thanksgiving = {"month": 11, "weekday": "Thursday", "nth": 4}
+    assert event_date(thanksgiving, 2026) == date(2026, 11, 26)
+    assert event_date(dict(thanksgiving, offset_days=1), 2027) == date(2027, 11, 26)
+    assert event_date({"month": 5, "weekday": "Sunday", "nth": 2}, 2026) == date(2026, 5, 10)
+
+
+@pytest.mark.parametrize("today", [date(2026, 1, 1), date(2026, 3, 20), date(2026, 11, 20), date(2026, 12, 20)])
+@pytest.mark.parametrize("days", [0, 10, 45, 120])
+def test_upcoming_matches_a_scan_of_every_window(today, days):
+    index = get_seasonal_index()
+    last = today + timedelta(days=days)
+    expected = {(name, peak) for name, start, peak in all_windows(index, range(today.year - 1, last.year + 2))
+                if start <= last and peak >= today}
+    upcoming = index.upcoming(today, days)
+    assert {(window["name"], window["peak"]) for window in upcoming} == expected
+    assert [window["lead_days"] for window in upcoming] == sorted(window["lead_days"] for window in upcoming)
+    assert all(window["days_to_peak"] == (window["peak"] - today).days for window in upcoming)
+
+
+def seasonal(**arguments):
+    return asyncio.run(tools.seasonal_opportunity_finder.on_invoke_tool(RunContextWrapper(context=None), json.dumps(arguments)))
+
+
+def test_tool_reports_the_month_and_its_peaks(monkeypatch):
+    class Today(date):
+        @classmethod
+        def today(cls):
+            return date(2026, 10, 18)
+
+    monkeypatch.setattr(tools, "date", Today)
+    text = seasonal(current_month="dec", days_ahead=30)
+    assert text.startswith("📅 SEASONAL OPPORTUNITIES - DECEMBER")
+    assert "Christmas Gifts" in text and "⚔️ Competition Level: Extreme" in text
+    # Looked ahead from Dec 1, the asked-for month's next start
+    assert "PEAKS IN THE NEXT 30 DAYS FROM DEC 01:" in text
+    assert "Christmas (Nov 01 - Dec 25): open now" in text
+
+
+def test_tool_handles_bad_input():
+    assert seasonal(current_month="Smarch").startswith("❓ Unknown month 'Smarch'")
+    assert "PEAKS IN THE NEXT 0 DAYS" in seasonal(current_month="June", days_ahead=-5)
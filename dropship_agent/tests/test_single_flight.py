@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from runtime import TurnCancelled
+from single_flight import SingleFlight, flight_key
+
+
+def gated_turn(release, started=None):
+    """A start(token) whose turn streams one delta, then waits for release or cancellation"""
+    def start(token):
+        if started is not None:
+            started.append(token)
+        yield "delta", "Earbuds"
+        token.on_cancel(release.set)
+        release.wait(5)
+        if token.cancelled:
+            raise TurnCancelled(token.reason)
+        yield "done", "Earbuds sell"
+
+    return start
+
+
+def test_duplicates_join_the_running_flight():
+    flights, release, started = SingleFlight(), threading.Event(), []
+    key = flight_key("session", "Find trending products")
+    flight, leader = flights.join(key, gated_turn(release, started))
+    # Prompts that only differ in case and spacing are the same flight
+    duplicate, duplicate_leader = flights.join(flight_key("session", "  find TRENDING products "), gated_turn(release))
+    assert (leader, duplicate_leader) == (True, False)
+    assert duplicate is flight
+    assert flights.stats() == {"started": 1, "suppressed": 1, "in_flight": 1}
+
+    release.set()
+    assert list(flight.follow()) == [("delta", "Earbuds"), ("done", "Earbuds sell")]
+    assert list(duplicate.follow()) == [("delta", "Earbuds"), ("done", "Earbuds sell")]
+    assert len(started) == 1
+
+
+def test_only_the_first_completion_records_the_turn():
+    flights, release = SingleFlight(), threading.Event()
+    release.set()
+    flight, _ = flights.join(flight_key("session", "hi"), gated_turn(release))
+    list(flight.follow())
+    assert flights.complete(flight) is True
+    assert flights.complete(flight) is False
+    assert flights.get(flight.key) is None
+
+
+def test_cancel_publishes_stopped():
+    flights = SingleFlight()
+    flight, _ = flights.join(flight_key("session", "hi"), gated_turn(threading.Event()))
+    flight.cancel()
+    assert list(flight.follow()) == [("delta", "Earbuds"), ("stopped", "cancelled")]
+
+
+def test_errors_reach_every_follower():
+    def failing(token):
+        raise ValueError("model unavailable")
+        yield
+
+    flights = SingleFlight()
+    flight, _ = flights.join(flight_key("session", "hi"), failing)
+    with pytest.raises(ValueError, match="model unavailable"):
+        list(flight.follow())
+
+
+def test_finished_flights_expire_after_the_ttl():
+    flights, release = SingleFlight(ttl=0.01), threading.Event()
+    release.set()
+    flight, _ = flights.join(flight_key("session", "hi"), gated_turn(release))
+    list(flight.follow())
+    time.sleep(0.05)
+    assert flights.get(flight.key) is None
+    _, leader = flights.join(flight.key, gated_turn(release))
+    assert leader is True
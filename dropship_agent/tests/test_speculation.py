@@ -0,0 +1,71 @@
+import asyncio
+import dataclasses
+import json
+import time
+
+from agents import Agent
+
+import tools
+from bulkhead import ToolBulkheads
+from speculation import ToolSpeculator, predict_arguments
+from tool_cache import normalize_arguments
+
+
+def slowed(tool, delay=0.2):
+    invoke = tool.on_invoke_tool
+
+    async def on_invoke_tool(ctx, args_json):
+        time.sleep(delay)
+        return await invoke(ctx, args_json)
+
+    return dataclasses.replace(tool, on_invoke_tool=on_invoke_tool)
+
+
+def predicted_key(tool, prompt):
+    arguments = predict_arguments(tool, prompt)
+    return None if arguments is None else normalize_arguments(tool, json.dumps(arguments))
+
+
+def test_seasonal_prediction_matches_a_call_without_a_month():
+    tool = tools.seasonal_opportunity_finder
+    key = predicted_key(tool, "Any seasonal opportunities?")
+    assert key == normalize_arguments(tool, "{}")
+    assert key == normalize_arguments(tool, json.dumps({"current_month": None, "days_ahead": 45}))
+
+
+def test_prediction_only_fills_what_the_prompt_states():
+    tool = tools.seasonal_opportunity_finder
+    assert predict_arguments(tool, "Seasonal ideas for December") == {"current_month": "December"}
+    assert predict_arguments(tool, "Seasonal picks for the next 30 days") == {"days_ahead": 30}
+
+
+def test_missing_required_argument_means_no_prediction():
+    tool = tools.find_suppliers_and_calculate_profits
+    assert predict_arguments(tool, "Find suppliers for Wireless Earbuds") is None
+    assert predict_arguments(tool, "Find suppliers for Wireless Earbuds at $49.99") == {
+        "product_name": "Wireless Earbuds", "target_selling_price": 49.99}
+
+
+def test_predictions_run_on_their_own_threads():
+    bulkheads = ToolBulkheads()
+    speculator = ToolSpeculator(limit=1)
+    bare = [slowed(tools.analyze_market_competition), slowed(tools.find_suppliers_and_calculate_profits)]
+    wrapped = [speculator.wrap(bulkheads.wrap(tool, limit=1), tool) for tool in bare]
+    agent = Agent(name="test", tools=wrapped)
+
+    async def turn():
+        speculation = speculator.start(agent, "Analyze the market competition for Wireless Earbuds in electronics, "
+                                              "then compare supplier profits at $49.99")
+        await asyncio.sleep(0.05)
+        busy = {name: stats["in_flight"] for name, stats in bulkheads.stats().items()}
+        speculation.close()
+        return busy
+
+    busy = asyncio.run(turn())
+    # Both tools' bulkheads stay free for the turn's real calls
+    assert busy == {"analyze_market_competition": 0, "find_suppliers_and_calculate_profits": 0}
+    # One speculative thread: the second guess is not started rather than queued
+    stats = speculator.stats()
+    assert (stats["predicted"], stats["skipped"]) == (1, 1)
+    speculator.shutdown()
+    bulkheads.shutdown()
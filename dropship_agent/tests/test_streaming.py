@@ -0,0 +1,38 @@
+import pytest
+
+from master_agent import SharedAgent
+from output import response_text
+from runtime import CancelToken, TurnCancelled
+from streaming import stream_agent_turn
+from stub_server import StubModelServer
+from tool_cache import get_tool_cache
+
+
+@pytest.fixture
+def shared():
+    with StubModelServer(profile="instant") as server:
+        get_tool_cache().clear()
+        yield SharedAgent(api_key="stub", base_url=server.base_url)
+
+
+def test_deltas_add_up_to_the_final_reply(shared):
+    events = list(stream_agent_turn(shared.agent, "Find trending products", shared.config))
+    kinds = [kind for kind, _ in events]
+    assert kinds.index("tool_called") < kinds.index("tool_output") < kinds.index("text")
+    assert ("tool_called", "get_trending_products") in events
+    assert ("tool_output", "get_trending_products") in events
+
+    kind, done = events[-1]
+    assert kind == "done" and kinds.count("done") == 1
+    assert kinds.count("text") > 1
+    assert "".join(payload for kind, payload in events if kind == "text") == response_text(done["result"])
+    assert done["ttft"] is not None and done["ttft"] <= done["total"]
+
+
+def test_cancelled_stream_raises_turn_cancelled():
+    with StubModelServer(latency=5.0, jitter=0.0) as server:
+        shared = SharedAgent(api_key="stub", base_url=server.base_url)
+        token = CancelToken(deadline=0.2)
+        with pytest.raises(TurnCancelled) as raised:
+            list(stream_agent_turn(shared.agent, "hello", shared.config, token=token))
+    assert raised.value.reason == "timeout"
@@ -0,0 +1,63 @@
+import json
+import time
+
+import pytest
+from openai import OpenAI
+
+from stub_server import StubModelServer
+
+TOOLS = [{"type": "function", "function": {"name": name, "parameters": {"type": "object", "properties": {}}}}
+         for name in ("get_trending_products", "analyze_market_competition")]
+
+
+@pytest.fixture
+def server():
+    with StubModelServer(profile="instant") as server:
+        yield server
+
+
+def client(server):
+    return OpenAI(api_key="stub", base_url=server.base_url, max_retries=0)
+
+
+def test_scripted_tool_calls_then_reply(server):
+    messages = [{"role": "user", "content": "Find trending products"}]
+    first = client(server).chat.completions.create(model="stub", messages=messages, tools=TOOLS)
+    choice = first.choices[0]
+    assert choice.finish_reason == "tool_calls"
+    call = choice.message.tool_calls[0]
+    assert (call.function.name, json.loads(call.function.arguments)) == (
+        "get_trending_products", {"category": "all", "price_range": "0-50"})
+
+    messages += [choice.message.model_dump(exclude_none=True),
+                 {"role": "tool", "tool_call_id": call.id, "content": "Earbuds"}]
+    second = client(server).chat.completions.create(model="stub", messages=messages, tools=TOOLS)
+    assert second.choices[0].finish_reason == "stop"
+    assert second.choices[0].message.content == "Here are the trending products I found with get_trending_products."
+
+
+def test_rules_need_their_tools_offered(server):
+    reply = client(server).chat.completions.create(
+        model="stub", messages=[{"role": "user", "content": "Find trending products"}])
+    assert reply.choices[0].message.content == server.reply
+    assert reply.usage.prompt_tokens > 0 and reply.usage.completion_tokens > 0
+
+
+def test_stream_chunks_join_into_the_reply(server):
+    stream = client(server).chat.completions.create(
+        model="stub", messages=[{"role": "user", "content": "hello"}], stream=True)
+    chunks = list(stream)
+    assert "".join(c.choices[0].delta.content or "" for c in chunks) == server.reply
+    assert chunks[-1].choices[0].finish_reason == "stop"
+    assert chunks[-1].usage.completion_tokens == len(server.reply.split())
+
+
+def test_latency_and_connections():
+    with StubModelServer(latency=0.2, jitter=0.0, connect_latency=0.1) as server:
+        shared = client(server)
+        started = time.perf_counter()
+        for _ in range(2):
+            shared.chat.completions.create(model="stub", messages=[{"role": "user", "content": "hello"}])
+        # Both requests reuse one keep-alive connection, so the connect latency is paid once
+        assert time.perf_counter() - started >= 0.5
+        assert (server.requests, server.connections) == (2, 1)
@@ -0,0 +1,28 @@
+from styles import compile_css, compiled_stylesheet, read_sources
+
+
+def test_later_rules_override_earlier_ones():
+    base = ".card { color: red; padding: 4px; }\n.title { font-weight: 600 }"
+    theme = "/* theme */\n.card {\n  color: blue;\n  margin: 0 auto;\n}"
+    assert compile_css([base, theme]) == ".title{font-weight:600}.card{padding:4px;color:blue;margin:0 auto}"
+
+
+def test_repeated_property_keeps_its_last_value():
+    assert compile_css([".a { color: red; color: green }"]) == ".a{color:green}"
+
+
+def test_selectors_and_values_are_minified():
+    css = "div  >  p ,  span { font-family: Inter , sans-serif ; }"
+    assert compile_css([css]) == "div>p,span{font-family:Inter,sans-serif}"
+
+
+def test_at_rules_stay_whole_and_later_ones_win():
+    first = "@import url('a.css');\n@keyframes pulse { from { opacity: 0 } to { opacity: 1 } }"
+    second = "@import url('a.css');\n@keyframes pulse { to { opacity: .5 } }"
+    assert compile_css([first, second]) == "@import url('a.css');@keyframes pulse{to{opacity:.5}}"
+
+
+def test_compiled_stylesheet_is_stable_for_the_same_sources():
+    css, digest = compiled_stylesheet()
+    assert (css, digest) == compiled_stylesheet()
+    assert css == compile_css(read_sources())
@@ -0,0 +1,70 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import telemetry
+from master_agent import SharedAgent, run_agent_sync
+from stub_server import StubModelServer
+from telemetry import SessionTelemetry, TurnTelemetry, _merged_length
+from tool_cache import get_tool_cache
+
+
+def test_overlapping_tool_time_counts_once():
+    assert _merged_length([]) == 0.0
+    assert _merged_length([(0, 2), (1, 3), (5, 6)]) == pytest.approx(4.0)
+    assert _merged_length([(4, 5), (0, 1), (0.5, 0.75)]) == pytest.approx(2.0)
+
+
+def test_parallel_tools_are_not_double_counted():
+    turn = TurnTelemetry()
+
+    async def tool_call(name):
+        tool = SimpleNamespace(name=name)
+        await turn.on_tool_start(None, None, tool)
+        await asyncio.sleep(0.2)
+        await turn.on_tool_end(None, None, tool, "result")
+
+    async def step():
+        await asyncio.gather(tool_call("get_trending_products"), tool_call("analyze_market_competition"))
+
+    asyncio.run(step())
+    record = turn.finish()
+    assert record['tool_calls'] == 2
+    assert 0.2 <= record['tool'] < 0.35
+    assert record['model'] == pytest.approx(record['wall'] - record['tool'])
+
+
+def test_turn_record_reads_usage_from_the_run():
+    with StubModelServer(profile="instant") as server:
+        get_tool_cache().clear()
+        shared = SharedAgent(api_key="stub", base_url=server.base_url)
+        turn = TurnTelemetry(context_tokens=120)
+        result = run_agent_sync(shared.agent, "Find trending products", shared.config, telemetry=turn)
+    record = turn.finish(result, ttft=0.1)
+    assert record['tool_calls'] == 1 and record['requests'] == 2
+    assert record['input_tokens'] > 0 and record['output_tokens'] > 0
+    assert (record['ttft'], record['context_tokens'], record['response_cache_hit']) == (0.1, 120, False)
+
+
+def test_session_totals_add_up_and_are_logged(tmp_path, monkeypatch):
+    log = tmp_path / "turns.jsonl"
+    monkeypatch.setattr(telemetry, "TELEMETRY_LOG", str(log))
+    session = SessionTelemetry()
+    first, cached = TurnTelemetry().finish(), TurnTelemetry().finish(cached=True)
+    first.update(wall=1.5, tool_calls=2, input_tokens=900)
+    session.record_turn(first)
+    session.record_turn(cached)
+    session.count_stopped("timeout")
+    session.count_stopped("cancelled")
+    session.count_duplicate()
+
+    assert session.last_turn is cached
+    assert session.totals['wall'] == pytest.approx(1.5 + cached['wall'])
+    assert (session.totals['tool_calls'], session.totals['input_tokens']) == (2, 900)
+    assert session.totals['response_cache_hits'] == 1
+    assert (session.totals['timed_out_turns'], session.totals['cancelled_turns']) == (1, 1)
+    assert session.totals['duplicates_suppressed'] == 1
+    assert [json.loads(line) for line in log.read_text().splitlines()] == session.turns
+    assert session.to_ndjson() == log.read_text()
@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+from agents import RunContextWrapper, function_tool
+
+from tool_cache import ToolCache, ToolFailure, normalize_arguments, tool_error
+
+calls = []
+
+
+@function_tool(failure_error_function=tool_error)
+def lookup(product_name: str, price: float, volume: int = 100) -> str:
+    """Test tool: fails on its first call, then echoes its arguments"""
+    calls.append(product_name)
+    if len(calls) == 1:
+        raise RuntimeError("supplier API down")
+    return f"{product_name} {price} {volume}"
+
+
+def invoke(tool, **arguments):
+    return asyncio.run(tool.on_invoke_tool(RunContextWrapper(context=None), json.dumps(arguments)))
+
+
+def test_normalize_arguments_fills_defaults_and_sorts_keys():
+    a = normalize_arguments(lookup, json.dumps({"price": 25.0, "product_name": "Earbuds"}))
+    b = normalize_arguments(lookup, json.dumps({"product_name": "Earbuds", "volume": 100, "price": 25}))
+    assert a == b
+    assert json.loads(a) == {"price": 25, "product_name": "Earbuds", "volume": 100}
+
+
+def test_normalize_arguments_passes_invalid_json_through():
+    assert normalize_arguments(lookup, "{not json") == "{not json"
+
+
+def test_failures_are_not_memoized():
+    calls.clear()
+    cached = ToolCache().wrap(lookup)
+
+    failed = invoke(cached, product_name="Earbuds", price=25)
+    assert isinstance(failed, ToolFailure)
+    assert "supplier API down" in failed
+
+    assert invoke(cached, product_name="Earbuds", price=25) == "Earbuds 25.0 100"
+    assert invoke(cached, product_name="Earbuds", price=25.0, volume=100) == "Earbuds 25.0 100"
+    assert len(calls) == 2
+
+
+def test_vary_on_separates_entries():
+    calls.clear()
+    calls.append("skip the failing first call")
+    version = [1]
+    cache = ToolCache()
+    cached = cache.wrap(lookup, vary_on=lambda: version[0])
+
+    invoke(cached, product_name="Lamp", price=10)
+    assert cache.contains(lookup, json.dumps({"product_name": "Lamp", "price": 10}))
+    version[0] = 2
+    assert not cache.contains(lookup, json.dumps({"product_name": "Lamp", "price": 10}))
+    invoke(cached, product_name="Lamp", price=10)
+    assert len(calls) == 3
+    assert cache.stats()["lookup"] == {"hits": 0, "misses": 2, "hit_rate": 0.0, "time_saved": 0.0}
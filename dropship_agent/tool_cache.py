@@ -0,0 +1,140 @@
+import dataclasses
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from agents.tool import default_tool_error_function
+
+from telemetry import current_turn
+
+
+class ToolFailure(str):
+    """Message handed to the model in place of a tool result, e.g. after a timeout; never memoized"""
+
+
+def tool_error(ctx, error):
+    """failure_error_function for function_tool: the SDK's error message, as a ToolFailure"""
+    return ToolFailure(default_tool_error_function(ctx, error))
+
+
+def nullable(schema):
+    """Whether a parameter's JSON schema admits null"""
+    return any(option.get("type") == "null" for option in schema.get("anyOf", ()))
+
+
+def normalize_arguments(tool, args_json):
+    """Canonical JSON for a tool call: schema defaults filled in, keys sorted, 25.0 == 25.
+
+    Strict schemas drop a None default, so a nullable parameter left out counts as null.
+    """
+    try:
+        args = json.loads(args_json) if args_json else {}
+    except ValueError:
+        return args_json
+    if not isinstance(args, dict):
+        return args_json
+    for name, schema in tool.params_json_schema.get("properties", {}).items():
+        if name not in args and "default" in schema:
+            args[name] = schema["default"]
+        elif name not in args and nullable(schema):
+            args[name] = None
+    for name, value in args.items():
+        if isinstance(value, float) and value.is_integer():
+            args[name] = int(value)
+    return json.dumps(args, sort_keys=True, ensure_ascii=False)
+
+
+class ToolCache:
+    """LRU memo of function_tool results, shared by every agent that uses the wrapped tools"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._stats = {}
+        self._vary_on = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, tool, vary_on=None):
+        """Return a copy of a FunctionTool whose results are memoized.
+
+        vary_on is an optional zero-argument callable whose value is added to the
+        key, for tools whose output also depends on something besides their
+        arguments (e.g. the current month).
+        """
+        invoke = tool.on_invoke_tool
+        self._vary_on[tool.name] = vary_on
+
+        async def on_invoke_tool(ctx, args_json):
+            key = self._key(tool, args_json, vary_on)
+            with self._lock:
+                stats = self._stats.setdefault(tool.name, {"hits": 0, "misses": 0, "time_saved": 0.0, "run_time": {}})
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    stats["hits"] += 1
+                    stats["time_saved"] += stats["run_time"].get(key, 0.0)
+                    turn = current_turn.get()
+                    if turn is not None:
+                        turn.tool_cache_hits += 1
+                    return self._entries[key]
+
+            start = time.perf_counter()
+            result = await invoke(ctx, args_json)
+            elapsed = time.perf_counter() - start
+
+            if isinstance(result, ToolFailure):
+                return result
+
+            with self._lock:
+                stats["misses"] += 1
+                stats["run_time"][key] = elapsed
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._stats[evicted[0]]["run_time"].pop(evicted, None)
+            return result
+
+        return dataclasses.replace(tool, on_invoke_tool=on_invoke_tool)
+
+    @staticmethod
+    def _key(tool, args_json, vary_on):
+        return tool.name, normalize_arguments(tool, args_json), vary_on() if vary_on else None
+
+    def contains(self, tool, args_json):
+        """Whether a call of a wrapped tool with these arguments would be answered from the cache"""
+        key = self._key(tool, args_json, self._vary_on.get(tool.name))
+        with self._lock:
+            return key in self._entries
+
+    def stats(self):
+        """Per-tool hits, misses, hit rate and seconds saved"""
+        with self._lock:
+            report = {}
+            for name, stats in self._stats.items():
+                calls = stats["hits"] + stats["misses"]
+                report[name] = {
+                    "hits": stats["hits"],
+                    "misses": stats["misses"],
+                    "hit_rate": stats["hits"] / calls if calls else 0.0,
+                    "time_saved": stats["time_saved"],
+                }
+            return report
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> ToolCache:
+    """Process-wide tool cache shared by every session"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ToolCache()
+        return _cache
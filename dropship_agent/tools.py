@@ -0,0 +1,172 @@
+from datetime import date
+from agents import function_tool
+from catalog import get_catalog, parse_price_range
+from copy_templates import render_product_copy
+from market_data import get_market_data
+from profit_engine import SUPPLIERS, calculate_profits, table_rows
+from seasonal import get_seasonal_index
+from tool_cache import tool_error
+
+# Dropshipping Agent Tools
+@function_tool(failure_error_function=tool_error)
+def get_trending_products(category: str = "all", price_range: str = "0-50") -> str:
+    """Get trending dropshipping products from multiple sources with profit analysis"""
+    min_price, max_price = parse_price_range(price_range)
+    products = get_catalog().query(category=category, min_price=min_price, max_price=max_price, k=8)
+    
+    result = f"🔥 TRENDING PRODUCTS ANALYSIS - {category.upper()}\n"
+    result += f"💵 Price Range: {price_range}\n\n"
+    if not products:
+        result += "No trending products found in this price range. Try widening it.\n"
+    for i, product in enumerate(products, 1):
+        result += f"{i}. 📦 {product['name']}\n"
+        result += f"   💸 Cost: ${product['cost']:g} | 💰 Sell: ${product['sell']:g}\n"
+        result += f"   📈 Profit: {product['margin']:.0f}% | 🎯 Demand: {product['demand']}\n"
+        result += f"   ⚔️ Competition: {product['competition']}\n\n"
+    
+    return result
+
+@function_tool(failure_error_function=tool_error)
+def analyze_market_competition(product_name: str, niche: str, target_audience: str = "general") -> str:
+    """Deep market analysis for dropshipping products"""
+    analysis_data = get_market_data().analysis(product_name, niche, target_audience)
+    
+    result = f"🔍 DEEP MARKET ANALYSIS: {product_name.upper()}\n"
+    result += f"🎯 Niche: {niche} | Target: {target_audience}\n\n"
+    result += f"📊 Market Overview:\n"
+    result += f"   💰 Market Size: {analysis_data['market_size']}\n"
+    result += f"   📈 Growth Rate: {analysis_data['market_growth']}\n"
+    result += f"   🔥 Saturation: {analysis_data['saturation']}\n"
+    result += f"   ⚔️ Competition: {analysis_data['competition_level']}\n"
+    result += f"   ⭐ Opportunity: {analysis_data['opportunity_score']}\n\n"
+    result += f"💵 Pricing Intelligence:\n"
+    result += f"   📊 Average Price: {analysis_data['avg_price']}\n"
+    result += f"   📈 Price Range: {analysis_data['price_range']}\n\n"
+    result += f"🏆 Top Competitors:\n"
+    for i, comp in enumerate(analysis_data['top_players'], 1):
+        result += f"   {i}. {comp}\n"
+    result += f"\n📢 Best Marketing Channels:\n"
+    for platform in analysis_data['best_platforms']:
+        result += f"   • {platform}\n"
+    result += f"\n📅 Seasonal Pattern: {analysis_data['seasonal_trends']}\n"
+    if analysis_data['snapshot']:
+        result += f"🗂️ Market data as of {analysis_data['snapshot']}\n"
+    
+    return result
+
+@function_tool(failure_error_function=tool_error)
+def find_suppliers_and_calculate_profits(product_name: str, target_selling_price: float, monthly_volume: int = 100) -> str:
+    """Find best suppliers and calculate comprehensive profit margins"""
+    table = calculate_profits([product_name], [target_selling_price], [monthly_volume])
+    
+    result = f"🏭 SUPPLIER ANALYSIS & PROFIT CALCULATOR\n"
+    result += f"📦 Product: {product_name}\n"
+    result += f"💰 Target Price: ${target_selling_price}\n"
+    result += f"📊 Monthly Volume: {monthly_volume} units\n\n"
+    
+    for i, row in enumerate(table_rows(table), 1):
+        supplier = SUPPLIERS[row['supplier']]
+        result += f"🏪 {i}. {supplier['name']}\n"
+        result += f"   💸 Unit Cost: ${row['unit_cost']}\n"
+        result += f"   🚚 Shipping: ${row['shipping_cost']}\n"
+        result += f"   💰 Total Cost: ${row['total_cost']:.2f}\n"
+        result += f"   📊 Platform Fees: ${row['fees']:.2f}\n"
+        result += f"   💵 Net Profit: ${row['net_profit']:.2f} ({row['margin']:.1f}%)\n"
+        result += f"   📈 Monthly Profit: ${row['monthly_profit']:.2f}\n"
+        result += f"   ⭐ Rating: {supplier['rating']}\n"
+        result += f"   🔥 Reliability: {supplier['reliability']}\n"
+        result += f"   ⏱️ Processing: {supplier['processing_time']}\n"
+        result += f"   🚚 Delivery: {supplier['shipping_time']}\n\n"
+    
+    return result
+
+@function_tool(failure_error_function=tool_error)
+def create_marketing_strategy(product_name: str, budget: float, target_audience: str, niche: str) -> str:
+    """Generate comprehensive marketing strategy with budget allocation"""
+    allocation = {
+        "Facebook & Instagram Ads": 0.35,
+        "TikTok Influencer Marketing": 0.25,
+        "Google Shopping Ads": 0.15,
+        "Email Marketing & Automation": 0.10,
+        "Content Creation & UGC": 0.10,
+        "A/B Testing Tools": 0.05
+    }
+    
+    result = f"🎯 MARKETING STRATEGY: {product_name.upper()}\n"
+    result += f"🧩 Niche: {niche} | 🎯 Audience: {target_audience}\n"
+    result += f"💸 Total Budget: ${budget}\n\n"
+    
+    result += f"📊 Budget Allocation:\n"
+    for channel, percent in allocation.items():
+        amount = round(budget * percent, 2)
+        result += f"   • {channel}: ${amount} ({int(percent * 100)}%)\n"
+    
+    result += "\n🚀 Strategy Overview:\n"
+    result += f"1. 💡 *Creative Ads*: Design thumb-stopping visuals and videos showcasing product benefits.\n"
+    result += f"2. 📱 *Social Proof*: Use influencers and UGC to build trust quickly on TikTok and Instagram.\n"
+    result += f"3. 🧠 *Remarketing*: Leverage Facebook Pixel and Google Tag Manager to retarget visitors.\n"
+    result += f"4. 📧 *Email Flow*: Set up welcome series, abandoned cart, and upsell sequences using Klaviyo or Mailchimp.\n"
+    result += f"5. 📈 *Optimization*: Use remaining budget to run A/B tests on headlines, creatives, and CTAs weekly.\n\n"
+    
+    result += f"📌 *Goal*: Maximize ROAS (Return on Ad Spend) and build brand awareness in the {niche} niche.\n"
+    
+    return result
+
+@function_tool(failure_error_function=tool_error)
+def generate_product_copy(product_name: str, key_features: str, target_audience: str, price: float) -> str:
+    """Generate high-converting product descriptions and ad copy"""
+    return render_product_copy(product_name, key_features, target_audience, price)
+
+@function_tool(failure_error_function=tool_error)
+def seasonal_opportunity_finder(current_month: str | None = None, days_ahead: int = 45) -> str:
+    """Find seasonal dropshipping opportunities and trending products, plus holiday peaks in the next days_ahead days"""
+    index = get_seasonal_index()
+    today = date.today()
+    if not current_month:
+        current_month = today.strftime("%B")
+    # A window that ends before it starts has no peaks; say so as "next 0 days", not "next -5"
+    days_ahead = max(days_ahead, 0)
+
+    found = index.month(current_month)
+    if found is None:
+        return f"❓ Unknown month '{current_month}'. Use a month name like 'March' or its number (1-12)."
+    current_month, current_data = found
+    
+    result = f"📅 SEASONAL OPPORTUNITIES - {current_month.upper()}\n\n"
+    result += f"🔥 HOT TRENDING PRODUCTS:\n"
+    for i, trend in enumerate(current_data['trends'], 1):
+        result += f"   {i}. {trend}\n"
+    
+    result += f"\n🎯 HIGH-VALUE KEYWORDS:\n"
+    for keyword in current_data['keywords']:
+        result += f"   • {keyword}\n"
+    
+    result += f"\n📊 MARKET ANALYSIS:\n"
+    result += f"   📈 Peak Period: {current_data['peak_dates']}\n"
+    result += f"   ⚔️ Competition Level: {current_data['competition']}\n\n"
+    
+    # Look ahead from today, or from the start of the asked-for month's next occurrence
+    month_number = list(index.months).index(current_month) + 1
+    anchor = today
+    if month_number != today.month:
+        anchor = date(today.year + (month_number < today.month), month_number, 1)
+    peaks = index.upcoming(anchor, days_ahead)
+    result += f"⏳ PEAKS IN THE NEXT {days_ahead} DAYS"
+    result += f" FROM {anchor:%b %d}:\n".upper() if anchor != today else ":\n"
+    if not peaks:
+        result += "   No holiday peaks in this window.\n"
+    for peak in peaks:
+        opens = "open now" if peak['lead_days'] == 0 else f"opens in {peak['lead_days']} days"
+        launch = "now" if peak['launch_by'] <= anchor else f"by {peak['launch_by']:%b %d}"
+        result += f"   • {peak['name']} ({peak['start']:%b %d} - {peak['peak']:%b %d}): {opens}, "
+        result += f"start marketing {launch} | {', '.join(peak['trends'])} | ⚔️ {peak['competition']}\n"
+    result += "\n"
+    
+    result += f"💡 SUCCESS STRATEGY:\n"
+    result += f"   • Start marketing 3-4 weeks before peak\n"
+    result += f"   • Focus on gift-giving angles\n"
+    result += f"   • Create urgency with limited-time offers\n"
+    result += f"   • Use seasonal keywords in ads\n"
+    result += f"   • Prepare inventory for demand surge\n"
+    
+    return result
@@ -12,7 +12,8 @@ load_dotenv()
 #Reference: https://ai.google.dev/gemini-api/docs/openai
 external_client = AsyncOpenAI(
     api_key= os.environ.get("GEMINI_API_KEY"),
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+    # GEMINI_BASE_URL points the client elsewhere, e.g. at a local stub server
+    base_url=os.environ.get("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta/openai/"),
 )
 
 model = OpenAIChatCompletionsModel(